@@ -1058,4 +1058,319 @@ def shortest_path_bfs(graph, start, end):
     # No path found
     return None
 
- 
\ No newline at end of file
+# =============================================================================
+# 7. DYNAMIC PROGRAMMING
+# =============================================================================
+
+def edit_distance(s1, s2, max_distance=None):
+    """
+    Levenshtein edit distance (insertions, deletions, substitutions).
+    Time Complexity: O(n * m), or O(k * min(n, m)) in banded mode
+    Space Complexity: O(min(n, m))
+
+    Only two rows of the DP table are kept, and the shorter string is used
+    for the columns. With max_distance=k only cells within k of the diagonal
+    are computed (Ukkonen's band), which is much faster for similar strings.
+
+    Args:
+        s1: First string (or sequence)
+        s2: Second string (or sequence)
+        max_distance: Optional bound k; distances above it are not computed
+
+    Returns:
+        Edit distance, or max_distance + 1 if it exceeds max_distance
+    """
+    # Keep the shorter sequence as the row so the rows are as small as possible
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    n, m = len(s1), len(s2)
+
+    if max_distance is not None and n - m > max_distance:
+        return max_distance + 1
+    band = n if max_distance is None else max_distance
+    too_far = band + 1
+
+    previous = [j if j <= band else too_far for j in range(m + 1)]
+    current = [too_far] * (m + 1)
+
+    for i in range(1, n + 1):
+        lo = max(1, i - band)
+        hi = min(m, i + band)
+        current[lo - 1] = i if lo == 1 else too_far
+        row_min = current[lo - 1]
+        c1 = s1[i - 1]
+
+        for j in range(lo, hi + 1):
+            cost = 0 if c1 == s2[j - 1] else 1
+            best = previous[j - 1] + cost
+            if previous[j] + 1 < best:
+                best = previous[j] + 1
+            if current[j - 1] + 1 < best:
+                best = current[j - 1] + 1
+            current[j] = best if best < too_far else too_far
+            if best < row_min:
+                row_min = best
+        if hi < m:
+            current[hi + 1] = too_far
+
+        # Every path passes through this row, so the distance is at least row_min
+        if max_distance is not None and row_min > max_distance:
+            return too_far
+        previous, current = current, previous
+
+    result = previous[m]
+    if max_distance is not None and result > max_distance:
+        return too_far
+    return result
+
+def lcs_length(s1, s2):
+    """
+    Length of the longest common subsequence.
+    Time Complexity: O(n * m)
+    Space Complexity: O(min(n, m))
+
+    Args:
+        s1, s2: Strings (or sequences)
+
+    Returns:
+        Length of the longest common subsequence
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    return _lcs_row(s1, s2)[-1]
+
+def _lcs_row(s1, s2):
+    """Last row of the LCS length table for s1 (rows) against s2 (columns)"""
+    row = [0] * (len(s2) + 1)
+    for c1 in s1:
+        diagonal = 0
+        for j, c2 in enumerate(s2, 1):
+            above = row[j]
+            if c1 == c2:
+                row[j] = diagonal + 1
+            elif row[j - 1] > above:
+                row[j] = row[j - 1]
+            diagonal = above
+    return row
+
+def longest_common_subsequence(s1, s2):
+    """
+    Longest common subsequence using Hirschberg's linear-space algorithm.
+    Time Complexity: O(n * m)
+    Space Complexity: O(n + m)
+
+    Splits s1 in half, finds where an optimal path crosses the middle row by
+    running the length DP forwards on the top half and backwards on the
+    bottom half, then recurses on the two sub-problems. The full table is
+    never stored, so 10^5-length inputs need megabytes rather than gigabytes.
+
+    Args:
+        s1, s2: Strings or lists
+
+    Returns:
+        An LCS of the same type as s1 (string for strings, list otherwise)
+    """
+    parts = []
+    _hirschberg(s1, s2, parts)
+    if isinstance(s1, str):
+        return "".join(parts)
+    return parts
+
+def _hirschberg(s1, s2, out):
+    """Append an LCS of s1 and s2 to out"""
+    if not s1 or not s2:
+        return
+    if len(s1) == 1:
+        if s1[0] in s2:
+            out.append(s1[0])
+        return
+
+    mid = len(s1) // 2
+    top = _lcs_row(s1[:mid], s2)
+    bottom = _lcs_row(s1[mid:][::-1], s2[::-1])
+
+    # Split s2 where the top prefix score plus bottom suffix score is largest
+    m = len(s2)
+    split = max(range(m + 1), key=lambda j: top[j] + bottom[m - j])
+
+    _hirschberg(s1[:mid], s2[:split], out)
+    _hirschberg(s1[mid:], s2[split:], out)
+
+def knapsack_01(weights, values, capacity, return_items=False):
+    """
+    0/1 knapsack: each item can be taken at most once.
+    Time Complexity: O(n * W) with each item processed as one vectorized row update
+    Space Complexity: O(W), or O(n * W) bytes (a bool table) when return_items is True
+
+    The DP row best[c] (best value with capacity c) is updated for a whole
+    item at once with NumPy: best[w:] = max(best[w:], best[:-w] + v). The
+    right-hand side is evaluated before assignment, so each item is used at
+    most once.
+
+    Args:
+        weights: List of non-negative integer weights
+        values: List of item values
+        capacity: Integer knapsack capacity
+        return_items: Also reconstruct which items were chosen
+
+    Returns:
+        Best total value, or (value, chosen item indices) if return_items is True
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    best = np.zeros(capacity + 1, dtype=np.result_type(np.asarray(values), np.int64))
+    taken = np.zeros((len(weights), capacity + 1), dtype=bool) if return_items else None
+
+    for i, (w, v) in enumerate(zip(weights, values)):
+        if w > capacity:
+            continue
+        candidate = best[:capacity + 1 - w] + v
+        improved = candidate > best[w:]
+        best[w:] = np.where(improved, candidate, best[w:])
+        if taken is not None:
+            taken[i, w:] = improved
+
+    total = best[capacity].item()
+    if not return_items:
+        return total
+
+    chosen = []
+    c = capacity
+    for i in range(len(weights) - 1, -1, -1):
+        if taken[i, c]:
+            chosen.append(i)
+            c -= weights[i]
+    chosen.reverse()
+    return total, chosen
+
+def knapsack_unbounded(weights, values, capacity):
+    """
+    Unbounded knapsack: each item can be taken any number of times.
+    Time Complexity: O(n * W * log W) as O(n log W) vectorized row updates
+    Space Complexity: O(W)
+
+    An item of weight w that may be taken up to W // w times is equivalent
+    to 0/1 items carrying 1, 2, 4, ... copies of it (binary splitting), so
+    the vectorized 0/1 row update is reused for every power of two.
+
+    Args:
+        weights: List of positive integer weights
+        values: List of item values
+        capacity: Integer knapsack capacity
+
+    Returns:
+        Best total value
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    best = np.zeros(capacity + 1, dtype=np.result_type(np.asarray(values), np.int64))
+
+    for w, v in zip(weights, values):
+        if w <= 0:
+            raise ValueError("Unbounded knapsack needs positive weights")
+        copies = 1
+        while copies * w <= capacity:
+            cw, cv = copies * w, copies * v
+            np.maximum(best[cw:], best[:capacity + 1 - cw] + cv, out=best[cw:])
+            copies *= 2
+
+    return best[capacity].item()
+
+def longest_increasing_subsequence(arr):
+    """
+    Longest strictly increasing subsequence (patience sorting).
+    Time Complexity: O(n log n)
+    Space Complexity: O(n)
+
+    tails[k] holds the index of the smallest possible tail of an increasing
+    subsequence of length k + 1; each element binary-searches its slot.
+
+    Args:
+        arr: List of comparable elements
+
+    Returns:
+        One longest increasing subsequence as a list
+    """
+    from bisect import bisect_left
+
+    tail_values = []
+    tail_indices = []
+    parent = [-1] * len(arr)
+
+    for i, x in enumerate(arr):
+        k = bisect_left(tail_values, x)
+        if k == len(tail_values):
+            tail_values.append(x)
+            tail_indices.append(i)
+        else:
+            tail_values[k] = x
+            tail_indices[k] = i
+        parent[i] = tail_indices[k - 1] if k > 0 else -1
+
+    result = []
+    i = tail_indices[-1] if tail_indices else -1
+    while i != -1:
+        result.append(arr[i])
+        i = parent[i]
+    result.reverse()
+    return result
+
+# Example usage of dynamic programming algorithms
+def dynamic_programming_examples():
+    # Edit distance
+    a, b = "kitten", "sitting"
+    print(f"Edit distance between '{a}' and '{b}': {edit_distance(a, b)}")
+    print(f"Banded edit distance (max 2): {edit_distance(a, b, max_distance=2)}")
+
+    # Longest common subsequence
+    a, b = "ABCBDAB", "BDCABA"
+    print(f"LCS of '{a}' and '{b}': '{longest_common_subsequence(a, b)}' "
+          f"(length {lcs_length(a, b)})")
+
+    # Knapsack
+    weights = [1, 3, 4, 5]
+    values = [1, 4, 5, 7]
+    print(f"0/1 knapsack (capacity 7): {knapsack_01(weights, values, 7, return_items=True)}")
+    print(f"Unbounded knapsack (capacity 7): {knapsack_unbounded(weights, values, 7)}")
+
+    # Longest increasing subsequence
+    arr = [10, 9, 2, 5, 3, 7, 101, 18]
+    print(f"LIS of {arr}: {longest_increasing_subsequence(arr)}")
+
+def dynamic_programming_benchmarks():
+    """Time the DP kernels on inputs large enough to show their scaling"""
+    import random
+    import time
+
+    random.seed(0)
+
+    def timed(label, fn, *args, **kwargs):
+        start = time.perf_counter()
+        fn(*args, **kwargs)
+        print(f"{label}: {time.perf_counter() - start:.3f}s")
+
+    for n in (500, 2000):
+        s1 = "".join(random.choice("ACGT") for _ in range(n))
+        s2 = list(s1)
+        for _ in range(n // 50):
+            s2[random.randrange(n)] = random.choice("ACGT")
+        s2 = "".join(s2)
+        timed(f"edit_distance n={n}", edit_distance, s1, s2)
+        timed(f"edit_distance n={n}, band {n // 25}", edit_distance, s1, s2, max_distance=n // 25)
+        timed(f"longest_common_subsequence n={n}", longest_common_subsequence, s1, s2)
+
+    n, capacity = 1000, 100_000
+    weights = [random.randint(1, 1000) for _ in range(n)]
+    values = [random.randint(1, 1000) for _ in range(n)]
+    timed(f"knapsack_01 n={n} W={capacity}", knapsack_01, weights, values, capacity)
+    timed(f"knapsack_unbounded n={n} W={capacity}", knapsack_unbounded, weights, values, capacity)
+
+    arr = [random.random() for _ in range(1_000_000)]
+    timed("longest_increasing_subsequence n=1000000", longest_increasing_subsequence, arr)
+
+
+if __name__ == "__main__":
+    # `python -m app <command>`: see cli.py for the available commands
+    import sys
+    from cli import main
+    sys.exit(main())
@@ -0,0 +1,410 @@
+"""
+BENCHMARK HARNESS
+=================
+
+Scaling benchmarks for every algorithm in app.py.
+
+The harness:
+1. Discovers the functions in app.py and groups them by the numbered section
+   they live in (searching, sorting, strings, math, graphs, ...)
+2. Builds inputs for each function from its parameter names, at
+   geometrically growing sizes (16, 64, 256, ...)
+3. Times each size with time.perf_counter_ns, after a warmup, over several
+   repeats of an auto-calibrated number of calls
+4. Fits the empirical complexity exponent k in time ~ size^k by least
+   squares on the log-log curve
+5. Saves results as JSON and compares two runs, flagging regressions above
+   a threshold
+
+Usage:
+    python bench.py run --out baseline.json
+    python bench.py run --out current.json --filter sort
+    python bench.py compare baseline.json current.json --threshold 0.10
+"""
+
+import argparse
+import inspect
+import json
+import math
+import platform
+import random
+import re
+import signal
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+
+import app
+
+
+SECTION_PATTERN = re.compile(r"^# (\d+)\. ([A-Z][A-Z ]+)$")
+
+# Section titles in app.py -> short category names
+CATEGORIES = {
+    "SEARCHING ALGORITHMS": "search",
+    "SORTING ALGORITHMS": "sort",
+    "STRING MANIPULATION ALGORITHMS": "string",
+    "BASIC DATA STRUCTURE ALGORITHMS": "data_structure",
+    "NUMERIC AND MATHEMATICAL ALGORITHMS": "math",
+    "GRAPH ALGORITHMS": "graph",
+    "DYNAMIC PROGRAMMING": "dp",
+}
+
+DEFAULT_SIZES = tuple(4 ** k for k in range(2, 9))  # 16 .. 65536
+
+
+# =============================================================================
+# 1. DISCOVERY
+# =============================================================================
+
+def discover(module=app):
+    """
+    Find the benchmarkable functions of a module, grouped by section.
+
+    Sections are the numbered banner comments in the module source
+    ("# 2. SORTING ALGORITHMS"). Example runners (*_examples), benchmark
+    runners and helpers (docstring starting with "Helper") are skipped.
+
+    Returns:
+        List of (name, function, category) in source order
+    """
+    lines = inspect.getsource(module).splitlines()
+    sections = []
+    for lineno, line in enumerate(lines, 1):
+        match = SECTION_PATTERN.match(line.strip())
+        if match:
+            title = match.group(2).strip()
+            sections.append((lineno, CATEGORIES.get(title, title.lower().replace(" ", "_"))))
+
+    found = []
+    for name, fn in inspect.getmembers(module, inspect.isfunction):
+        if fn.__module__ != module.__name__ or name.startswith("_"):
+            continue
+        if name.endswith(("_examples", "_benchmarks")):
+            continue
+        if (fn.__doc__ or "").strip().startswith("Helper"):
+            continue
+        lineno = fn.__code__.co_firstlineno
+        category = None
+        for start, section in sections:
+            if start <= lineno:
+                category = section
+        found.append((lineno, name, fn, category))
+
+    return [(name, fn, category) for _, name, fn, category in sorted(found, key=lambda f: f[0])]
+
+
+# =============================================================================
+# 2. INPUT GENERATION
+# =============================================================================
+
+def _random_graph(n, rng, degree=4):
+    """Random directed graph in app.py adjacency-list form"""
+    return {v: [rng.randrange(n) for _ in range(degree)] for v in range(n)}
+
+
+def _balanced_brackets(n, rng):
+    """Balanced bracket expression of length ~n (worst case: all matched)"""
+    pairs = "()", "[]", "{}"
+    out, stack = [], []
+    while len(out) + len(stack) < n:
+        if stack and rng.random() < 0.5:
+            out.append(stack.pop())
+        else:
+            opening, closing = rng.choice(pairs)
+            out.append(opening)
+            stack.append(closing)
+    out.extend(reversed(stack))
+    return "".join(out)
+
+
+def _palindrome(n, rng):
+    half = "".join(rng.choice("abcdefgh") for _ in range(n // 2))
+    return half + half[::-1]
+
+
+# Each factory receives (size, rng, category, args built so far) and returns
+# the value for the parameter of that name.
+PARAM_FACTORIES = {
+    "arr": lambda n, rng, cat, ctx: (
+        sorted(rng.sample(range(n * 4), n)) if cat == "search"
+        else [rng.randrange(n * 4) for _ in range(n)]),
+    "target": lambda n, rng, cat, ctx: ctx["arr"][-1],
+    "left": lambda n, rng, cat, ctx: 0,
+    "right": lambda n, rng, cat, ctx: len(ctx["arr"]) - 1,
+    "s": lambda n, rng, cat, ctx: _palindrome(n, rng),
+    "s1": lambda n, rng, cat, ctx: "".join(rng.choice("ACGT") for _ in range(n)),
+    "s2": lambda n, rng, cat, ctx: "".join(rng.sample(ctx["s1"], len(ctx["s1"]))),
+    "strs": lambda n, rng, cat, ctx: ["prefix" * 4 + str(rng.random()) for _ in range(n)],
+    "text": lambda n, rng, cat, ctx: "".join(rng.choice("ab") for _ in range(n)),
+    "pattern": lambda n, rng, cat, ctx: "aab" * 3,
+    "expr": lambda n, rng, cat, ctx: _balanced_brackets(n, rng),
+    "n": lambda n, rng, cat, ctx: n,
+    "a": lambda n, rng, cat, ctx: rng.randrange(n, 2 * n) ** 8,
+    "b": lambda n, rng, cat, ctx: rng.randrange(n, 2 * n) ** 8,
+    "graph": lambda n, rng, cat, ctx: _random_graph(n, rng),
+    "start": lambda n, rng, cat, ctx: 0,
+    "end": lambda n, rng, cat, ctx: n - 1,
+    "weights": lambda n, rng, cat, ctx: [rng.randrange(1, 100) for _ in range(n)],
+    "values": lambda n, rng, cat, ctx: [rng.randrange(1, 100) for _ in range(n)],
+    "capacity": lambda n, rng, cat, ctx: 10 * n,
+}
+
+
+def build_inputs(fn, category, size, seed=0):
+    """
+    Build positional arguments for fn at a given size.
+
+    Only parameters without defaults are generated; parameter names are
+    looked up in PARAM_FACTORIES.
+
+    Returns:
+        Tuple of arguments
+
+    Raises:
+        KeyError: If a required parameter has no factory
+    """
+    rng = random.Random(seed)
+    ctx = {}
+    for name, param in inspect.signature(fn).parameters.items():
+        if param.default is not inspect.Parameter.empty:
+            continue
+        ctx[name] = PARAM_FACTORIES[name](size, rng, category, ctx)
+    return tuple(ctx.values())
+
+
+# =============================================================================
+# 3. TIMING AND FITTING
+# =============================================================================
+
+class BenchmarkTimeout(Exception):
+    """Raised inside a benchmarked call that ran past its deadline"""
+
+
+@contextmanager
+def deadline(seconds):
+    """
+    Interrupt the enclosed code after `seconds` (Unix main thread only).
+
+    Exponential algorithms such as fibonacci_recursive cannot be stopped by
+    checking the time after each call - one call at the next size would run
+    for hours - so an interval timer raises BenchmarkTimeout inside it.
+    Elsewhere this is a no-op.
+    """
+    if not hasattr(signal, "setitimer") or seconds is None:
+        yield
+        return
+
+    def expire(signum, frame):
+        raise BenchmarkTimeout()
+
+    try:
+        previous = signal.signal(signal.SIGALRM, expire)
+    except ValueError:  # Not the main thread
+        yield
+        return
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def time_call(fn, args, repeats=5, warmup=1, min_time_ns=1_000_000):
+    """
+    Time one call of fn(*args).
+    Uses perf_counter_ns. The number of calls per repeat is calibrated so
+    that each repeat lasts at least min_time_ns, which keeps the timer
+    resolution negligible for very fast functions.
+
+    Returns:
+        Tuple (median_ns, min_ns) per call
+    """
+    for _ in range(warmup):
+        fn(*args)
+
+    number = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            fn(*args)
+        elapsed = time.perf_counter_ns() - start
+        if elapsed >= min_time_ns or number >= 1 << 20:
+            break
+        number *= max(2, min(10, min_time_ns // max(elapsed, 1)))
+
+    samples = [elapsed / number]
+    for _ in range(repeats - 1):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            fn(*args)
+        samples.append((time.perf_counter_ns() - start) / number)
+
+    return statistics.median(samples), min(samples)
+
+
+def fit_exponent(sizes, times, floor_ns=5_000):
+    """
+    Least-squares slope of log(time) against log(size).
+
+    Points faster than floor_ns are dropped: they are dominated by call
+    overhead and would flatten the curve.
+
+    Returns:
+        Fitted exponent, or None with fewer than two usable points
+    """
+    points = [(math.log(s), math.log(t)) for s, t in zip(sizes, times) if t >= floor_ns]
+    if len(points) < 2:
+        return None
+    xs, ys = zip(*points)
+    return statistics.linear_regression(xs, ys).slope
+
+
+def benchmark_function(fn, category, sizes=DEFAULT_SIZES, budget_s=0.25,
+                       repeats=5, warmup=1):
+    """
+    Benchmark one function across sizes.
+
+    Larger sizes are skipped once a single call exceeds budget_s, so
+    quadratic and exponential algorithms stop early instead of running for
+    hours; a hard deadline of 20 * budget_s per size interrupts a single
+    call that would never finish. Recursion-limit failures end the sweep
+    the same way.
+
+    Returns:
+        Dict with sizes, median_ns, min_ns and the fitted exponent
+    """
+    result = {"category": category, "sizes": [], "median_ns": [], "min_ns": []}
+    for size in sizes:
+        args = build_inputs(fn, category, size)
+        try:
+            with deadline(20 * budget_s):
+                median_ns, min_ns = time_call(fn, args, repeats, warmup)
+        except RecursionError:
+            result["stopped"] = f"RecursionError at size {size}"
+            break
+        except BenchmarkTimeout:
+            result["stopped"] = f"deadline exceeded at size {size}"
+            break
+        result["sizes"].append(size)
+        result["median_ns"].append(median_ns)
+        result["min_ns"].append(min_ns)
+        if median_ns > budget_s * 1e9:
+            result["stopped"] = f"time budget exceeded at size {size}"
+            break
+
+    result["exponent"] = fit_exponent(result["sizes"], result["median_ns"])
+    return result
+
+
+def run(pattern=None, sizes=DEFAULT_SIZES, budget_s=0.25, repeats=5, verbose=True):
+    """
+    Benchmark every discovered function whose name or category matches pattern.
+
+    Returns:
+        JSON-serializable dict with run metadata and per-function results
+    """
+    results = {}
+    skipped = {}
+    for name, fn, category in discover():
+        if pattern and not re.search(pattern, name) and not re.search(pattern, category or ""):
+            continue
+        try:
+            build_inputs(fn, category, sizes[0])
+        except KeyError as missing:
+            skipped[name] = f"no input factory for parameter {missing}"
+            continue
+
+        results[name] = benchmark_function(fn, category, sizes, budget_s, repeats)
+        if verbose:
+            r = results[name]
+            exponent = "n/a" if r["exponent"] is None else f"{r['exponent']:.2f}"
+            last = f"{r['median_ns'][-1] / 1e6:.3f}ms @ {r['sizes'][-1]}" if r["sizes"] else "-"
+            print(f"{category or '-':>14}  {name:<32} k={exponent:>5}  {last}")
+
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeats": repeats,
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+# =============================================================================
+# 4. SAVING AND COMPARING RUNS
+# =============================================================================
+
+def save(report, path):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(old, new, threshold=0.10):
+    """
+    Compare two reports size by size.
+
+    Returns:
+        List of (name, size, old_ns, new_ns, ratio) for every point where the
+        new median is more than `threshold` slower than the old one
+    """
+    regressions = []
+    for name, new_result in new["results"].items():
+        old_result = old["results"].get(name)
+        if old_result is None:
+            continue
+        old_times = dict(zip(old_result["sizes"], old_result["median_ns"]))
+        for size, new_ns in zip(new_result["sizes"], new_result["median_ns"]):
+            old_ns = old_times.get(size)
+            if old_ns and new_ns > old_ns * (1 + threshold):
+                regressions.append((name, size, old_ns, new_ns, new_ns / old_ns))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the algorithms in app.py")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_cmd = sub.add_parser("run", help="run the benchmarks")
+    run_cmd.add_argument("--out", help="write results to this JSON file")
+    run_cmd.add_argument("--filter", help="regex on function name or category")
+    run_cmd.add_argument("--max-size", type=int, default=DEFAULT_SIZES[-1])
+    run_cmd.add_argument("--budget", type=float, default=0.25,
+                         help="stop growing a function's size once a call takes this many seconds")
+    run_cmd.add_argument("--repeats", type=int, default=5)
+
+    cmp_cmd = sub.add_parser("compare", help="compare two result files")
+    cmp_cmd.add_argument("old")
+    cmp_cmd.add_argument("new")
+    cmp_cmd.add_argument("--threshold", type=float, default=0.10,
+                         help="relative slowdown that counts as a regression")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        sizes = tuple(s for s in DEFAULT_SIZES if s <= args.max_size)
+        report = run(args.filter, sizes, args.budget, args.repeats)
+        if args.out:
+            save(report, args.out)
+        return 0
+
+    regressions = compare(load(args.old), load(args.new), args.threshold)
+    for name, size, old_ns, new_ns, ratio in regressions:
+        print(f"REGRESSION {name} @ {size}: {old_ns / 1e3:.1f}us -> {new_ns / 1e3:.1f}us ({ratio:.2f}x)")
+    if not regressions:
+        print(f"No regressions above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
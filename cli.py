@@ -0,0 +1,740 @@
+"""
+COMMAND-LINE RUNNER
+===================
+
+Runs the algorithms from app.py (and their fast counterparts in primes.py,
+csr_graph.py, graph_io.py and parallel_bfs.py) over real data:
+
+    python -m app sort -n numbers.txt > sorted.txt
+    python -m app search --target 42 --target 7 data.txt
+    python -m app grep -i error --workers 4 huge.log
+    python -m app bfs edges.txt --source 0 --target 99
+    python -m app primes --range 0 1000000000 --count --workers 8
+    cat values.txt | python -m app primes
+    python -m app bench run --filter sort
+
+Every command reads its input from files or stdin ('-') in chunks of
+--chunk-lines lines, so memory stays bounded for inputs of any size. Results
+go to stdout, one per line, so commands compose with shell pipelines;
+throughput statistics go to stderr (suppress them with --quiet).
+
+--backend auto uses NumPy when it is installed and falls back to plain
+Python (built-in sorted, sets, app.bfs, app.is_prime) otherwise.
+--workers N spreads independent chunks over N processes.
+"""
+
+import argparse
+import heapq
+import os
+import re
+import sys
+import tempfile
+import time
+from collections import deque
+from itertools import islice
+
+
+DEFAULT_CHUNK_LINES = 1 << 20
+
+
+# =============================================================================
+# 1. INPUT AND REPORTING
+# =============================================================================
+
+def numpy_or_none():
+    """The numpy module, or None if it is not installed"""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def resolve_backend(name):
+    """
+    Pick the implementation for a command.
+
+    Returns:
+        'numpy' or 'python'
+
+    Raises:
+        SystemExit: If 'numpy' was requested but is not installed
+    """
+    if name == "python":
+        return "python"
+    if numpy_or_none() is not None:
+        return "numpy"
+    if name == "numpy":
+        sys.exit("error: --backend numpy requested but NumPy is not installed")
+    return "python"
+
+
+def open_input(path):
+    """Open a text input, where '-' means stdin"""
+    if path == "-":
+        return sys.stdin
+    return open(path, encoding="utf-8", errors="replace")
+
+
+def iter_line_chunks(paths, chunk_lines=DEFAULT_CHUNK_LINES):
+    """
+    Read lines from several inputs as lists of at most chunk_lines lines.
+    Time Complexity: O(total input size)
+    Space Complexity: O(chunk_lines)
+
+    Args:
+        paths: File paths ('-' for stdin); an empty list means stdin
+        chunk_lines: Maximum lines per chunk
+
+    Yields:
+        Lists of lines with trailing newlines removed
+    """
+    for path in paths or ["-"]:
+        f = open_input(path)
+        try:
+            while True:
+                chunk = [line.rstrip("\r\n") for line in islice(f, chunk_lines)]
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            if f is not sys.stdin:
+                f.close()
+
+
+class Throughput:
+    """Counts items and bytes processed and reports rates on stderr"""
+
+    def __init__(self, label, quiet=False):
+        self.label = label
+        self.quiet = quiet
+        self.items = 0
+        self.bytes = 0
+        self.start = time.perf_counter()
+
+    def add(self, items, nbytes=0):
+        self.items += items
+        self.bytes += nbytes
+
+    def report(self, unit="items", extra=""):
+        if self.quiet:
+            return
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        line = (f"{self.label}: {self.items:,} {unit} in {elapsed:.3f}s "
+                f"({self.items / elapsed:,.0f} {unit}/s")
+        if self.bytes:
+            line += f", {self.bytes / elapsed / 2**20:,.1f} MB/s"
+        line += ")"
+        if extra:
+            line += f" {extra}"
+        print(line, file=sys.stderr)
+
+
+def chunk_bytes(lines):
+    """Approximate input size of a chunk, counting one newline per line"""
+    return sum(map(len, lines)) + len(lines)
+
+
+def map_chunks(fn, chunks, workers, initializer=None, initargs=()):
+    """
+    Apply fn to every chunk, in order, optionally in a process pool.
+
+    The pool's imap keeps results in input order while several chunks are
+    processed at once.
+    """
+    if workers <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        yield from map(fn, chunks)
+        return
+
+    from multiprocessing import Pool
+
+    with Pool(workers, initializer, initargs) as pool:
+        yield from pool.imap(fn, chunks)
+
+
+def write_lines(lines, out=None):
+    out = out or sys.stdout
+    out.write("\n".join(lines))
+    if lines:
+        out.write("\n")
+
+
+# =============================================================================
+# 2. SORT
+# =============================================================================
+
+def _numeric_key(line):
+    """Sort key for numeric mode; blank and non-numeric lines sort first"""
+    try:
+        return float(line)
+    except ValueError:
+        return float("-inf")
+
+
+def _sort_chunk(task):
+    """Helper: sort one chunk of lines (runs in worker processes)"""
+    lines, numeric, reverse, backend = task
+    if backend == "numpy" and numeric:
+        import numpy as np
+
+        keys = np.array([_numeric_key(line) for line in lines])
+        order = np.argsort(-keys if reverse else keys, kind="stable")
+        return [lines[i] for i in order]
+    return sorted(lines, key=_numeric_key if numeric else None, reverse=reverse)
+
+
+def cmd_sort(args):
+    """
+    External merge sort of input lines.
+    Time Complexity: O(n log n)
+    Space Complexity: O(chunk_lines) in memory, O(n) on disk for multi-chunk input
+
+    Each chunk is sorted in memory (in parallel with --workers); if there is
+    more than one chunk the sorted runs are spilled to temporary files and
+    combined with a streaming k-way merge.
+    """
+    backend = resolve_backend(args.backend)
+    meter = Throughput("sort", args.quiet)
+
+    def tasks():
+        for chunk in iter_line_chunks(args.files, args.chunk_lines):
+            meter.add(len(chunk), chunk_bytes(chunk))
+            yield chunk, args.numeric, args.reverse, backend
+
+    runs = []
+    first = None
+    with tempfile.TemporaryDirectory(prefix="app-sort-") as tmp:
+        for sorted_chunk in map_chunks(_sort_chunk, tasks(), args.workers):
+            if first is None:
+                first = sorted_chunk
+                continue
+            if not runs:
+                runs.append(_spill(first, tmp))
+            runs.append(_spill(sorted_chunk, tmp))
+
+        if not runs:
+            write_lines(first or [])
+        else:
+            files = [open(path, encoding="utf-8") for path in runs]
+            try:
+                streams = [(line.rstrip("\n") for line in f) for f in files]
+                key = _numeric_key if args.numeric else None
+                for line in heapq.merge(*streams, key=key, reverse=args.reverse):
+                    sys.stdout.write(line + "\n")
+            finally:
+                for f in files:
+                    f.close()
+
+    meter.report("lines", f"[{backend}, {max(len(runs), 1)} run(s)]")
+    return 0
+
+
+def _spill(lines, directory):
+    """Helper: write a sorted run to a temporary file and return its path"""
+    fd, path = tempfile.mkstemp(dir=directory, suffix=".run")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        write_lines(lines, f)
+    return path
+
+
+# =============================================================================
+# 3. SEARCH AND GREP
+# =============================================================================
+
+def _search_chunk(task):
+    """Helper: positions (within the chunk) of lines whose value is a target"""
+    lines, targets, backend = task
+    if backend == "numpy":
+        import numpy as np
+
+        values = np.array([_numeric_key(line) for line in lines])
+        hits = np.flatnonzero(np.isin(values, list(targets)))
+        return [(int(i), lines[i]) for i in hits]
+    return [(i, line) for i, line in enumerate(lines) if _numeric_key(line) in targets]
+
+
+def cmd_search(args):
+    """
+    Find the lines whose numeric value equals one of the targets.
+    Time Complexity: O(n + t) with hashing / np.isin
+    Space Complexity: O(chunk_lines + t)
+
+    Prints 'line_number<TAB>line' for every match (1-based line numbers
+    over the concatenated input), or just the number of matches with --count.
+    """
+    backend = resolve_backend(args.backend)
+    targets = frozenset(args.target)
+    meter = Throughput("search", args.quiet)
+    chunks = iter_line_chunks(args.files, args.chunk_lines)
+    sizes = []
+
+    def tasks():
+        for chunk in chunks:
+            sizes.append(len(chunk))
+            meter.add(len(chunk), chunk_bytes(chunk))
+            yield chunk, targets, backend
+
+    found = 0
+    offset = 0
+    for index, matches in enumerate(map_chunks(_search_chunk, tasks(), args.workers)):
+        found += len(matches)
+        if not args.count:
+            write_lines([f"{offset + i + 1}\t{line}" for i, line in matches])
+        offset += sizes[index]
+
+    if args.count:
+        print(found)
+    meter.report("lines", f"[{backend}, {found:,} match(es)]")
+    return 0 if found else 1
+
+
+# Compiled matcher, set once per process by _init_grep
+_matcher = None
+
+
+def _init_grep(pattern, regex, ignore_case, invert):
+    """Helper: build the line predicate in each worker process"""
+    global _matcher
+    if regex:
+        compiled = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+        test = lambda line: compiled.search(line) is not None
+    elif ignore_case:
+        folded = pattern.casefold()
+        test = lambda line: folded in line.casefold()
+    else:
+        # str.__contains__ uses CPython's two-way/Horspool search, far ahead
+        # of the O(n * m) scan in app.string_pattern_search
+        test = lambda line: pattern in line
+    _matcher = (lambda line: not test(line)) if invert else test
+
+
+def _grep_chunk(lines):
+    """Helper: (index, line) for every matching line in a chunk"""
+    match = _matcher
+    return [(i, line) for i, line in enumerate(lines) if match(line)]
+
+
+def cmd_grep(args):
+    """
+    Print the input lines containing a pattern.
+    Time Complexity: O(n) expected for fixed strings
+    Space Complexity: O(chunk_lines)
+    """
+    meter = Throughput("grep", args.quiet)
+    sizes = []
+
+    def tasks():
+        for chunk in iter_line_chunks(args.files, args.chunk_lines):
+            sizes.append(len(chunk))
+            meter.add(len(chunk), chunk_bytes(chunk))
+            yield chunk
+
+    found = 0
+    offset = 0
+    initargs = (args.pattern, args.regex, args.ignore_case, args.invert)
+    for index, matches in enumerate(map_chunks(_grep_chunk, tasks(), args.workers,
+                                               _init_grep, initargs)):
+        found += len(matches)
+        if not args.count:
+            if args.line_number:
+                write_lines([f"{offset + i + 1}:{line}" for i, line in matches])
+            else:
+                write_lines([line for _, line in matches])
+        offset += sizes[index]
+
+    if args.count:
+        print(found)
+    meter.report("lines", f"[{found:,} match(es)]")
+    return 0 if found else 1
+
+
+# =============================================================================
+# 4. BFS
+# =============================================================================
+
+def _parse_vertex(text):
+    try:
+        return int(text)
+    except ValueError:
+        sys.exit(f"error: vertex ids must be integers, got {text!r}")
+
+
+def _read_adjacency(path, undirected):
+    """Helper: edge list -> app.py adjacency dictionary (pure-Python backend)"""
+    graph = {}
+    for chunk in iter_line_chunks([path]):
+        for line in chunk:
+            fields = line.split("#", 1)[0].split()
+            if len(fields) < 2:
+                continue
+            u, v = int(fields[0]), int(fields[1])
+            graph.setdefault(u, []).append(v)
+            graph.setdefault(v, [])
+            if undirected:
+                graph[v].append(u)
+    return graph
+
+
+def _hop_distances(graph, source):
+    """Helper: {vertex: hops} from source over an adjacency dictionary, in BFS order"""
+    dist = {source: 0}
+    queue = deque([source])
+    while queue:
+        vertex = queue.popleft()
+        for neighbor in graph.get(vertex, ()):
+            if neighbor not in dist:
+                dist[neighbor] = dist[vertex] + 1
+                queue.append(neighbor)
+    return dist
+
+
+def _python_distance_stats(dist, num_vertices):
+    """Helper: distance_stats (csr_graph.py) for a {vertex: hops} dictionary"""
+    reachable, total = len(dist), sum(dist.values())
+    eccentricity = max(dist.values())
+    if total == 0 or num_vertices <= 1:
+        return eccentricity, 0.0, reachable
+    return eccentricity, ((reachable - 1) / total) * ((reachable - 1) / (num_vertices - 1)), reachable
+
+
+def cmd_bfs(args):
+    """
+    Hop distances from one or more sources over an edge-list graph.
+
+    With --target, prints the shortest path. With a single source, prints
+    'vertex<TAB>distance' for every reachable vertex (or summary statistics
+    with --stats). With several sources, prints eccentricity, closeness and
+    reachable count per source, computing the sources in parallel. Both
+    backends print the same lines, and both exit with an error for a source
+    that is not a vertex of the graph.
+    Throughput is reported in traversed edges per second (TEPS).
+    """
+    backend = resolve_backend(args.backend)
+    sources = [_parse_vertex(s) for s in args.source]
+    if not sources and not (args.stats and args.target is None):
+        sources = [0]
+    meter = Throughput("bfs", args.quiet)
+
+    if backend == "python":
+        import app
+
+        graph = _read_adjacency(args.graph, args.undirected)
+        num_edges = sum(map(len, graph.values()))
+        # Same vertex set as the CSR backend: ids 0..max, or the labels seen
+        vertices = sorted(graph) if args.relabel else range(max(graph, default=-1) + 1)
+        _check_sources(sources, set(vertices))
+        if args.target is not None:
+            path = app.shortest_path_bfs(graph, sources[0], _parse_vertex(args.target))
+            print(" ".join(map(str, path)) if path else "unreachable")
+            meter.add(num_edges)
+            meter.report("edges", f"[{backend}]")
+            return 0 if path else 1
+
+        if len(sources) == 1 and not args.stats:
+            dist = _hop_distances(graph, sources[0])
+            write_lines([f"{v}\t{d}" for v, d in sorted(dist.items())])
+            meter.add(num_edges)
+            meter.report("edges", f"[{backend}]")
+            return 0
+
+        print("source\teccentricity\tcloseness\treachable")
+        for source in sources or vertices:
+            eccentricity, closeness, reachable = _python_distance_stats(
+                _hop_distances(graph, source), len(vertices))
+            print(f"{source}\t{eccentricity}\t{closeness:.6f}\t{reachable}")
+            meter.add(num_edges)
+        meter.report("edges", f"[{backend}]")
+        return 0
+
+    from graph_io import CSRAdjacency
+
+    graph = _load_csr(args)
+    _check_sources(sources, graph)
+    meter.start = time.perf_counter()  # Exclude loading from the traversal rate
+    extra = f"[{backend}, {graph.num_vertices:,} vertices, {graph.num_edges:,} edges]"
+
+    if args.target is not None:
+        import app
+
+        path = app.shortest_path_bfs(CSRAdjacency(graph), sources[0], _parse_vertex(args.target))
+        print(" ".join(map(str, path)) if path else "unreachable")
+        meter.add(graph.num_edges)
+        meter.report("edges", extra)
+        return 0 if path else 1
+
+    if len(sources) == 1 and not args.stats:
+        from csr_graph import bfs_distances
+
+        import numpy as np
+
+        dist = bfs_distances(graph.offsets, graph.targets, graph.index_of(sources[0]))
+        reached = np.flatnonzero(dist >= 0)
+        labels = reached if graph.labels is None else np.asarray(graph.labels)[reached]
+        write_lines([f"{v}\t{d}" for v, d in zip(labels.tolist(), dist[reached].tolist())])
+        meter.add(graph.num_edges)
+        meter.report("edges", extra)
+        return 0
+
+    from parallel_bfs import hop_distance_stats
+
+    stats = hop_distance_stats(graph, sources or None, workers=args.workers)
+    print("source\teccentricity\tcloseness\treachable")
+    for source, s in stats.items():
+        print(f"{source}\t{s['eccentricity']}\t{s['closeness']:.6f}\t{s['reachable']}")
+    meter.add(graph.num_edges * len(stats))
+    meter.report("edges", extra)
+    return 0
+
+
+def _check_sources(sources, vertices):
+    """
+    Helper: exit with a CLI error if a source is not a vertex of the graph
+
+    Raises:
+        SystemExit: Naming the first unknown source
+    """
+    for source in sources:
+        if source not in vertices:
+            sys.exit(f"error: source {source} is not a vertex of the graph")
+
+
+def _load_csr(args):
+    """Helper: load the CSR graph, spooling stdin to a temporary file"""
+    from graph_io import load_graph
+
+    options = {"undirected": args.undirected, "relabel": args.relabel}
+    if args.graph != "-":
+        return load_graph(args.graph, cache_path=False if args.no_cache else None, **options)
+
+    with tempfile.NamedTemporaryFile("w", suffix=".edges", delete=False) as f:
+        for chunk in iter_line_chunks(["-"]):
+            write_lines(chunk, f)
+    try:
+        return load_graph(f.name, cache_path=False, **options)
+    finally:
+        os.unlink(f.name)
+
+
+# =============================================================================
+# 5. PRIMES
+# =============================================================================
+
+def _prime_range_task(task):
+    """Helper: primes (or their count) in one sub-range"""
+    lo, hi, count_only = task
+    import primes
+
+    if count_only:
+        return primes.count_primes(lo, hi)
+    return primes.primes_in_range(lo, hi)
+
+
+def _prime_filter_task(task):
+    """Helper: the lines of a chunk that hold prime integers"""
+    lines, backend = task
+    values = []
+    for line in lines:
+        line = line.strip()
+        if line and line.lstrip("-").isdigit():
+            values.append(int(line))
+
+    if backend == "numpy":
+        import numpy as np
+        import primes
+
+        # Negatives are never prime, and below -2**63 they do not fit int64
+        small = [v for v in values if 0 <= v < 2**63]
+        flags = primes.is_prime_many(np.array(small, dtype=np.int64)) if small else []
+        result = [v for v, ok in zip(small, flags) if ok]
+        result += [v for v in values if v >= 2**63 and primes.is_prime(v)]
+        return result
+
+    import app
+    return [v for v in values if app.is_prime(v)]
+
+
+def cmd_primes(args):
+    """
+    Either enumerate the primes in --range LO HI or filter the primes from input.
+
+    Ranges are split into blocks that are sieved independently (in parallel
+    with --workers) and emitted in order.
+    """
+    backend = resolve_backend(args.backend)
+    meter = Throughput("primes", args.quiet)
+
+    if args.range is not None:
+        lo, hi = args.range
+        if backend == "python":
+            import app
+
+            found = [n for n in range(lo, hi) if app.is_prime(n)]
+            print(len(found)) if args.count else write_lines(list(map(str, found)))
+            meter.add(hi - lo)
+            meter.report("numbers", f"[{backend}, {len(found):,} primes]")
+            return 0
+
+        block = max(args.block, 1)
+        tasks = ((start, min(start + block, hi), args.count)
+                 for start in range(lo, hi, block))
+        total = 0
+        for result in map_chunks(_prime_range_task, tasks, args.workers):
+            if args.count:
+                total += result
+            else:
+                total += len(result)
+                write_lines([str(p) for p in result.tolist()])
+        if args.count:
+            print(total)
+        meter.add(hi - lo)
+        meter.report("numbers", f"[{backend}, {total:,} primes]")
+        return 0
+
+    total = 0
+
+    def tasks():
+        for chunk in iter_line_chunks(args.files, args.chunk_lines):
+            meter.add(len(chunk), chunk_bytes(chunk))
+            yield chunk, backend
+
+    for found in map_chunks(_prime_filter_task, tasks(), args.workers):
+        total += len(found)
+        if not args.count:
+            write_lines([str(p) for p in found])
+    if args.count:
+        print(total)
+    meter.report("lines", f"[{backend}, {total:,} primes]")
+    return 0
+
+
+# =============================================================================
+# 6. ENTRY POINT
+# =============================================================================
+
+def build_parser():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--workers", type=int, default=1,
+                        help="worker processes for parallel paths (default: 1)")
+    common.add_argument("--chunk-lines", type=int, default=DEFAULT_CHUNK_LINES,
+                        help="lines read per chunk")
+    common.add_argument("--backend", choices=("auto", "numpy", "python"), default="auto")
+    common.add_argument("-q", "--quiet", action="store_true",
+                        help="do not print throughput statistics")
+
+    parser = argparse.ArgumentParser(prog="python -m app",
+                                     description="Run the algorithms in app.py over files or stdin")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("sort", parents=[common], help="sort lines (external merge sort)")
+    p.add_argument("files", nargs="*")
+    p.add_argument("-n", "--numeric", action="store_true", help="compare lines as numbers")
+    p.add_argument("-r", "--reverse", action="store_true")
+    p.set_defaults(handler=cmd_sort)
+
+    p = sub.add_parser("search", parents=[common], help="find lines equal to numeric targets")
+    p.add_argument("files", nargs="*")
+    p.add_argument("-t", "--target", type=float, action="append", required=True,
+                   help="value to find (repeatable)")
+    p.add_argument("-c", "--count", action="store_true", help="only print the number of matches")
+    p.set_defaults(handler=cmd_search)
+
+    p = sub.add_parser("grep", parents=[common], help="print lines containing a pattern")
+    p.add_argument("pattern")
+    p.add_argument("files", nargs="*")
+    p.add_argument("-E", "--regex", action="store_true", help="pattern is a regular expression")
+    p.add_argument("-i", "--ignore-case", action="store_true")
+    p.add_argument("-v", "--invert", action="store_true", help="print non-matching lines")
+    p.add_argument("-n", "--line-number", action="store_true")
+    p.add_argument("-c", "--count", action="store_true")
+    p.set_defaults(handler=cmd_grep)
+
+    p = sub.add_parser("bfs", parents=[common], help="breadth-first search over an edge list")
+    p.add_argument("graph", help="edge-list file ('u v' per line), or '-' for stdin")
+    p.add_argument("-s", "--source", action="append", default=[],
+                   help="source vertex (repeatable; default with --stats: every vertex)")
+    p.add_argument("-t", "--target", help="print the shortest path from the first source")
+    p.add_argument("--stats", action="store_true",
+                   help="print eccentricity/closeness per source instead of distances")
+    p.add_argument("--undirected", action="store_true")
+    p.add_argument("--relabel", action="store_true", help="vertex ids are sparse labels")
+    p.add_argument("--no-cache", action="store_true", help="do not read or write the .csr cache")
+    p.set_defaults(handler=cmd_bfs)
+
+    p = sub.add_parser("primes", parents=[common],
+                       help="primes in a range, or the prime values among input lines")
+    p.add_argument("files", nargs="*")
+    p.add_argument("--range", type=int, nargs=2, metavar=("LO", "HI"),
+                   help="enumerate the primes in [LO, HI) instead of reading input")
+    p.add_argument("-c", "--count", action="store_true", help="only print how many primes")
+    p.add_argument("--block", type=int, default=1 << 24, help="range block per task")
+    p.set_defaults(handler=cmd_primes)
+
+    sub.add_parser("bench", add_help=False, help="scaling benchmarks (see bench.py)")
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["bench"]:
+        import bench
+        return bench.main(argv[1:])
+
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except BrokenPipeError:
+        # Downstream closed the pipe (e.g. `| head`); exit quietly
+        sys.stderr.close()
+        return 0
+
+
+
+# =============================================================================
+# 7. EXAMPLES
+# =============================================================================
+
+def _run_captured(argv):
+    """Helper: stdout of main(argv) as a list of lines"""
+    import io
+    from contextlib import redirect_stdout
+
+    out = io.StringIO()
+    with redirect_stdout(out):
+        main(argv + ["--quiet"])
+    return out.getvalue().splitlines()
+
+
+def cli_examples():
+    """
+    Run bfs over a small path graph with every backend, toggling
+    --undirected between runs that share the .csr cache, and check that
+    each run matches a fresh parse (--no-cache) and the other backends.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "path.edges")
+        with open(path, "w") as f:
+            f.write("0 1\n1 2\n2 3\n")
+
+        backends = ["python"] + (["numpy"] if numpy_or_none() else [])
+        expected = {
+            (): ["3\t0"],
+            ("--undirected",): ["0\t3", "1\t2", "2\t1", "3\t0"],
+        }
+        for options in [(), ("--undirected",), ()]:
+            for backend in backends:
+                argv = ["bfs", path, "-s", "3", "--backend", backend, *options]
+                cached, fresh = _run_captured(argv), _run_captured(argv + ["--no-cache"])
+                print(f"bfs -s 3 {' '.join(options) or '(directed)'} [{backend}]: {cached}")
+                if cached != fresh or cached != expected[options]:
+                    raise AssertionError(f"{argv}: got {cached}, expected {expected[options]}")
+
+            stats = {backend: _run_captured(["bfs", path, "--stats", "--backend", backend, *options])
+                     for backend in backends}
+            if len({tuple(lines) for lines in stats.values()}) != 1:
+                raise AssertionError(f"--stats differs between backends: {stats}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
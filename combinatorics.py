@@ -0,0 +1,356 @@
+"""
+FACTORIALS AND BINOMIALS
+========================
+
+Big-number factorials and binomial coefficients, exact and modulo a prime.
+
+app.factorial multiplies 2..n one at a time: the running product keeps
+growing, so every step multiplies a huge number by a small one and the
+total cost is quadratic in the number of digits. This module provides:
+
+1. Product-tree (binary splitting) multiplication, which keeps both operands
+   of each multiplication roughly the same size so Python's Karatsuba
+   multiplication does the heavy lifting
+2. Luschny's prime-swing factorial, built on the product tree
+3. FactorialTable: precomputed factorial / inverse-factorial arrays modulo a
+   prime p for O(1) n! mod p and nCr mod p, with vectorized batch queries
+   and Lucas' theorem for n >= p
+"""
+
+import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+from primes import small_primes
+
+
+# Below this many factors a plain loop beats further splitting
+_LEAF_SIZE = 16
+
+
+# =============================================================================
+# 1. EXACT FACTORIALS
+# =============================================================================
+
+def product_range(lo, hi):
+    """
+    Product lo * (lo + 1) * ... * (hi - 1) by binary splitting.
+    Time Complexity: O(M(d) log n), where d is the digit count of the result
+    Space Complexity: O(d) plus O(log n) recursion depth
+
+    Args:
+        lo: First factor (inclusive)
+        hi: Last factor (exclusive)
+
+    Returns:
+        The product, or 1 for an empty range
+    """
+    if hi - lo <= _LEAF_SIZE:
+        result = 1
+        for i in range(lo, hi):
+            result *= i
+        return result
+    mid = (lo + hi) // 2
+    return product_range(lo, mid) * product_range(mid, hi)
+
+
+def product_tree(values):
+    """
+    Product of a sequence of integers by pairwise (balanced) multiplication.
+    Time Complexity: O(M(d) log n)
+    Space Complexity: O(d)
+
+    Args:
+        values: Iterable of integers
+
+    Returns:
+        The product, or 1 for an empty sequence
+    """
+    values = [int(v) for v in values]
+    if not values:
+        return 1
+    while len(values) > 1:
+        paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+        if len(values) % 2:
+            paired.append(values[-1])
+        values = paired
+    return values[0]
+
+
+def factorial(n):
+    """
+    Calculate n! with a product tree.
+    Time Complexity: O(M(d) log n), where d ~ n log n is the digit count
+    Space Complexity: O(d)
+
+    Args:
+        n: Non-negative integer
+
+    Returns:
+        Factorial of n
+    """
+    if n < 0:
+        raise ValueError("Factorial not defined for negative numbers")
+    return product_range(2, n + 1)
+
+
+def _prime_swing(n):
+    """
+    Swinging factorial n! / (floor(n/2)!)^2 as a product of prime powers.
+
+    The exponent of a prime p is the number of odd terms in
+    floor(n/p), floor(n/p^2), ..., which is computed for all primes at once.
+    """
+    primes = small_primes(n)
+    if len(primes) == 0:
+        return 1
+
+    exponents = np.zeros(len(primes), dtype=np.int64)
+    q = n // primes
+    while q.any():
+        exponents += q & 1
+        q //= primes
+
+    # p**e <= n always, so the powers fit comfortably in int64
+    powers = primes[exponents > 0] ** exponents[exponents > 0]
+    return product_tree(powers.tolist())
+
+
+def factorial_prime_swing(n):
+    """
+    Calculate n! with Luschny's prime-swing algorithm.
+    Time Complexity: O(M(d) log n), with fewer and better-balanced
+                     multiplications than factorial()
+    Space Complexity: O(d)
+
+    Uses n! = (floor(n/2)!)^2 * swing(n), recursing on n/2.
+
+    Args:
+        n: Non-negative integer
+
+    Returns:
+        Factorial of n
+    """
+    if n < 0:
+        raise ValueError("Factorial not defined for negative numbers")
+    if n < 2:
+        return 1
+    half = factorial_prime_swing(n // 2)
+    return half * half * _prime_swing(n)
+
+
+def binomial(n, k):
+    """
+    Exact binomial coefficient C(n, k).
+    Time Complexity: O(M(d) log k)
+    Space Complexity: O(d)
+
+    Args:
+        n: Non-negative integer
+        k: Integer
+
+    Returns:
+        C(n, k), or 0 when k < 0 or k > n
+    """
+    if n < 0:
+        raise ValueError("Binomial not defined for negative n")
+    if k < 0 or k > n:
+        return 0
+    k = min(k, n - k)
+    return product_range(n - k + 1, n + 1) // factorial(k)
+
+
+# =============================================================================
+# 2. MODULAR FACTORIAL TABLES
+# =============================================================================
+
+class FactorialTable:
+    """
+    Factorials and inverse factorials modulo a prime, for repeated queries.
+
+    Building the table costs O(limit); every later factorial, inverse or
+    binomial query is O(1), and batch queries are vectorized with NumPy.
+    """
+
+    def __init__(self, p, limit=None):
+        """
+        Args:
+            p: Prime modulus (below 2**32 for the vectorized batch path)
+            limit: Largest n to tabulate (default: p - 1, capped at 10**7)
+
+        Raises:
+            ValueError: If p < 2
+        """
+        if p < 2:
+            raise ValueError("Modulus must be a prime >= 2")
+        self.p = p
+        if limit is None:
+            limit = min(p - 1, 10**7)
+        self.limit = min(limit, p - 1)
+
+        size = self.limit + 1
+        fact = [1] * size
+        for i in range(1, size):
+            fact[i] = fact[i - 1] * i % p
+
+        inv_fact = [1] * size
+        inv_fact[-1] = pow(fact[-1], p - 2, p)
+        for i in range(size - 1, 0, -1):
+            inv_fact[i - 1] = inv_fact[i] * i % p
+
+        dtype = np.uint64 if p < 2**32 else object
+        self.fact = np.array(fact, dtype=dtype)
+        self.inv_fact = np.array(inv_fact, dtype=dtype)
+
+    def _check(self, n):
+        if n < 0:
+            raise ValueError("Factorial not defined for negative numbers")
+        if n > self.limit and n < self.p:
+            raise ValueError(f"n = {n} exceeds the table limit {self.limit}")
+
+    def factorial(self, n):
+        """
+        n! mod p.
+        Time Complexity: O(1)
+
+        n! contains the factor p for every n >= p, so those are all 0.
+        """
+        self._check(n)
+        if n >= self.p:
+            return 0
+        return int(self.fact[n])
+
+    def inverse_factorial(self, n):
+        """Modular inverse of n! mod p - O(1), n < p"""
+        self._check(n)
+        if n >= self.p:
+            raise ZeroDivisionError(f"{n}! is divisible by p = {self.p}")
+        return int(self.inv_fact[n])
+
+    def inverse(self, n):
+        """Modular inverse of n mod p for 1 <= n <= limit - O(1)"""
+        if not 1 <= n <= self.limit:
+            raise ValueError(f"n = {n} outside 1..{self.limit}")
+        return int(self.fact[n - 1]) * int(self.inv_fact[n]) % self.p
+
+    def binomial(self, n, k):
+        """
+        C(n, k) mod p.
+        Time Complexity: O(1) for n <= limit, O(log_p n) via Lucas' theorem otherwise
+
+        Args:
+            n: Non-negative integer
+            k: Integer
+
+        Returns:
+            C(n, k) mod p (0 when k < 0 or k > n)
+        """
+        if k < 0 or k > n:
+            return 0
+        if n <= self.limit:
+            p = self.p
+            return int(self.fact[n]) * int(self.inv_fact[k]) % p * int(self.inv_fact[n - k]) % p
+
+        # Lucas: C(n, k) = prod C(n_i, k_i) over the base-p digits of n and k
+        result = 1
+        while n or k:
+            n, n_i = divmod(n, self.p)
+            k, k_i = divmod(k, self.p)
+            if k_i > n_i:
+                return 0
+            if n_i > self.limit:
+                raise ValueError(f"Lucas digit {n_i} exceeds the table limit {self.limit}")
+            result = result * self.binomial(n_i, k_i) % self.p
+        return result
+
+    def binomial_many(self, ns, ks):
+        """
+        Vectorized C(n, k) mod p for arrays of queries with n <= limit.
+        Time Complexity: O(len(ns))
+        Space Complexity: O(len(ns))
+
+        Args:
+            ns, ks: Integer arrays of the same shape
+
+        Returns:
+            uint64 array (object array when p >= 2**32)
+        """
+        ns = np.asarray(ns, dtype=np.int64)
+        ks = np.asarray(ks, dtype=np.int64)
+        if ns.size and (ns.min() < 0 or ns.max() > self.limit):
+            raise ValueError(f"All n must lie in 0..{self.limit}")
+
+        valid = (ks >= 0) & (ks <= ns)
+        k = np.where(valid, ks, 0)
+        n_minus_k = np.where(valid, ns - ks, 0)
+
+        if self.fact.dtype == object:
+            p = self.p
+        else:
+            # Factors are < p < 2**32, so each product fits in 64 bits
+            p = np.uint64(self.p)
+        result = self.fact[ns] * self.inv_fact[k] % p * self.inv_fact[n_minus_k] % p
+        return np.where(valid, result, 0)
+
+
+def binomial_many(ns, ks, mod=None):
+    """
+    Batch binomial coefficients.
+    Time Complexity: O(len(ns) + max(ns)) with a prime modulus,
+                     one exact binomial per query otherwise
+    Space Complexity: O(max(ns)) for the table
+
+    Args:
+        ns, ks: Sequences of integers of the same length
+        mod: Optional prime modulus
+
+    Returns:
+        Array of C(n, k) mod `mod`, or a list of exact Python ints
+    """
+    if mod is None:
+        return [binomial(int(n), int(k)) for n, k in zip(ns, ks)]
+    ns = np.asarray(ns, dtype=np.int64)
+    limit = int(ns.max()) if ns.size else 0
+    return FactorialTable(mod, min(limit, mod - 1)).binomial_many(ns, ks)
+
+
+# Example usage of combinatorics
+def combinatorics_examples():
+    print(f"20! = {factorial(20)}")
+    print(f"20! (prime swing) = {factorial_prime_swing(20)}")
+    print(f"Bits in 100000!: {factorial(100000).bit_length()}")
+    print(f"C(50, 25) = {binomial(50, 25)}")
+
+    p = 10**9 + 7
+    table = FactorialTable(p, limit=10**6)
+    print(f"1000000! mod p = {table.factorial(10**6)}")
+    print(f"C(10**6, 5 * 10**5) mod p = {table.binomial(10**6, 5 * 10**5)}")
+    print(f"Batch C(n, 2) mod p for n = 0..9: {table.binomial_many(range(10), [2] * 10).tolist()}")
+
+    small = FactorialTable(13)
+    print(f"C(10**18, 10**9) mod 13 via Lucas = {small.binomial(10**18, 10**9)}")
+
+
+def benchmark_combinatorics(sizes=(10**4, 10**5)):
+    """Compare app.factorial with the product-tree and prime-swing versions"""
+    import time
+    import app
+
+    for n in sizes:
+        row = [f"n={n:>7,}"]
+        for name, fn in (("app.factorial", app.factorial),
+                         ("product tree", factorial),
+                         ("prime swing", factorial_prime_swing)):
+            start = time.perf_counter()
+            fn(n)
+            row.append(f"{name} {time.perf_counter() - start:.3f}s")
+        print("  ".join(row))
+
+    rng = np.random.default_rng(0)
+    ns = rng.integers(0, 10**6, 10**6)
+    ks = rng.integers(0, 10**6, 10**6)
+    start = time.perf_counter()
+    binomial_many(ns, ks, 10**9 + 7)
+    print(f"10**6 binomials mod 10**9+7 (incl. table build): {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    combinatorics_examples()
@@ -0,0 +1,291 @@
+"""
+CSR GRAPH REPRESENTATION
+========================
+
+Compressed Sparse Row (CSR) storage for large, read-only graphs.
+
+The graph functions in app.py take a dictionary adjacency list, which is
+convenient for small examples but costs a Python object per vertex and per
+edge. A CSR graph stores the same information in flat NumPy arrays:
+
+    offsets[v] .. offsets[v + 1]   slice of `targets` holding v's neighbors
+    targets                        concatenated neighbor ids
+    weights                        optional edge weights, aligned with targets
+
+Vertices are the integers 0..n-1. Arbitrary vertex labels (strings, etc.) are
+kept in `labels` so results can be mapped back to the caller's names.
+"""
+
+import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+
+# =============================================================================
+# 1. CSR GRAPH CONTAINER
+# =============================================================================
+
+class CSRGraph:
+    """Directed graph in Compressed Sparse Row form"""
+
+    def __init__(self, offsets, targets, weights=None, labels=None):
+        """
+        Args:
+            offsets: Integer array of length n + 1, non-decreasing, offsets[0] == 0
+            targets: Integer array of length offsets[-1] with neighbor ids
+            weights: Optional array of edge weights aligned with targets
+            labels: Optional sequence of n vertex labels (defaults to 0..n-1);
+                    an ndarray of labels must be sorted
+        """
+        self.offsets = np.asanyarray(offsets)
+        self.targets = np.asanyarray(targets)
+        self.weights = None if weights is None else np.asanyarray(weights)
+
+        if self.offsets.ndim != 1 or len(self.offsets) == 0:
+            raise ValueError("offsets must be a non-empty 1-D array")
+        if int(self.offsets[-1]) != len(self.targets):
+            raise ValueError("offsets[-1] must equal the number of targets")
+        if self.weights is not None and len(self.weights) != len(self.targets):
+            raise ValueError("weights must be aligned with targets")
+
+        self.labels = labels
+        self._index = None
+
+    @property
+    def num_vertices(self):
+        """Number of vertices in the graph"""
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        """Number of directed edges in the graph"""
+        return len(self.targets)
+
+    def neighbors(self, v):
+        """Return the neighbor ids of vertex id v as an array view - O(1)"""
+        return self.targets[self.offsets[v]:self.offsets[v + 1]]
+
+    def degree(self, v):
+        """Return the out-degree of vertex id v - O(1)"""
+        return int(self.offsets[v + 1] - self.offsets[v])
+
+    def label_of(self, v):
+        """Map a vertex id back to its label"""
+        if self.labels is None:
+            return int(v)
+        if isinstance(self.labels, np.ndarray):
+            return self.labels[v].item()
+        return self.labels[v]
+
+    def index_of(self, label):
+        """
+        Map a vertex label to its integer id.
+        Time Complexity: O(1) after an O(n) index build on first use
+
+        Raises:
+            KeyError: If the label is not a vertex of the graph
+        """
+        if self.labels is None:
+            v = int(label)
+            if not 0 <= v < self.num_vertices:
+                raise KeyError(label)
+            return v
+
+        if isinstance(self.labels, np.ndarray):
+            # Sorted integer labels (e.g. from graph_io relabeling): binary search
+            # instead of materializing a dict with one entry per vertex
+            v = int(np.searchsorted(self.labels, label))
+            if v == self.num_vertices or self.labels[v] != label:
+                raise KeyError(label)
+            return v
+
+        if self._index is None:
+            self._index = {lab: i for i, lab in enumerate(self.labels)}
+        return self._index[label]
+
+    def __contains__(self, label):
+        try:
+            self.index_of(label)
+        except (KeyError, TypeError, ValueError):
+            return False
+        return True
+
+    def __len__(self):
+        return self.num_vertices
+
+    def __repr__(self):
+        return f"CSRGraph(vertices={self.num_vertices}, edges={self.num_edges})"
+
+    @classmethod
+    def from_adjacency(cls, graph):
+        """
+        Build a CSR graph from an app.py-style adjacency dictionary.
+        Time Complexity: O(V + E)
+        Space Complexity: O(V + E)
+
+        Vertices that only appear as neighbors are added with no out-edges.
+        Vertex ids follow dictionary insertion order.
+
+        Args:
+            graph: Dictionary mapping each vertex to an iterable of neighbors
+
+        Returns:
+            CSRGraph with labels set to the original vertex names
+        """
+        labels = list(graph)
+        index = {lab: i for i, lab in enumerate(labels)}
+        for neighbors in graph.values():
+            for nb in neighbors:
+                if nb not in index:
+                    index[nb] = len(labels)
+                    labels.append(nb)
+
+        n = len(labels)
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        flat = []
+        for i, lab in enumerate(labels):
+            neighbors = graph.get(lab, ())
+            flat.extend(index[nb] for nb in neighbors)
+            offsets[i + 1] = len(flat)
+
+        targets = np.asarray(flat, dtype=index_dtype(n))
+        result = cls(offsets, targets, labels=labels)
+        result._index = index
+        return result
+
+    def to_adjacency(self):
+        """
+        Convert back to an adjacency dictionary keyed by vertex label.
+        Time Complexity: O(V + E)
+        """
+        adjacency = {}
+        for v in range(self.num_vertices):
+            adjacency[self.label_of(v)] = [self.label_of(t) for t in self.neighbors(v)]
+        return adjacency
+
+
+def index_dtype(num_vertices):
+    """Smallest signed integer dtype that can hold vertex ids (int32 or int64)"""
+    return np.int32 if num_vertices < 2**31 else np.int64
+
+
+# =============================================================================
+# 2. LEVEL-SYNCHRONOUS BFS KERNEL
+# =============================================================================
+
+def expand_frontier(offsets, targets, frontier):
+    """
+    Gather all neighbors of the vertices in `frontier` in one vectorized step.
+    Time Complexity: O(sum of frontier degrees)
+
+    Args:
+        offsets, targets: CSR arrays
+        frontier: Integer array of vertex ids
+
+    Returns:
+        Array of neighbor ids (may contain duplicates)
+    """
+    starts = offsets[frontier]
+    counts = offsets[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return targets[:0]
+
+    # For each frontier vertex, emit starts[i], starts[i] + 1, ... starts[i] + counts[i] - 1
+    # without a Python loop: a running index shifted back at every segment boundary.
+    nonempty = counts > 0
+    starts = starts[nonempty]
+    counts = counts[nonempty]
+    segment_begin = np.cumsum(counts) - counts
+    idx = np.arange(total, dtype=np.int64) - np.repeat(segment_begin - starts, counts)
+    return targets[idx]
+
+
+def bfs_distances(offsets, targets, source, out=None):
+    """
+    Hop distances from a single source over CSR arrays.
+    Time Complexity: O(V + E)
+    Space Complexity: O(V)
+
+    Each BFS level is expanded with NumPy operations instead of popping one
+    vertex at a time from a Python queue.
+
+    Args:
+        offsets, targets: CSR arrays
+        source: Source vertex id
+        out: Optional int32 array of length n to reuse as the result buffer
+
+    Returns:
+        int32 array where entry v is the hop distance to v, or -1 if unreachable
+    """
+    n = len(offsets) - 1
+    if out is None:
+        dist = np.full(n, -1, dtype=np.int32)
+    else:
+        dist = out
+        dist.fill(-1)
+
+    dist[source] = 0
+    frontier = np.array([source], dtype=np.int64)
+    level = 0
+
+    while len(frontier):
+        level += 1
+        candidates = expand_frontier(offsets, targets, frontier)
+        candidates = candidates[dist[candidates] < 0]
+        if len(candidates) == 0:
+            break
+        frontier = np.unique(candidates).astype(np.int64, copy=False)
+        dist[frontier] = level
+
+    return dist
+
+
+def distance_stats(dist):
+    """
+    Summarize a hop-distance array from bfs_distances.
+
+    Closeness uses the Wasserman-Faust form, which stays meaningful for
+    disconnected graphs: (r - 1) / sum(d) scaled by (r - 1) / (n - 1),
+    where r is the number of vertices reachable from the source.
+
+    Returns:
+        Tuple (eccentricity, closeness, reachable)
+    """
+    reached = dist[dist >= 0]
+    reachable = len(reached)
+    total = int(reached.sum(dtype=np.int64))
+    eccentricity = int(reached.max()) if reachable else 0
+
+    n = len(dist)
+    if total == 0 or n <= 1:
+        closeness = 0.0
+    else:
+        closeness = ((reachable - 1) / total) * ((reachable - 1) / (n - 1))
+
+    return eccentricity, closeness, reachable
+
+
+# Example usage of the CSR representation
+def csr_examples():
+    graph = {
+        'A': ['B', 'C'],
+        'B': ['A', 'D', 'E'],
+        'C': ['A', 'F'],
+        'D': ['B'],
+        'E': ['B', 'F'],
+        'F': ['C', 'E']
+    }
+
+    csr = CSRGraph.from_adjacency(graph)
+    print(f"CSR graph: {csr}")
+    print(f"Offsets: {csr.offsets.tolist()}")
+    print(f"Targets: {csr.targets.tolist()}")
+
+    dist = bfs_distances(csr.offsets, csr.targets, csr.index_of('A'))
+    print(f"Hop distances from 'A': {dict(zip(csr.labels, dist.tolist()))}")
+
+    ecc, closeness, reachable = distance_stats(dist)
+    print(f"Eccentricity of 'A': {ecc}, closeness: {closeness:.3f}, reachable: {reachable}")
+
+
+if __name__ == "__main__":
+    csr_examples()
@@ -0,0 +1,5 @@
+"""Dictionary tutorial; modules load on first attribute access"""
+
+from datatypes import SUBPACKAGES, lazy_modules
+
+__getattr__, __dir__ = lazy_modules(__name__, SUBPACKAGES["Dictionary"])
@@ -0,0 +1,477 @@
+"""
+Persistent Memory-Mapped Dictionary
+-----------------------------------
+
+The dicts in dictionary.py live only as long as the process: a service that
+needs a large lookup table rebuilds it from the source data on every start.
+DiskDict keeps a str/bytes -> str/bytes table in a file that is built once
+and then opened with mmap, so opening costs the same at 1K or 100M entries
+and lookups read straight from the mapped pages (the OS page cache is
+shared by every process that maps the file):
+
+1. build(): writes the immutable base file from any iterator of (key, value)
+   pairs in one streaming pass; only 16 bytes per entry are held in memory
+2. The base file is an open-addressing hash table (linear probing) over a
+   record region. Each slot keeps the key's 64-bit hash, so a probe only
+   compares key bytes when the hashes agree
+3. Updates (set, delete, update) are appended to a delta log next to the
+   base file and kept in a dict in memory; on open the log is replayed
+4. compact() merges the delta into a new base file and empties the log.
+   It runs on its own once the log passes compact_bytes (1 MiB by default,
+   whatever the base size), so replaying the log on open stays a small,
+   fixed cost
+5. Both files are replaced or appended, never rewritten in place: a crash
+   leaves the old base, and a torn record at the end of the log is dropped
+
+Keys hash with BLAKE2b (Python's hash() of str/bytes changes per process).
+Files:  <path>        header | records | index slots
+        <path>.delta  op | key length | value length | key | value, repeated
+"""
+
+import os
+import struct
+
+
+MAGIC = b"DTDICT01"
+HEADER_SIZE = 64
+
+_HEADER = struct.Struct("<8sQQQ")  # magic, entries, slots, index offset
+_RECORD = struct.Struct("<II")     # key length, value length
+_SLOT = struct.Struct("<QQ")       # key hash, record offset (0 = free)
+_DELTA = struct.Struct("<BII")     # op, key length, value length
+
+DEFAULT_COMPACT_BYTES = 1 << 20  # Delta log size that triggers compact()
+
+_PUT, _DELETE = 1, 0
+_MISSING = object()
+
+
+def _hasher():
+    """Stable 64-bit hash of a bytes key"""
+    from hashlib import blake2b
+
+    def key_hash(key):
+        return int.from_bytes(blake2b(key, digest_size=8).digest(), "little")
+
+    return key_hash
+
+
+def _table_size(entries, max_load):
+    return 1 << max(4, (int(entries / max_load) - 1).bit_length())
+
+
+def _encoder(encoding):
+    def encode(item):
+        if isinstance(item, str):
+            return item.encode(encoding or "utf-8")
+        if isinstance(item, (bytes, bytearray, memoryview)):
+            return bytes(item)
+        raise TypeError(f"keys and values must be str or bytes, not {type(item).__name__}")
+
+    return encode
+
+
+# -----------------------------------------------------
+# 1. BULK BUILDER
+# -----------------------------------------------------
+
+def build(path, items, encoding="utf-8", max_load=0.7):
+    """
+    Write an immutable base file from an iterator of (key, value) pairs.
+    Time Complexity: O(n) expected
+    Space Complexity: O(n) - 16 bytes per pair for the hashes and offsets
+
+    Args:
+        path: File to create (replaced atomically if it exists)
+        items: Iterable of (key, value) pairs, str or bytes; for a repeated
+            key the last value wins
+        encoding: Encoding of str keys and values
+        max_load: Load factor of the index
+
+    Returns:
+        Number of distinct keys written
+    """
+    import mmap
+    from array import array
+
+    if not 0 < max_load < 1:
+        raise ValueError(f"max_load must be in (0, 1), got {max_load}")
+    encode, key_hash = _encoder(encoding), _hasher()
+    hashes, offsets = array("Q"), array("Q")
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "w+b") as f:
+            f.write(bytes(HEADER_SIZE))
+            position = HEADER_SIZE
+            for key, value in items:
+                key, value = encode(key), encode(value)
+                f.write(_RECORD.pack(len(key), len(value)))
+                f.write(key)
+                f.write(value)
+                hashes.append(key_hash(key))
+                offsets.append(position)
+                position += _RECORD.size + len(key) + len(value)
+            index_offset = -(-position // 8) * 8
+            slots = _table_size(len(hashes), max_load)
+            f.truncate(index_offset + slots * _SLOT.size)
+            f.flush()
+            with mmap.mmap(f.fileno(), 0) as mm:
+                entries = _fill_index(mm, index_offset, slots, hashes, offsets)
+                _HEADER.pack_into(mm, 0, MAGIC, entries, slots, index_offset)
+                mm.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return entries
+
+
+def _record_key(mm, offset):
+    key_length, _ = _RECORD.unpack_from(mm, offset)
+    start = offset + _RECORD.size
+    return mm[start:start + key_length]
+
+
+def _fill_index(mm, index_offset, slots, hashes, offsets):
+    """Place every record in the index; a later record with the same key replaces the earlier one"""
+    mask, entries = slots - 1, 0
+    for key_hash, offset in zip(hashes, offsets):
+        slot = key_hash & mask
+        while True:
+            at = index_offset + slot * _SLOT.size
+            stored_hash, stored = _SLOT.unpack_from(mm, at)
+            if not stored:
+                entries += 1
+                break
+            if stored_hash == key_hash and _record_key(mm, stored) == _record_key(mm, offset):
+                break
+            slot = (slot + 1) & mask
+        _SLOT.pack_into(mm, at, key_hash, offset)
+    return entries
+
+
+# -----------------------------------------------------
+# 2. MAPPED BASE + DELTA LOG
+# -----------------------------------------------------
+
+class DiskDict:
+    """
+    Dictionary backed by a memory-mapped base file and an append-only delta log.
+
+    Reads check the in-memory delta first, then probe the mapped base.
+    Writes append to <path>.delta; compact() folds them into a new base.
+    """
+
+    def __init__(self, path, encoding="utf-8", readonly=False,
+                 compact_bytes=DEFAULT_COMPACT_BYTES):
+        """
+        Args:
+            path: Base file; an empty one is created if missing (unless readonly)
+            encoding: Encoding of str keys and values; None returns bytes
+            readonly: Never write; updates raise PermissionError
+            compact_bytes: Delta log size that triggers compact(). It caps
+                the replay work of the next open; each compaction rewrites
+                the whole base file
+        """
+        self.path = path
+        self.delta_path = f"{path}.delta"
+        self.encoding = encoding
+        self.readonly = readonly
+        self.compact_bytes = compact_bytes
+        self._encode = _encoder(encoding)
+        self._key_hash = _hasher()
+        self._mm = self._file = self._log = None
+        if not os.path.exists(path):
+            if readonly:
+                raise FileNotFoundError(path)
+            build(path, ())
+        self._map_base()
+        self._delta = {}  # encoded key -> encoded value, None once deleted
+        self._length = self._entries
+        self._delta_size = self._replay()
+        if not readonly:
+            self._log = open(self.delta_path, "ab")
+
+    def _map_base(self):
+        import mmap
+
+        self._file = open(self.path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._entries, self._slots, self._index_offset = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a DiskDict base file")
+
+    def _replay(self):
+        """Apply the delta log; returns its size without any torn tail"""
+        if not os.path.exists(self.delta_path):
+            return 0
+        with open(self.delta_path, "rb") as f:
+            log = f.read()
+        position = 0
+        while position + _DELTA.size <= len(log):
+            op, key_length, value_length = _DELTA.unpack_from(log, position)
+            end = position + _DELTA.size + key_length + value_length
+            if end > len(log):
+                break
+            key = log[position + _DELTA.size:position + _DELTA.size + key_length]
+            self._apply(key, log[end - value_length:end] if op == _PUT else None)
+            position = end
+        if position < len(log) and not self.readonly:
+            # An interrupted append: drop the partial record
+            with open(self.delta_path, "r+b") as f:
+                f.truncate(position)
+        return position
+
+    def _apply(self, key, value):
+        was_present = self._find(key) is not None
+        self._delta[key] = value
+        self._length += (value is not None) - was_present
+
+    # -- lookups ------------------------------------------------------
+
+    def _base_find(self, key):
+        """Offset of the key's value in the base file, or None"""
+        mm, key_hash = self._mm, self._key_hash(key)
+        mask = self._slots - 1
+        slot = key_hash & mask
+        while True:
+            stored_hash, offset = _SLOT.unpack_from(mm, self._index_offset + slot * _SLOT.size)
+            if not offset:
+                return None
+            if stored_hash == key_hash:
+                key_length, value_length = _RECORD.unpack_from(mm, offset)
+                start = offset + _RECORD.size
+                if key_length == len(key) and mm[start:start + key_length] == key:
+                    return start + key_length, value_length
+            slot = (slot + 1) & mask
+
+    def _find(self, key):
+        """Encoded value of an encoded key, or None"""
+        value = self._delta.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        location = self._base_find(key)
+        if location is None:
+            return None
+        start, length = location
+        return self._mm[start:start + length]
+
+    def _decode(self, data):
+        return data.decode(self.encoding) if self.encoding else data
+
+    def __getitem__(self, key):
+        """
+        Time Complexity: O(1) expected - one or two page reads when cold
+        """
+        value = self._find(self._encode(key))
+        if value is None:
+            raise KeyError(key)
+        return self._decode(value)
+
+    def get(self, key, default=None):
+        value = self._find(self._encode(key))
+        return default if value is None else self._decode(value)
+
+    def __contains__(self, key):
+        return self._find(self._encode(key)) is not None
+
+    def __len__(self):
+        return self._length
+
+    def _base_items(self):
+        """Encoded (key, value) pairs of the base file, in file order"""
+        mm, index = self._mm, self._index_offset
+        offsets = sorted(
+            offset for _, offset in _SLOT.iter_unpack(mm[index:index + self._slots * _SLOT.size])
+            if offset
+        )
+        for offset in offsets:
+            key_length, value_length = _RECORD.unpack_from(mm, offset)
+            start = offset + _RECORD.size
+            yield mm[start:start + key_length], mm[start + key_length:start + key_length + value_length]
+
+    def _items(self):
+        for key, value in self._base_items():
+            if key not in self._delta:
+                yield key, value
+        for key, value in self._delta.items():
+            if value is not None:
+                yield key, value
+
+    def items(self):
+        """(key, value) pairs: base entries in file order, then newer ones"""
+        for key, value in self._items():
+            yield self._decode(key), self._decode(value)
+
+    def keys(self):
+        for key, _ in self._items():
+            yield self._decode(key)
+
+    def __iter__(self):
+        return self.keys()
+
+    # -- updates ------------------------------------------------------
+
+    def _append(self, records):
+        if self.readonly:
+            raise PermissionError(f"{self.path} is open read-only")
+        chunk = bytearray()
+        for key, value in records:
+            if value is None:
+                chunk += _DELTA.pack(_DELETE, len(key), 0) + key
+            else:
+                chunk += _DELTA.pack(_PUT, len(key), len(value)) + key + value
+            self._apply(key, value)
+        self._log.write(chunk)
+        self._delta_size += len(chunk)
+        if self._delta_size > self.compact_bytes:
+            self.compact()
+
+    def __setitem__(self, key, value):
+        self._append([(self._encode(key), self._encode(value))])
+
+    def __delitem__(self, key):
+        encoded = self._encode(key)
+        if self._find(encoded) is None:
+            raise KeyError(key)
+        self._append([(encoded, None)])
+
+    def update(self, items):
+        """Append many (key, value) pairs in one write"""
+        if hasattr(items, "items"):
+            items = items.items()
+        self._append([(self._encode(key), self._encode(value)) for key, value in items])
+
+    def flush(self, sync=False):
+        """Push buffered delta records to the OS (and to disk if sync)"""
+        if self._log is not None:
+            self._log.flush()
+            if sync:
+                os.fsync(self._log.fileno())
+
+    def compact(self):
+        """
+        Rewrite the base file with the delta folded in and empty the log.
+        Time Complexity: O(n)
+
+        The new base replaces the old one atomically before the log is
+        truncated; if the process dies in between, replaying the log over
+        the new base gives the same contents.
+        """
+        if self.readonly:
+            raise PermissionError(f"{self.path} is open read-only")
+        self.flush()
+        build(self.path, self._items(), encoding=self.encoding)
+        self._mm.close()
+        self._file.close()
+        self._map_base()
+        self._log.truncate(0)
+        self._log.seek(0)
+        self._delta.clear()
+        self._delta_size = 0
+        self._length = self._entries
+
+    def stats(self):
+        """Entry counts and file sizes"""
+        return {
+            "entries": len(self),
+            "base_entries": self._entries,
+            "delta_entries": len(self._delta),
+            "base_bytes": len(self._mm),
+            "delta_bytes": self._delta_size,
+            "slots": self._slots,
+            "load_factor": self._entries / self._slots,
+        }
+
+    def close(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        return f"DiskDict({self.path!r}, {len(self):,} entries, {len(self._delta):,} in delta)"
+
+
+# -----------------------------------------------------
+# 3. EXAMPLES AND BENCHMARK
+# -----------------------------------------------------
+
+def diskdict_examples():
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "capitals.dd")
+        count = build(path, [("France", "Paris"), ("Japan", "Tokyo"), ("Peru", "Lima")])
+        print(f"Built {count} entries")
+
+        with DiskDict(path) as capitals:
+            print(f"{capitals}: Japan -> {capitals['Japan']}")
+            capitals["Kenya"] = "Nairobi"
+            del capitals["Peru"]
+            print(f"After updates: {sorted(capitals.items())}")
+
+        with DiskDict(path, readonly=True) as capitals:
+            print(f"Reopened: {capitals}, stats: {capitals.stats()}")
+
+        with DiskDict(path) as capitals:
+            capitals.compact()
+            print(f"Compacted: {capitals}, 'Peru' in capitals: {'Peru' in capitals}")
+
+
+def benchmark_diskdict(sizes=(10**4, 10**5, 10**6, 10**7), lookups=100_000):
+    """
+    Build time, cold-open time and lookup rate of DiskDict against the
+    usual restart path of unpickling a dict. The open time of DiskDict
+    stays flat with size; pickle.load grows with it.
+    """
+    import pickle
+    import random
+    import tempfile
+    import time
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        print(f"  {label:<32} {time.perf_counter() - start:10.4f}s")
+        return result
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        for n in sizes:
+            print(f"n = {n:,}")
+            path = os.path.join(directory, f"bench-{n}.dd")
+            pairs = ((f"key:{i}", f"value:{i * 7}") for i in range(n))
+            timed("build", lambda: build(path, pairs))
+            store = timed("DiskDict open (cold)", lambda: DiskDict(path, readonly=True))
+            probe = [f"key:{rng.randrange(n)}" for _ in range(lookups)]
+            timed(f"DiskDict lookups ({lookups:,})", lambda: [store[key] for key in probe])
+            store.close()
+
+            pickled = os.path.join(directory, f"bench-{n}.pickle")
+            with open(pickled, "wb") as f:
+                pickle.dump({f"key:{i}": f"value:{i * 7}" for i in range(n)}, f)
+            with open(pickled, "rb") as f:
+                table = timed("pickle.load of a dict", lambda: pickle.load(f))
+            timed(f"dict lookups ({lookups:,})", lambda: [table[key] for key in probe])
+            del table
+            os.remove(pickled)
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    diskdict_examples()
@@ -0,0 +1,69 @@
+"""
+PYTHON DATA TYPES
+=================
+
+Guided tours of Python's built-in data types with their time complexities.
+
+Importing the package, or any module in it, has no side effects: each
+tutorial's walkthrough lives in its main() function and the exercise
+modules expose exerciseN_problem/exerciseN_solution pairs. Run them with
+
+    python -m datatypes run arrays.array
+    python -m datatypes run list.exercises 3 5
+    python -m datatypes.sets.sets
+
+Subpackages and their modules are imported lazily on first attribute access
+through a module-level __getattr__ (PEP 562), so `import datatypes` only
+loads this file, and NumPy is only imported by the examples that use it.
+"""
+
+import importlib
+
+
+# Subpackage -> modules it contains
+SUBPACKAGES = {
+    "arrays": ("array", "exercises", "matrix"),
+    "Dictionary": ("dictionary", "diskdict", "hashmap"),
+    "dequee": ("dequee",),
+    "Linked_List": ("linkedlist",),
+    "list": ("columnar", "compehensions", "dedupe", "exercises", "kway_merge", "list",
+             "pair_sums", "pipeline", "selection", "sparse", "views", "windowed"),
+    "sets": ("roaring", "sets"),
+    "string": ("string",),
+    "tuples": ("tuples",),
+}
+
+
+def lazy_modules(package, names):
+    """
+    Build module-level __getattr__ and __dir__ that import submodules on demand.
+
+    Args:
+        package: __name__ of the package being made lazy
+        names: Submodule names to expose
+
+    Returns:
+        Tuple (__getattr__, __dir__) to assign at package level
+    """
+    names = tuple(names)
+
+    def __getattr__(name):
+        if name in names:
+            # import_module also binds the submodule on the package, so this
+            # hook runs at most once per name
+            return importlib.import_module(f"{package}.{name}")
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(vars(importlib.import_module(package))) | set(names))
+
+    return __getattr__, __dir__
+
+
+def demo_modules():
+    """Dotted names (relative to this package) of every runnable module"""
+    return [f"{sub}.{name}" for sub, names in SUBPACKAGES.items() for name in names]
+
+
+__getattr__, __dir__ = lazy_modules(__name__, SUBPACKAGES)
+__all__ = list(SUBPACKAGES)
@@ -0,0 +1,121 @@
+"""
+Command-line entry point for the data type tutorials.
+
+    python -m datatypes list                      # runnable modules
+    python -m datatypes run arrays.exercises 3    # run one module's demo
+    python -m datatypes importtime --budget-ms 50 # check import cost
+
+The importtime command imports every module in a fresh interpreter with
+`-X importtime` and fails if the total exceeds the budget or if any module
+pulls in a heavy dependency (NumPy) at import time. Modules that cannot work
+without NumPy (NUMPY_MODULES) import it at module level and are left out.
+"""
+
+import argparse
+import runpy
+import subprocess
+import sys
+
+from datatypes import demo_modules
+
+
+# Modules that must never be imported just by importing datatypes
+HEAVY_MODULES = ("numpy",)
+
+# NumPy-only modules, which import it at module level; the package's lazy
+# __getattr__ still keeps them off `import datatypes`
+NUMPY_MODULES = ("Dictionary.hashmap", "sets.roaring")
+
+# Default import-time budget for the whole package, in milliseconds
+IMPORT_BUDGET_MS = 50.0
+
+
+def parse_importtime(stderr):
+    """
+    Parse `python -X importtime` output.
+
+    Returns:
+        List of (module, depth, self_us, cumulative_us) in import order
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # Header line
+        raw = parts[2].rstrip()
+        depth = (len(raw) - len(raw.lstrip()) - 1) // 2
+        records.append((raw.strip(), depth, int(parts[0]), int(parts[1])))
+    return records
+
+
+def measure_import_time(modules=None):
+    """
+    Import the given modules in a fresh interpreter and time each one.
+
+    Args:
+        modules: Dotted names relative to datatypes (default: all of them
+                 except NUMPY_MODULES)
+
+    Returns:
+        Tuple (cumulative microseconds per top-level datatypes import,
+               set of every module name that was imported)
+    """
+    if modules is None:
+        modules = [name for name in demo_modules() if name not in NUMPY_MODULES]
+    statement = "; ".join(f"import datatypes.{name}" for name in modules)
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                          capture_output=True, text=True, check=True)
+    records = parse_importtime(proc.stderr)
+    timings = {name: cumulative for name, depth, _, cumulative in records
+               if depth == 0 and name.startswith("datatypes")}
+    return timings, {name for name, *_ in records}
+
+
+def check_import_time(budget_ms=IMPORT_BUDGET_MS):
+    """
+    Print the import cost of every module and check it against the budget.
+
+    Returns:
+        True if the total is within budget and no heavy module was imported
+    """
+    timings, imported = measure_import_time()
+    total_ms = sum(timings.values()) / 1000
+    for name, us in sorted(timings.items(), key=lambda item: -item[1]):
+        print(f"{us / 1000:8.2f} ms  {name}")
+    print(f"{total_ms:8.2f} ms  total (budget {budget_ms:.2f} ms)")
+
+    ok = total_ms <= budget_ms
+    if not ok:
+        print("FAIL: import time over budget")
+    for heavy in HEAVY_MODULES:
+        if heavy in imported:
+            print(f"FAIL: {heavy} imported at import time")
+            ok = False
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m datatypes",
+                                     description="Python data type tutorials")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="List runnable modules")
+    run = commands.add_parser("run", help="Run a module's demo")
+    run.add_argument("module", choices=demo_modules())
+    run.add_argument("args", nargs=argparse.REMAINDER, help="Arguments for the module")
+    timing = commands.add_parser("importtime", help="Check import time against a budget")
+    timing.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        print("\n".join(demo_modules()))
+    elif args.command == "run":
+        sys.argv = [f"datatypes.{args.module}"] + args.args
+        runpy.run_module(f"datatypes.{args.module}", run_name="__main__", alter_sys=True)
+    else:
+        sys.exit(0 if check_import_time(args.budget_ms) else 1)
+
+
+if __name__ == "__main__":
+    main()
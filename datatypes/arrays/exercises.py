@@ -7,17 +7,18 @@ Each exercise is designed to reinforce understanding of array operations and the
 """
 
 import array
-import numpy as np  # If NumPy is not installed, run: pip install numpy
 
 # -----------------------------------------------------
 # EXERCISE 1: Basic Array Operations
 # -----------------------------------------------------
-print("\n--- EXERCISE 1: Basic Array Operations ---")
-print("Problem: Create an array of integers from 1 to 10. Then:")
-print("1. Print the 3rd element")
-print("2. Print the last 3 elements")
-print("3. Double each element in the array")
-print("4. Calculate the sum and average of all elements")
+def exercise1_problem():
+    print("\n--- EXERCISE 1: Basic Array Operations ---")
+    print("Problem: Create an array of integers from 1 to 10. Then:")
+    print("1. Print the 3rd element")
+    print("2. Print the last 3 elements")
+    print("3. Double each element in the array")
+    print("4. Calculate the sum and average of all elements")
+
 
 # Solution to Exercise 1
 def exercise1_solution():
@@ -42,17 +43,17 @@ def exercise1_solution():
     array_avg = array_sum / len(int_array)
     print(f"Sum: {array_sum}, Average: {array_avg}")
 
-exercise1_solution()
-
 # -----------------------------------------------------
 # EXERCISE 2: Array Type Conversion
 # -----------------------------------------------------
-print("\n--- EXERCISE 2: Array Type Conversion ---")
-print("Problem: Perform the following conversions:")
-print("1. Create an integer array and convert it to a float array")
-print("2. Convert a list to an array and back to a list")
-print("3. Convert between signed and unsigned integer arrays")
-print("4. Create an array from a string of ASCII characters")
+def exercise2_problem():
+    print("\n--- EXERCISE 2: Array Type Conversion ---")
+    print("Problem: Perform the following conversions:")
+    print("1. Create an integer array and convert it to a float array")
+    print("2. Convert a list to an array and back to a list")
+    print("3. Convert between signed and unsigned integer arrays")
+    print("4. Create an array from a string of ASCII characters")
+
 
 # Solution to Exercise 2
 def exercise2_solution():
@@ -84,20 +85,22 @@ def exercise2_solution():
     print(f"ASCII array: {char_array}")
     print(f"Back to string: {''.join(chr(c) for c in char_array)}")
 
-exercise2_solution()
-
 # -----------------------------------------------------
 # EXERCISE 3: NumPy Array Creation
 # -----------------------------------------------------
-print("\n--- EXERCISE 3: NumPy Array Creation ---")
-print("Problem: Create NumPy arrays in the following ways:")
-print("1. Create a 1D array of evenly spaced values between 0 and 1 (5 values)")
-print("2. Create a 3x3 identity matrix")
-print("3. Create an array of random integers between 1 and 100 (size 10)")
-print("4. Create a 2D array with a specific shape from a 1D array")
+def exercise3_problem():
+    print("\n--- EXERCISE 3: NumPy Array Creation ---")
+    print("Problem: Create NumPy arrays in the following ways:")
+    print("1. Create a 1D array of evenly spaced values between 0 and 1 (5 values)")
+    print("2. Create a 3x3 identity matrix")
+    print("3. Create an array of random integers between 1 and 100 (size 10)")
+    print("4. Create a 2D array with a specific shape from a 1D array")
+
 
 # Solution to Exercise 3
 def exercise3_solution():
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
     # 1. Evenly spaced values (time complexity: O(n))
     linspace_array = np.linspace(0, 1, 5)
     print(f"Evenly spaced values between 0 and 1: {linspace_array}")
@@ -118,20 +121,22 @@ def exercise3_solution():
     print("Reshaped to 3x4 array:")
     print(reshaped)
 
-exercise3_solution()
-
 # -----------------------------------------------------
 # EXERCISE 4: NumPy Array Operations
 # -----------------------------------------------------
-print("\n--- EXERCISE 4: NumPy Array Operations ---")
-print("Problem: Given a NumPy array, perform the following operations:")
-print("1. Find the mean, median, max, and min values")
-print("2. Perform element-wise operations (add 5, multiply by 2)")
-print("3. Filter out all values below the mean")
-print("4. Apply a mathematical function (e.g., square root) to each element")
+def exercise4_problem():
+    print("\n--- EXERCISE 4: NumPy Array Operations ---")
+    print("Problem: Given a NumPy array, perform the following operations:")
+    print("1. Find the mean, median, max, and min values")
+    print("2. Perform element-wise operations (add 5, multiply by 2)")
+    print("3. Filter out all values below the mean")
+    print("4. Apply a mathematical function (e.g., square root) to each element")
+
 
 # Solution to Exercise 4
 def exercise4_solution():
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
     # Create a test array (time complexity: O(n))
     arr = np.array([14, 23, 32, 41, 50, 67, 76, 89, 95])
     print(f"Original array: {arr}")
@@ -155,20 +160,22 @@ def exercise4_solution():
     sqrt_values = np.sqrt(arr)
     print(f"Square root of each value: {sqrt_values}")
 
-exercise4_solution()
-
 # -----------------------------------------------------
 # EXERCISE 5: 2D Array Manipulation
 # -----------------------------------------------------
-print("\n--- EXERCISE 5: 2D Array Manipulation ---")
-print("Problem: Given a 2D NumPy array/matrix, perform the following:")
-print("1. Calculate the sum of each row and each column")
-print("2. Extract the diagonal elements")
-print("3. Transpose the matrix")
-print("4. Calculate the determinant (if square matrix)")
+def exercise5_problem():
+    print("\n--- EXERCISE 5: 2D Array Manipulation ---")
+    print("Problem: Given a 2D NumPy array/matrix, perform the following:")
+    print("1. Calculate the sum of each row and each column")
+    print("2. Extract the diagonal elements")
+    print("3. Transpose the matrix")
+    print("4. Calculate the determinant (if square matrix)")
+
 
 # Solution to Exercise 5
 def exercise5_solution():
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
     # Create a 3x3 matrix (time complexity: O(n²))
     matrix = np.array([
         [1, 2, 3],
@@ -207,20 +214,22 @@ def exercise5_solution():
     print(non_singular)
     print(f"Determinant of non-singular matrix: {np.linalg.det(non_singular)}")
 
-exercise5_solution()
-
 # -----------------------------------------------------
 # EXERCISE 6: Advanced NumPy Operations
 # -----------------------------------------------------
-print("\n--- EXERCISE 6: Advanced NumPy Operations ---")
-print("Problem: Perform these advanced operations:")
-print("1. Perform matrix multiplication between two matrices")
-print("2. Compute eigenvalues and eigenvectors of a matrix")
-print("3. Solve a system of linear equations using NumPy")
-print("4. Perform singular value decomposition on a matrix")
+def exercise6_problem():
+    print("\n--- EXERCISE 6: Advanced NumPy Operations ---")
+    print("Problem: Perform these advanced operations:")
+    print("1. Perform matrix multiplication between two matrices")
+    print("2. Compute eigenvalues and eigenvectors of a matrix")
+    print("3. Solve a system of linear equations using NumPy")
+    print("4. Perform singular value decomposition on a matrix")
+
 
 # Solution to Exercise 6
 def exercise6_solution():
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
     # Create test matrices
     A = np.array([
         [3, 1], 
@@ -268,20 +277,22 @@ def exercise6_solution():
     print("Vh (right singular vectors transposed):")
     print(Vh)
 
-exercise6_solution()
-
 # -----------------------------------------------------
 # EXERCISE 7: Memory and Performance with Arrays
 # -----------------------------------------------------
-print("\n--- EXERCISE 7: Memory and Performance with Arrays ---")
-print("Problem: Compare the performance of Python lists vs arrays:")
-print("1. Compare the memory usage of a list vs. a NumPy array")
-print("2. Compare the time to compute the sum of all elements")
-print("3. Compare element-wise multiplication performance")
-print("4. Test slicing operations performance")
+def exercise7_problem():
+    print("\n--- EXERCISE 7: Memory and Performance with Arrays ---")
+    print("Problem: Compare the performance of Python lists vs arrays:")
+    print("1. Compare the memory usage of a list vs. a NumPy array")
+    print("2. Compare the time to compute the sum of all elements")
+    print("3. Compare element-wise multiplication performance")
+    print("4. Test slicing operations performance")
+
 
 # Solution to Exercise 7
 def exercise7_solution():
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
     import sys
     import time
     
@@ -361,9 +372,44 @@ def exercise7_solution():
     print(f"Array: {array_time:.6f} seconds")
     print(f"NumPy array: {np_time:.6f} seconds")
 
-exercise7_solution()
-
 # -----------------------------------------------------
 # EXERCISE 8: Practical Array Applications
 # -----------------------------------------------------
-print("\n--- EXERCISE 8: Practical")
\ No newline at end of file
+def exercise8_problem():
+    print("\n--- EXERCISE 8: Practical Array Applications ---")
+
+
+# Problem statement and solution for each exercise, by number
+EXERCISES = {
+    1: (exercise1_problem, exercise1_solution),
+    2: (exercise2_problem, exercise2_solution),
+    3: (exercise3_problem, exercise3_solution),
+    4: (exercise4_problem, exercise4_solution),
+    5: (exercise5_problem, exercise5_solution),
+    6: (exercise6_problem, exercise6_solution),
+    7: (exercise7_problem, exercise7_solution),
+    8: (exercise8_problem, None),
+}
+
+
+def main(argv=None):
+    """Print the problem and run the solution for the chosen exercises (default: all)"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("exercises", nargs="*", type=int,
+                        help=f"Exercise numbers to run ({min(EXERCISES)}-{max(EXERCISES)})")
+    args = parser.parse_args(argv)
+    unknown = set(args.exercises) - set(EXERCISES)
+    if unknown:
+        parser.error(f"no such exercise: {', '.join(map(str, sorted(unknown)))}")
+
+    for number in args.exercises or sorted(EXERCISES):
+        problem, solution = EXERCISES[number]
+        problem()
+        if solution is not None:
+            solution()
+
+
+if __name__ == "__main__":
+    main()
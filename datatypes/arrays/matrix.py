@@ -0,0 +1,329 @@
+"""
+Blocked Matrix Operations for Out-of-Core Arrays
+------------------------------------------------
+
+Exercises 5 and 6 in exercises.py call np.dot, .T and np.sum on 2x2 and 3x3
+matrices. Those calls need every operand (and the result) in RAM. A 50k x
+50k float64 matrix is 20 GB, so large work has to stream through tiles:
+
+1. open_matrix(): .npy files mapped with np.memmap (open_memmap), so each
+   operand is paged in only where it is touched
+2. blocked_matmul(): C = A @ B one output tile at a time, keeping three
+   tiles (A, B, and the accumulator) within a memory budget. Output tiles
+   are independent, so a thread pool computes several at once; NumPy's
+   matmul and the page faults of a memmap both release the GIL
+3. blocked_transpose(): copies tile by tile, so reads and writes both walk
+   contiguous runs instead of striding across the whole file
+4. reduce_rows() / reduce_columns(): sum, mean, min, max and norm over
+   horizontal bands of rows, with O(band) memory
+
+Tile sizes default from a byte budget; they work the same on ordinary
+in-memory ndarrays.
+"""
+
+import math
+
+
+DEFAULT_BUDGET = 256 * 2**20  # Bytes of tiles held in memory at once (per worker)
+
+
+def tile_ranges(n, tile):
+    """(start, stop) pairs covering range(n) in steps of tile"""
+    return [(start, min(start + tile, n)) for start in range(0, n, tile)]
+
+
+def tile_size(itemsize, budget=DEFAULT_BUDGET, tiles=3):
+    """
+    Largest square tile edge such that `tiles` tiles fit in budget bytes,
+    rounded down to a multiple of 64 (at least 64).
+    """
+    edge = int(math.sqrt(budget / (tiles * itemsize)))
+    return max(64, edge // 64 * 64)
+
+
+# -----------------------------------------------------
+# 1. MEMORY-MAPPED OPERANDS
+# -----------------------------------------------------
+
+def open_matrix(path, shape=None, dtype="float64", mode="r"):
+    """
+    Open (or create) a matrix stored as a .npy file, memory-mapped.
+    Time Complexity: O(1) - nothing is read until it is indexed
+    Space Complexity: O(1) resident; pages load on access
+
+    Args:
+        path: File path
+        shape: (rows, cols) to create a new file (mode "w+"); None to open
+        dtype: Element type for a new file
+        mode: "r", "r+" or "w+" (np.memmap modes)
+
+    Returns:
+        np.memmap backed by the file
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    if shape is not None and mode == "r":
+        mode = "w+"
+    return np.lib.format.open_memmap(path, mode=mode, dtype=dtype, shape=shape)
+
+
+def fill_random(matrix, seed=0, band_rows=None):
+    """Fill a (possibly memory-mapped) matrix with uniform [0, 1) values, band by band"""
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    rng = np.random.default_rng(seed)
+    rows, cols = matrix.shape
+    band_rows = band_rows or max(1, DEFAULT_BUDGET // (cols * matrix.itemsize))
+    for lo, hi in tile_ranges(rows, band_rows):
+        matrix[lo:hi] = rng.random((hi - lo, cols), dtype=np.float64).astype(matrix.dtype, copy=False)
+    return matrix
+
+
+# -----------------------------------------------------
+# 2. TILED MATRIX MULTIPLY
+# -----------------------------------------------------
+
+def blocked_matmul(a, b, out=None, tile=None, workers=1, budget=DEFAULT_BUDGET):
+    """
+    Matrix product computed one output tile at a time.
+    Time Complexity: O(n * m * p) multiply-adds, as np.dot
+    Space Complexity: O(workers * tile²) in RAM, whatever the operand sizes
+
+    Output tile (i, j) accumulates a[i, k] @ b[k, j] over the k tiles in a
+    float accumulator and is written once. Each worker owns whole output
+    tiles, so no locking is needed.
+
+    Args:
+        a: (n, m) array or memmap
+        b: (m, p) array or memmap
+        out: (n, p) array or memmap for the result (allocated if None)
+        tile: Tile edge (default: from budget and dtype)
+        workers: Threads computing output tiles concurrently
+        budget: Bytes of tiles each worker may hold
+
+    Returns:
+        out
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    n, m = a.shape
+    m2, p = b.shape
+    if m != m2:
+        raise ValueError(f"shapes {a.shape} and {b.shape} are not aligned")
+    dtype = np.result_type(a.dtype, b.dtype)
+    if out is None:
+        out = np.empty((n, p), dtype=dtype)
+    elif out.shape != (n, p):
+        raise ValueError(f"out has shape {out.shape}, expected {(n, p)}")
+    tile = tile or tile_size(dtype.itemsize, budget)
+    inner = tile_ranges(m, tile)
+
+    def compute(bounds):
+        (i0, i1), (j0, j1) = bounds
+        acc = np.zeros((i1 - i0, j1 - j0), dtype=dtype)
+        for k0, k1 in inner:
+            # np.asarray pulls each tile out of the memmap into RAM once
+            acc += np.asarray(a[i0:i1, k0:k1]) @ np.asarray(b[k0:k1, j0:j1])
+        out[i0:i1, j0:j1] = acc
+
+    tiles = [(rows, cols) for rows in tile_ranges(n, tile) for cols in tile_ranges(p, tile)]
+    if workers <= 1:
+        for bounds in tiles:
+            compute(bounds)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(workers) as pool:
+            for _ in pool.map(compute, tiles):
+                pass
+    return out
+
+
+# -----------------------------------------------------
+# 3. BLOCKED TRANSPOSE
+# -----------------------------------------------------
+
+def blocked_transpose(a, out=None, tile=None, budget=DEFAULT_BUDGET):
+    """
+    Transpose by copying square tiles.
+    Time Complexity: O(n * m)
+    Space Complexity: O(tile²) in RAM
+
+    a.T on a memmap is only a view; materializing it element by element
+    strides across the whole file. Copying tile by tile reads a[i, j] and
+    writes out[j, i] as contiguous runs of tile elements.
+
+    Returns:
+        out, shaped (m, n)
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    n, m = a.shape
+    if out is None:
+        out = np.empty((m, n), dtype=a.dtype)
+    elif out.shape != (m, n):
+        raise ValueError(f"out has shape {out.shape}, expected {(m, n)}")
+    tile = tile or tile_size(a.itemsize, budget, tiles=2)
+    for i0, i1 in tile_ranges(n, tile):
+        for j0, j1 in tile_ranges(m, tile):
+            out[j0:j1, i0:i1] = np.asarray(a[i0:i1, j0:j1]).T
+    return out
+
+
+# -----------------------------------------------------
+# 4. STREAMING ROW / COLUMN REDUCTIONS
+# -----------------------------------------------------
+
+_REDUCTIONS = ("sum", "mean", "min", "max", "norm")
+
+
+def _bands(matrix, band_rows, budget):
+    rows, cols = matrix.shape
+    band_rows = band_rows or max(1, budget // max(1, cols * matrix.itemsize))
+    return tile_ranges(rows, band_rows)
+
+
+def _check_op(op):
+    if op not in _REDUCTIONS:
+        raise ValueError(f"unknown reduction {op!r}; choose from {_REDUCTIONS}")
+
+
+def reduce_rows(matrix, op="sum", band_rows=None, budget=DEFAULT_BUDGET):
+    """
+    One value per row (like np.<op>(matrix, axis=1)), streaming bands of rows.
+    Time Complexity: O(n * m)
+    Space Complexity: O(n) for the result plus one band
+
+    Args:
+        matrix: (n, m) array or memmap (C order, so a band is contiguous)
+        op: "sum", "mean", "min", "max" or "norm" (Euclidean)
+        band_rows: Rows per band (default: as many as fit in budget)
+
+    Returns:
+        ndarray of length n
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    _check_op(op)
+    rows, cols = matrix.shape
+    if op in ("mean", "norm"):
+        dtype = np.float64
+    elif op == "sum":
+        # What np.sum would return: small ints widen instead of wrapping
+        dtype = np.sum(np.empty((0, 1), dtype=matrix.dtype), axis=1).dtype
+    else:
+        dtype = matrix.dtype
+    result = np.empty(rows, dtype=dtype)
+    for lo, hi in _bands(matrix, band_rows, budget):
+        band = np.asarray(matrix[lo:hi])
+        if op == "norm":
+            result[lo:hi] = np.sqrt(np.einsum("ij,ij->i", band, band, dtype=np.float64))
+        else:
+            result[lo:hi] = getattr(np, op)(band, axis=1)
+    return result
+
+
+def reduce_columns(matrix, op="sum", band_rows=None, budget=DEFAULT_BUDGET):
+    """
+    One value per column (like np.<op>(matrix, axis=0)), streaming bands of rows.
+    Time Complexity: O(n * m)
+    Space Complexity: O(m) accumulator plus one band
+
+    Each band is folded into a running accumulator: sums (and sums of
+    squares for norm) add, min / max combine elementwise.
+
+    Returns:
+        ndarray of length m
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    _check_op(op)
+    rows, cols = matrix.shape
+    if rows == 0:
+        raise ValueError("reduction over a matrix with no rows")
+    acc = None
+    for lo, hi in _bands(matrix, band_rows, budget):
+        band = np.asarray(matrix[lo:hi])
+        if op in ("sum", "mean"):
+            part = band.sum(axis=0, dtype=np.float64 if op == "mean" else None)
+            acc = part if acc is None else acc + part
+        elif op == "norm":
+            part = np.einsum("ij,ij->j", band, band, dtype=np.float64)
+            acc = part if acc is None else acc + part
+        else:
+            part = getattr(np, op)(band, axis=0)
+            acc = part if acc is None else (np.minimum if op == "min" else np.maximum)(acc, part)
+    if op == "mean":
+        return acc / rows
+    if op == "norm":
+        return np.sqrt(acc)
+    return acc
+
+
+# -----------------------------------------------------
+# EXAMPLES AND BENCHMARK
+# -----------------------------------------------------
+
+def matrix_examples():
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    a = np.arange(1, 10, dtype=np.float64).reshape(3, 3)
+    b = np.array([[1, 0, 2], [2, 3, 0], [0, 1, 1]], dtype=np.float64)
+    print("A:")
+    print(a)
+    print("blocked_matmul(A, B, tile=2) matches A @ B:",
+          np.allclose(blocked_matmul(a, b, tile=2), a @ b))
+    print("blocked_transpose(A, tile=2):")
+    print(blocked_transpose(a, tile=2))
+    print(f"reduce_rows(A, 'sum', band_rows=2): {reduce_rows(a, 'sum', band_rows=2)}")
+    print(f"reduce_columns(A, 'max', band_rows=2): {reduce_columns(a, 'max', band_rows=2)}")
+    print(f"reduce_columns(A, 'norm'): {reduce_columns(a, 'norm')}")
+
+
+def benchmark_matrix(sizes=(1_000, 2_000, 5_000, 10_000, 20_000, 50_000), matmul_max=10_000,
+                     workers=4, dtype="float32", directory=None):
+    """
+    Time the blocked operations on memory-mapped n x n matrices.
+
+    Every size is created as .npy files in directory (default: a temporary
+    directory) and skipped if they would not fit on disk. The O(n³) multiply
+    only runs up to matmul_max; at 50k it is 2.5e14 multiply-adds, hours of
+    CPU even with BLAS, while transpose and the reductions stay O(n²) streams.
+    """
+    import os
+    import shutil
+    import tempfile
+    import time
+
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    itemsize = np.dtype(dtype).itemsize
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        fn()
+        print(f"  {label:<36} {time.perf_counter() - start:9.3f}s")
+
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        for n in sizes:
+            files = 4 if n <= matmul_max else 2
+            needed = files * n * n * itemsize
+            free = shutil.disk_usage(tmp).free
+            if needed > free:
+                print(f"n = {n:,}: skipped, needs {needed / 2**30:.1f} GiB of disk "
+                      f"({free / 2**30:.1f} GiB free)")
+                continue
+            print(f"n = {n:,} ({n * n * itemsize / 2**30:.2f} GiB per matrix, {dtype})")
+            a = open_matrix(os.path.join(tmp, "a.npy"), (n, n), dtype)
+            timed("fill_random (write a)", lambda: fill_random(a, seed=1))
+            t = open_matrix(os.path.join(tmp, "t.npy"), (n, n), dtype)
+            timed("blocked_transpose", lambda: blocked_transpose(a, t))
+            timed("reduce_rows sum", lambda: reduce_rows(a, "sum"))
+            timed("reduce_columns norm", lambda: reduce_columns(a, "norm"))
+            if n <= matmul_max:
+                b = open_matrix(os.path.join(tmp, "b.npy"), (n, n), dtype)
+                fill_random(b, seed=2)
+                c = open_matrix(os.path.join(tmp, "c.npy"), (n, n), dtype)
+                timed("blocked_matmul (1 thread)", lambda: blocked_matmul(a, b, c))
+                timed(f"blocked_matmul ({workers} threads)",
+                      lambda: blocked_matmul(a, b, c, workers=workers))
+                if n <= 5_000:
+                    timed("np.dot (all in RAM)", lambda: np.dot(np.asarray(a), np.asarray(b)))
+                del b, c
+            del a, t
+
+
+if __name__ == "__main__":
+    matrix_examples()
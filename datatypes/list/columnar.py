@@ -0,0 +1,597 @@
+"""
+Columnar Tables for the List-of-Dictionaries Pattern
+----------------------------------------------------
+
+Section 5 of list.py stores records as a list of dicts. Each row is its
+own dict (around 200 bytes before counting any values), every value is a
+boxed Python object, and a filter on one field still walks every dict.
+At 10^7 rows that is gigabytes of memory and seconds per scan.
+
+Table stores the same data by column:
+
+1. Typed columns: numbers in int64 / float64 / bool ndarrays; strings
+   dictionary-encoded (DictColumn), with an int32 code per row and each
+   distinct string kept once
+2. Ingestion from a list of dicts or any row iterator, in chunks, with
+   the types inferred or given as a schema
+3. Vectorized queries: filter with col("age") > 21 style predicates
+   (string predicates run once per distinct value, not per row), sort on
+   several keys, group_by(...).agg(...), and select() projection, which
+   shares the column arrays instead of copying rows
+4. to_rows() converts back to dicts, only when rows are really needed
+
+NumPy is imported lazily, when a table is built.
+"""
+
+
+# -----------------------------------------------------
+# 1. COLUMNS
+# -----------------------------------------------------
+
+class DictColumn:
+    """
+    Dictionary-encoded strings: categories[codes[i]] is row i (code -1 is None).
+    """
+
+    def __init__(self, codes, categories):
+        self.codes = codes
+        self.categories = list(categories)
+        self._index = None
+
+    def __len__(self):
+        return len(self.codes)
+
+    @property
+    def dtype(self):
+        return "str"
+
+    @property
+    def nbytes(self):
+        import sys
+
+        return self.codes.nbytes + sum(sys.getsizeof(s) for s in self.categories)
+
+    def code_of(self, value):
+        """Code of a string, or -2 (matches no row) if it never occurs"""
+        if self._index is None:
+            self._index = {s: i for i, s in enumerate(self.categories)}
+        return self._index.get(value, -2)
+
+    def category_mask(self, predicate):
+        """Boolean mask over rows from a predicate evaluated once per distinct string"""
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        # One extra slot at the end answers code -1 (None) with False
+        hits = np.array([bool(predicate(s)) for s in self.categories] + [False], dtype=bool)
+        return hits[self.codes]
+
+    def sort_keys(self):
+        """Per-row integers ordering like the strings (None first)"""
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        order = sorted(range(len(self.categories)), key=self.categories.__getitem__)
+        ranks = np.empty(len(self.categories) + 1, dtype=np.int64)
+        ranks[order] = np.arange(len(order))
+        ranks[-1] = -1
+        return ranks[self.codes]
+
+    def take(self, index):
+        return DictColumn(self.codes[index], self.categories)
+
+    def decode(self):
+        """The strings as a list (None for missing)"""
+        lookup = self.categories + [None]
+        return [lookup[c] for c in self.codes.tolist()]
+
+    def __getitem__(self, index):
+        if isinstance(index, int):
+            code = int(self.codes[index])
+            return None if code < 0 else self.categories[code]
+        return self.take(index)
+
+
+def _kind_of(cls):
+    if issubclass(cls, bool):
+        return "bool"
+    if issubclass(cls, float):
+        return "float"
+    if hasattr(cls, "__index__"):
+        return "int"
+    return "str"
+
+
+def _column_type(values):
+    """Infer "bool", "int", "float" or "str" from Python values (None only: None)"""
+    kinds = {_kind_of(cls) for cls in set(map(type, values)) if cls is not type(None)}
+    if not kinds:
+        return None
+    if "str" in kinds and len(kinds) > 1:
+        raise TypeError(f"column mixes strings and numbers ({', '.join(sorted(kinds))})")
+    for kind in ("str", "float", "int", "bool"):
+        if kind in kinds:
+            return kind
+
+
+_DTYPES = {"bool": "bool", "int": "int64", "float": "float64"}
+
+
+class _ColumnBuilder:
+    """
+    Appends chunks of Python values to one typed column. Without a fixed
+    kind, the first values that are not None decide it; later chunks may
+    widen bool -> int -> float. None in a bool or int column widens it to
+    float with NaN.
+    """
+
+    def __init__(self, kind=None, fixed=False):
+        self.kind = kind
+        self.fixed = fixed
+        self.chunks = []
+        self.index = {None: -1}
+
+    def _widen(self, values):
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        seen = _column_type(values)
+        if seen is None or seen == self.kind:
+            return
+        if self.kind is None:
+            self.kind = seen
+            if seen == "str":
+                self.chunks = [np.full(len(c), -1, dtype=np.int32) for c in self.chunks]
+            else:
+                self.chunks = [c.astype(_DTYPES[seen]) for c in self.chunks]
+            return
+        order = ("bool", "int", "float")
+        if seen == "str" or self.kind == "str":
+            raise TypeError(f"column mixes strings and numbers ({self.kind} then {seen})")
+        if order.index(seen) > order.index(self.kind):
+            self.kind = seen
+            self.chunks = [c.astype(_DTYPES[seen]) for c in self.chunks]
+
+    def append(self, values):
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        if not self.fixed:
+            self._widen(values)
+        if self.kind is None:
+            # Nothing but None so far: placeholder NaNs, retyped once a value shows up
+            self.chunks.append(np.full(len(values), np.nan))
+            return
+        if self.kind == "str":
+            # index maps None -> -1 and each string -> its code, in first-seen order
+            index = self.index
+            add = index.setdefault
+            self.chunks.append(np.array([add(v, len(index) - 1) for v in values], dtype=np.int32))
+            return
+        if self.kind in ("bool", "int") and None in values:
+            self.kind = "float"  # None becomes NaN, as in pandas
+            self.chunks = [chunk.astype(np.float64) for chunk in self.chunks]
+        # For float64, np.array turns None into NaN by itself
+        self.chunks.append(np.array(values, dtype=_DTYPES[self.kind]))
+
+    def finish(self):
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        if self.kind is None:
+            self.kind = "float"
+        dtype = np.int32 if self.kind == "str" else _DTYPES[self.kind]
+        data = np.concatenate(self.chunks) if self.chunks else np.empty(0, dtype=dtype)
+        if self.kind == "str":
+            return DictColumn(data, [s for s in self.index if s is not None])
+        return data
+
+
+# -----------------------------------------------------
+# 2. PREDICATES
+# -----------------------------------------------------
+
+class Predicate:
+    """Row filter: a function table -> boolean mask, combinable with & | ~"""
+
+    def __init__(self, mask_fn, label):
+        self.mask_fn = mask_fn
+        self.label = label
+
+    def __call__(self, table):
+        return self.mask_fn(table)
+
+    def __and__(self, other):
+        return Predicate(lambda t: self(t) & other(t), f"({self.label} & {other.label})")
+
+    def __or__(self, other):
+        return Predicate(lambda t: self(t) | other(t), f"({self.label} | {other.label})")
+
+    def __invert__(self):
+        return Predicate(lambda t: ~self(t), f"~{self.label}")
+
+    def __bool__(self):
+        raise TypeError("a predicate has no truth value; use & | ~ instead of and / or / not")
+
+    def __repr__(self):
+        return self.label
+
+
+_COMPARE = {"==": "__eq__", "!=": "__ne__", "<": "__lt__", "<=": "__le__",
+            ">": "__gt__", ">=": "__ge__"}
+
+
+class ColumnRef:
+    """Reference to a column inside a predicate; see col()"""
+
+    __hash__ = None
+
+    def __init__(self, name):
+        self.name = name
+
+    def _compare(self, symbol, value):
+        name = self.name
+
+        def mask(table):
+            column = table.columns[name]
+            if isinstance(column, DictColumn):
+                if symbol in ("==", "!="):
+                    hit = column.codes == column.code_of(value)
+                    return hit if symbol == "==" else ~hit & (column.codes >= 0)
+                if not isinstance(value, str):
+                    raise TypeError(f"cannot compare string column {name!r} "
+                                    f"with {type(value).__name__} using {symbol!r}")
+                method = getattr(str, _COMPARE[symbol])
+                return column.category_mask(lambda s: method(s, value))
+            return getattr(column, _COMPARE[symbol])(value)
+
+        return Predicate(mask, f"{name} {symbol} {value!r}")
+
+    def __eq__(self, value):
+        return self._compare("==", value)
+
+    def __ne__(self, value):
+        return self._compare("!=", value)
+
+    def __lt__(self, value):
+        return self._compare("<", value)
+
+    def __le__(self, value):
+        return self._compare("<=", value)
+
+    def __gt__(self, value):
+        return self._compare(">", value)
+
+    def __ge__(self, value):
+        return self._compare(">=", value)
+
+    def isin(self, values):
+        name, wanted = self.name, list(values)
+
+        def mask(table):
+            import numpy as np  # If NumPy is not installed, run: pip install numpy
+            column = table.columns[name]
+            if isinstance(column, DictColumn):
+                keep = set(wanted)
+                return column.category_mask(keep.__contains__)
+            return np.isin(column, wanted)
+
+        return Predicate(mask, f"{name}.isin({wanted!r})")
+
+    def startswith(self, prefix):
+        name = self.name
+
+        def mask(table):
+            column = table.columns[name]
+            if not isinstance(column, DictColumn):
+                raise TypeError(f"startswith needs a string column, {name!r} is {column.dtype}")
+            return column.category_mask(lambda s: s.startswith(prefix))
+
+        return Predicate(mask, f"{name}.startswith({prefix!r})")
+
+    def isnull(self):
+        name = self.name
+
+        def mask(table):
+            column = table.columns[name]
+            if isinstance(column, DictColumn):
+                return column.codes < 0
+            import numpy as np  # If NumPy is not installed, run: pip install numpy
+            return np.isnan(column) if column.dtype.kind == "f" else np.zeros(len(column), bool)
+
+        return Predicate(mask, f"{name}.isnull()")
+
+
+def col(name):
+    """Start a predicate on a column: col("age") >= 21, col("city").isin([...])"""
+    return ColumnRef(name)
+
+
+# -----------------------------------------------------
+# 3. TABLE
+# -----------------------------------------------------
+
+_AGGREGATES = ("count", "sum", "mean", "min", "max")
+
+
+class Table:
+    """
+    Columns of equal length, keyed by name. Queries return new Tables that
+    share (select) or gather (filter, sort) the column arrays.
+    """
+
+    def __init__(self, columns):
+        self.columns = dict(columns)
+        lengths = {len(c) for c in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"columns have different lengths: {sorted(lengths)}")
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_rows(cls, rows, schema=None, chunk_size=65_536):
+        """
+        Build a table from dicts (a list or any iterator of them).
+        Time Complexity: O(rows * columns)
+        Space Complexity: O(chunk_size) Python objects at a time, plus the columns
+
+        Args:
+            rows: Iterable of dicts; a missing key is stored as None
+            schema: Optional {name: "int" | "float" | "bool" | "str"}; by
+                    default the names come from the first chunk and the
+                    types are inferred (None in an int column gives float)
+            chunk_size: Rows converted to arrays at a time
+
+        Returns:
+            Table
+        """
+        from itertools import islice
+
+        rows = iter(rows)
+        builders = None
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            if builders is None:
+                if schema:
+                    builders = {n: _ColumnBuilder(kind, fixed=True) for n, kind in schema.items()}
+                else:
+                    names = dict.fromkeys(k for r in chunk for k in r)
+                    builders = {n: _ColumnBuilder() for n in names}
+            for name, builder in builders.items():
+                builder.append([r.get(name) for r in chunk])
+        if builders is None:
+            builders = {n: _ColumnBuilder(k, fixed=True) for n, k in (schema or {}).items()}
+        return cls({name: builder.finish() for name, builder in builders.items()})
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def names(self):
+        return list(self.columns)
+
+    def dtypes(self):
+        return {name: str(column.dtype) for name, column in self.columns.items()}
+
+    def __repr__(self):
+        kinds = ", ".join(f"{name}: {kind}" for name, kind in self.dtypes().items())
+        return f"Table({len(self):,} rows; {kinds})"
+
+    def __getitem__(self, name):
+        """A column's values: the ndarray, or decoded strings for a DictColumn"""
+        column = self.columns[name]
+        return column.decode() if isinstance(column, DictColumn) else column
+
+    def memory_usage(self):
+        """Bytes per column"""
+        return {name: int(column.nbytes) for name, column in self.columns.items()}
+
+    def _take(self, index):
+        return Table({name: column.take(index) if isinstance(column, DictColumn) else column[index]
+                      for name, column in self.columns.items()})
+
+    def select(self, *names):
+        """Projection: a table of some columns, sharing their arrays (no copy)"""
+        return Table({name: self.columns[name] for name in names})
+
+    def filter(self, predicate):
+        """
+        Rows where predicate holds.
+        Time Complexity: O(rows) vectorized
+
+        Args:
+            predicate: Predicate (e.g. col("age") > 21) or a boolean mask
+        """
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        mask = predicate(self) if isinstance(predicate, Predicate) else predicate
+        return self._take(np.flatnonzero(mask))
+
+    def sort(self, *by, descending=False):
+        """
+        Rows ordered by one or more columns (the first is the primary key).
+        Time Complexity: O(rows log rows); stable
+
+        Args:
+            *by: Column names
+            descending: One bool for every key, or a list with one per key
+        """
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        if isinstance(descending, bool):
+            descending = [descending] * len(by)
+        keys = []
+        for name, down in zip(by, descending):
+            column = self.columns[name]
+            key = column.sort_keys() if isinstance(column, DictColumn) else column
+            if down:
+                key = ~key if key.dtype.kind == "b" else -key
+            keys.append(key)
+        # lexsort treats the last key as the primary one
+        order = np.lexsort(keys[::-1]) if keys else np.arange(len(self))
+        return self._take(order)
+
+    def head(self, n=5):
+        return self._take(slice(0, n))
+
+    def to_rows(self):
+        """Yield each row as a dict (materializes Python objects; use sparingly)"""
+        names = self.names
+        columns = [self[name] if isinstance(self.columns[name], DictColumn)
+                   else self.columns[name].tolist() for name in names]
+        for values in zip(*columns):
+            yield dict(zip(names, values))
+
+    def group_by(self, *keys):
+        return GroupBy(self, keys)
+
+
+class GroupBy:
+    """Rows of a table split by the distinct values of key columns"""
+
+    def __init__(self, table, keys):
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        self.table = table
+        self.keys = keys
+        codes = []
+        for name in keys:
+            column = table.columns[name]
+            values = column.codes if isinstance(column, DictColumn) else column
+            uniques, inverse = np.unique(values, return_inverse=True)
+            codes.append((uniques, inverse.ravel()))
+        if len(codes) == 1:
+            self.group_ids = codes[0][1]
+        else:
+            combined = np.ravel_multi_index([inv for _, inv in codes],
+                                            [len(u) for u, _ in codes])
+            _, self.group_ids = np.unique(combined, return_inverse=True)
+            self.group_ids = self.group_ids.ravel()
+        self.n_groups = int(self.group_ids.max()) + 1 if len(self.group_ids) else 0
+        # Row of each group's first member, to read off the key values
+        self.first = np.full(self.n_groups, len(self.group_ids), dtype=np.int64)
+        np.minimum.at(self.first, self.group_ids, np.arange(len(self.group_ids)))
+
+    def agg(self, **outputs):
+        """
+        Aggregate each group.
+        Time Complexity: O(rows) for count / sum / mean, O(rows log rows) for min / max
+
+        Args:
+            **outputs: output_name=(column, aggregate), aggregate one of
+                       "count", "sum", "mean", "min", "max"
+
+        Returns:
+            Table with the key columns then the outputs, one row per group,
+            ordered by key (string keys in order of first appearance)
+        """
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        ids, n = self.group_ids, self.n_groups
+        result = {name: column for name, column in self.table._take(self.first).columns.items()
+                  if name in self.keys}
+        counts = np.bincount(ids, minlength=n)
+        order = starts = None
+        for output, (name, how) in outputs.items():
+            if how not in _AGGREGATES:
+                raise ValueError(f"unknown aggregate {how!r}; choose from {_AGGREGATES}")
+            if how == "count":
+                result[output] = counts
+                continue
+            values = self.table.columns[name]
+            if isinstance(values, DictColumn):
+                raise TypeError(f"cannot {how} string column {name!r}")
+            integer = values.dtype.kind in "biu"
+            if how in ("sum", "mean") and not integer:
+                sums = np.bincount(ids, weights=values, minlength=n)
+                result[output] = sums if how == "sum" else sums / counts
+                continue
+            if order is None:
+                order = np.argsort(ids, kind="stable")
+                starts = np.zeros(n, dtype=np.int64)
+                np.cumsum(counts[:-1], out=starts[1:])
+            if how in ("sum", "mean"):
+                # Exact int64 sums: bincount weights would go through float64
+                ints = values[order].astype(np.int64)
+                sums = np.add.reduceat(ints, starts) if n else ints[:0]
+                result[output] = sums if how == "sum" else sums / counts
+            else:
+                ufunc = np.minimum if how == "min" else np.maximum
+                result[output] = ufunc.reduceat(values[order], starts) if n else values[:0]
+        return Table(result)
+
+    def count(self):
+        return self.agg(count=(None, "count"))
+
+
+# -----------------------------------------------------
+# EXAMPLES AND BENCHMARK
+# -----------------------------------------------------
+
+def columnar_examples():
+    students = [
+        {"name": "Alice", "age": 22, "grade": "A"},
+        {"name": "Bob", "age": 21, "grade": "B"},
+        {"name": "Charlie", "age": 23, "grade": "A-"},
+        {"name": "Dana", "age": 22, "grade": "A"},
+    ]
+    table = Table.from_rows(students)
+    print(table)
+    print(f"grade codes: {table.columns['grade'].codes.tolist()}, "
+          f"categories: {table.columns['grade'].categories}")
+    a_students = table.filter(col("grade").startswith("A"))
+    print(f"Students with A grades: {list(a_students.to_rows())}")
+    print(f"Older than 21, by age descending: "
+          f"{list(table.filter(col('age') > 21).sort('age', descending=True).select('name', 'age').to_rows())}")
+    print(f"Mean age per grade: {list(table.group_by('grade').agg(mean_age=('age', 'mean'), n=(None, 'count')).to_rows())}")
+
+
+def _deep_size(rows):
+    """Bytes of a list of dicts, counting each distinct object once"""
+    import sys
+
+    seen = set()
+    total = sys.getsizeof(rows)
+    for row in rows:
+        total += sys.getsizeof(row)
+        for value in row.values():
+            if id(value) not in seen:
+                seen.add(id(value))
+                total += sys.getsizeof(value)
+    return total
+
+
+def benchmark_columnar(n=1_000_000):
+    """Compare a list of dicts with a Table: memory, filter scan, group-by and sort"""
+    import random
+    import time
+
+    rng = random.Random(0)
+    cities = [f"city{i}" for i in range(500)]
+    grades = ["A", "A-", "B", "B+", "C"]
+    rows = [{"id": i, "city": rng.choice(cities), "age": rng.randint(18, 80),
+             "score": rng.random() * 100, "grade": rng.choice(grades)} for i in range(n)]
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        print(f"{label:<44} {time.perf_counter() - start:8.3f}s")
+        return result
+
+    table = timed("Table.from_rows", lambda: Table.from_rows(rows))
+    print(f"{'list of dicts memory':<44} {_deep_size(rows) / 2**20:8.1f} MiB")
+    print(f"{'Table memory':<44} {sum(table.memory_usage().values()) / 2**20:8.1f} MiB")
+
+    timed("filter age > 60 and grade A*, list of dicts",
+          lambda: [r for r in rows if r["age"] > 60 and r["grade"].startswith("A")])
+    timed("filter age > 60 and grade A*, Table",
+          lambda: table.filter((col("age") > 60) & col("grade").startswith("A")))
+
+    def group_mean(records):
+        totals = {}
+        for r in records:
+            entry = totals.setdefault(r["city"], [0.0, 0])
+            entry[0] += r["score"]
+            entry[1] += 1
+        return {city: s / c for city, (s, c) in totals.items()}
+
+    timed("mean score per city, list of dicts", lambda: group_mean(rows))
+    timed("mean score per city, Table",
+          lambda: table.group_by("city").agg(mean=("score", "mean")))
+    timed("sort by grade, age desc, list of dicts",
+          lambda: sorted(rows, key=lambda r: (r["grade"], -r["age"])))
+    timed("sort by grade, age desc, Table",
+          lambda: table.sort("grade", "age", descending=[False, True]))
+    timed("sum of scores, list of dicts", lambda: sum(r["score"] for r in rows))
+    timed("sum of scores, Table", lambda: table.columns["score"].sum())
+
+
+if __name__ == "__main__":
+    columnar_examples()
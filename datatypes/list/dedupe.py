@@ -0,0 +1,536 @@
+"""
+Order-Preserving Dedupe at Scale
+--------------------------------
+
+remove_duplicates in exercises.py (exercise 5) keeps every item it has seen
+in a Python set. A set entry costs ~60-100 bytes plus the object itself, so
+a billion-row stream needs hundreds of GB. This module dedupes iterators
+lazily, keeping the first occurrence of every item in input order, with
+several memory / accuracy trade-offs:
+
+1. 'exact':    TypedHashSet, an open-addressing table of 64-bit keys in a
+               NumPy array (16 bytes per distinct item at load factor 0.5)
+2. 'bloom':    BloomFilter sized for a target false-positive rate (~1.2 bytes
+               per item at 1% FPR); a false positive drops a unique item, so
+               output is a subset of the exact answer
+3. 'external': Exact with bounded memory: hash-partitions items to disk,
+               dedupes each partition on its own and merges the survivors
+               back into input order
+4. unique_in_order for in-memory NumPy arrays via np.unique(return_index=True)
+
+Items are processed in chunks, so the per-item work is vectorized. Integer
+keys that fit in int64 are stored exactly; any other key is stored as a
+64-bit BLAKE2b digest of a canonical encoding of its value, so distinct
+keys share a fingerprint only by chance (about n^2 / 2^65 for n keys).
+NumPy is imported only when one of these modes is used.
+"""
+
+import hashlib
+import heapq
+import os
+import pickle
+import tempfile
+from itertools import islice
+
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+RUN_BLOCK = 1 << 12
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+
+# -----------------------------------------------------
+# 1. KEYS AND HASHING
+# -----------------------------------------------------
+
+def _normalize(key):
+    """Like a Python set, True and 1.0 count as the integer 1"""
+    if isinstance(key, (bool, float)) and key == key and float(key).is_integer():
+        return int(key)
+    return key
+
+
+def _canonical(key):
+    """
+    Type-tagged, length-prefixed bytes of a key's value.
+
+    Equal keys of the built-in types (int, float, str, bytes, None and
+    tuples / frozensets of them) always encode the same and distinct ones
+    never do. Any other key is encoded by its pickle, so it must pickle
+    equal values to equal bytes.
+    """
+    key = _normalize(key)
+    if isinstance(key, int):
+        return b"i%d;" % key
+    if isinstance(key, float):
+        return b"f" + key.hex().encode() + b";"
+    if isinstance(key, str):
+        data = key.encode("utf-8", "surrogatepass")
+        return b"s%d:" % len(data) + data
+    if isinstance(key, bytes):
+        return b"b%d:" % len(key) + key
+    if key is None:
+        return b"n"
+    if isinstance(key, tuple):
+        return b"t%d(" % len(key) + b"".join(map(_canonical, key)) + b")"
+    if isinstance(key, frozenset):
+        return b"S%d(" % len(key) + b"".join(sorted(map(_canonical, key))) + b")"
+    data = pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)
+    return b"p%d:" % len(data) + data
+
+
+def fingerprint(key):
+    """
+    64-bit signed integer identity of a key.
+
+    int64-range integers map to themselves (exact); anything else to a
+    BLAKE2b digest of _canonical(key), so 1 and "1" stay distinct and,
+    unlike hash(), -1 and -2 or (-1,) and (-2,) do too. Fingerprints are
+    the same in every process.
+    """
+    key = _normalize(key)
+    if type(key) is int and _INT64_MIN <= key <= _INT64_MAX:
+        return key
+    digest = hashlib.blake2b(_canonical(key), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+def fingerprints(keys):
+    """Vectorized fingerprint: int64 array for a list of keys"""
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    # NumPy infers int64 only when every key is an int64-range int (or bool)
+    try:
+        array = np.array(keys)
+    except (ValueError, OverflowError):
+        array = None
+    if array is not None and array.ndim == 1 and array.dtype.kind in "ib":
+        return array.astype(np.int64, copy=False)
+    return np.fromiter(map(fingerprint, keys), dtype=np.int64, count=len(keys))
+
+
+def mix64(x):
+    """
+    SplitMix64 finalizer over a uint64 array.
+
+    Spreads consecutive or patterned integers evenly over all 64 bits before
+    they are masked down to a table slot.
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    x = x.astype(np.uint64, copy=True)
+    with np.errstate(over="ignore"):
+        x ^= x >> np.uint64(30)
+        x *= np.uint64(0xBF58476D1CE4E5B9)
+        x ^= x >> np.uint64(27)
+        x *= np.uint64(0x94D049BB133111EB)
+        x ^= x >> np.uint64(31)
+    return x
+
+
+def first_occurrences(keys):
+    """
+    Indices of the first occurrence of each distinct key, in input order.
+    Time Complexity: O(n log n)
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    _, index = np.unique(keys, return_index=True)
+    index.sort()
+    return index
+
+
+# -----------------------------------------------------
+# 2. COMPACT EXACT SET
+# -----------------------------------------------------
+
+class TypedHashSet:
+    """
+    Open-addressing (linear probing) set of int64 keys in a NumPy array.
+
+    Batch operations probe all keys at once: each round looks up every
+    still-unresolved key's slot, settles the ones that hit their key or an
+    empty slot, and moves the rest one slot on. Rounds are bounded by the
+    longest probe sequence, which stays short at load factor <= 0.5.
+    """
+
+    # Marks an empty slot; the key with this value is tracked by a flag
+    EMPTY = _INT64_MIN
+
+    def __init__(self, capacity=1 << 16, max_load=0.5):
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        size = 1 << max(4, (int(capacity / max_load) - 1).bit_length())
+        self.max_load = max_load
+        self.table = np.full(size, self.EMPTY, dtype=np.int64)
+        self.count = 0
+        self._has_empty_key = False
+
+    def __len__(self):
+        return self.count + self._has_empty_key
+
+    @property
+    def nbytes(self):
+        return self.table.nbytes
+
+    def _grow(self, needed):
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        size = len(self.table)
+        while needed > size * self.max_load:
+            size *= 2
+        old = self.table[self.table != self.EMPTY]
+        self.table = np.full(size, self.EMPTY, dtype=np.int64)
+        self.count = 0
+        self._insert_unique(old)
+
+    def _insert_unique(self, keys):
+        """
+        Insert distinct keys (no EMPTY), returning a mask of those not present.
+        """
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        table = self.table
+        mask = np.uint64(len(table) - 1)
+        slots = (mix64(keys) & mask).astype(np.int64)
+        is_new = np.zeros(len(keys), dtype=bool)
+        pending = np.arange(len(keys))
+
+        while len(pending):
+            current = table[slots[pending]]
+            pending_keys = keys[pending]
+            found = current == pending_keys
+            empty = current == self.EMPTY
+
+            # Several keys may race for the same empty slot: the first wins
+            claim = pending[empty]
+            _, winners = np.unique(slots[claim], return_index=True)
+            winners = claim[winners]
+            table[slots[winners]] = keys[winners]
+            is_new[winners] = True
+
+            settled = found.copy()
+            settled[np.flatnonzero(empty)[np.isin(claim, winners)]] = True
+            pending = pending[~settled]
+            # Losers re-check the same slot (now taken) next round
+            advance = pending[table[slots[pending]] != keys[pending]]
+            slots[advance] = (slots[advance] + 1) & int(mask)
+
+        self.count += int(is_new.sum())
+        return is_new
+
+    def add_many(self, keys):
+        """
+        Add a batch of distinct int64 keys.
+
+        Returns:
+            Boolean mask, True where the key was not in the set before
+        """
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        keys = np.asarray(keys, dtype=np.int64)
+        if self.count + len(keys) > len(self.table) * self.max_load:
+            self._grow(self.count + len(keys))
+
+        is_new = np.zeros(len(keys), dtype=bool)
+        sentinel = keys == self.EMPTY
+        if sentinel.any():
+            is_new[np.flatnonzero(sentinel)[0]] = not self._has_empty_key
+            self._has_empty_key = True
+        regular = ~sentinel
+        is_new[regular] = self._insert_unique(keys[regular])
+        return is_new
+
+    def contains_many(self, keys):
+        """Boolean mask of the keys present in the set"""
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        keys = np.asarray(keys, dtype=np.int64)
+        table = self.table
+        mask = np.uint64(len(table) - 1)
+        slots = (mix64(keys) & mask).astype(np.int64)
+        result = keys == self.EMPTY if self._has_empty_key else np.zeros(len(keys), dtype=bool)
+        pending = np.flatnonzero(keys != self.EMPTY)
+        while len(pending):
+            current = table[slots[pending]]
+            hit = current == keys[pending]
+            result[pending[hit]] = True
+            pending = pending[~hit & (current != self.EMPTY)]
+            slots[pending] = (slots[pending] + 1) & int(mask)
+        return result
+
+
+# -----------------------------------------------------
+# 3. APPROXIMATE SET (BLOOM FILTER)
+# -----------------------------------------------------
+
+class BloomFilter:
+    """
+    Bloom filter sized for `capacity` items at false-positive rate `fpr`.
+
+    Uses m = -n ln(p) / ln(2)^2 bits and k = (m / n) ln 2 hash functions,
+    derived from two 64-bit hashes by double hashing (h1 + i * h2).
+    Never gives false negatives; past `capacity` the FPR rises above target.
+    """
+
+    def __init__(self, capacity, fpr=0.01):
+        import math
+
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        if not 0 < fpr < 1:
+            raise ValueError(f"fpr must be in (0, 1), got {fpr}")
+        capacity = max(int(capacity), 1)
+        bits = max(64, int(math.ceil(-capacity * math.log(fpr) / math.log(2) ** 2)))
+        self.num_bits = bits
+        self.num_hashes = max(1, round(bits / capacity * math.log(2)))
+        self.capacity = capacity
+        self.fpr = fpr
+        self.bits = np.zeros((bits + 7) // 8, dtype=np.uint8)
+
+    @property
+    def nbytes(self):
+        return self.bits.nbytes
+
+    def _positions(self, keys):
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        h1 = mix64(np.asarray(keys, dtype=np.int64).view(np.uint64))
+        h2 = mix64(h1 ^ np.uint64(0x9E3779B97F4A7C15)) | np.uint64(1)
+        i = np.arange(self.num_hashes, dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            combined = h1[:, None] + i * h2[:, None]
+        return (combined % np.uint64(self.num_bits)).astype(np.int64)
+
+    def contains_many(self, keys):
+        """Boolean mask: True if the key was probably added"""
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        pos = self._positions(keys)
+        bit = (self.bits[pos >> 3] >> (pos & 7).astype(np.uint8)) & 1
+        return bit.all(axis=1)
+
+    def add_many(self, keys):
+        """Set the bits for a batch of int64 keys"""
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        pos = self._positions(keys).ravel()
+        np.bitwise_or.at(self.bits, pos >> 3, (1 << (pos & 7)).astype(np.uint8))
+
+
+# -----------------------------------------------------
+# 4. STREAMING DEDUPE
+# -----------------------------------------------------
+
+def _chunks(iterable, size):
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _dedupe_filtered(iterable, seen, key, chunk_size):
+    """Helper: stream through a set-like object with contains_many/add_many"""
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    for chunk in _chunks(iterable, chunk_size):
+        keys = fingerprints(chunk if key is None else [key(x) for x in chunk])
+        first = first_occurrences(keys)          # Drop repeats within the chunk
+        if isinstance(seen, TypedHashSet):
+            keep = first[seen.add_many(keys[first])]
+        else:
+            keep = first[~seen.contains_many(keys[first])]
+            seen.add_many(keys[keep])
+        for i in np.sort(keep).tolist():
+            yield chunk[i]
+
+
+def dedupe_external(iterable, key=None, partitions=64, chunk_size=DEFAULT_CHUNK_SIZE,
+                    directory=None):
+    """
+    Exact order-preserving dedupe with memory bounded by one partition.
+    Time Complexity: O(n log P) plus two sequential passes over disk
+    Space Complexity: O(n / P) in memory, O(n) on disk
+
+    1. Tag each item with its position and key fingerprint and append it to
+       one of P partition files chosen by the fingerprint, so equal items
+       share a partition
+    2. Dedupe each partition with an in-memory set of fingerprints (as in
+       mode='exact', so unhashable items work too), writing the surviving
+       (position, item) records sorted by position
+    3. Merge the P sorted survivor runs by position to restore input order
+
+    Args:
+        iterable: Items to dedupe (any picklable objects)
+        key: Optional function giving the identity of an item
+        partitions: Number of partition files (memory ~ distinct items / P)
+        chunk_size: Items serialized per write
+        directory: Where to put temporary files (default: system temp dir)
+
+    Yields:
+        First occurrences, in input order
+    """
+    with tempfile.TemporaryDirectory(prefix="dedupe-", dir=directory) as tmp:
+        paths = [os.path.join(tmp, f"part{p}") for p in range(partitions)]
+        files = [open(path, "wb") for path in paths]
+        try:
+            import numpy as np  # If NumPy is not installed, run: pip install numpy
+            position = 0
+            for chunk in _chunks(iterable, chunk_size):
+                keys = chunk if key is None else [key(x) for x in chunk]
+                prints = fingerprints(keys)
+                part = (mix64(prints) % np.uint64(partitions)).astype(np.intp)
+                order = np.argsort(part, kind="stable")
+                bounds = np.concatenate(([0], np.cumsum(np.bincount(part, minlength=partitions))))
+                for p in np.flatnonzero(np.diff(bounds)).tolist():
+                    idx = order[bounds[p]:bounds[p + 1]].tolist()
+                    block = ([position + i for i in idx], prints[idx].tolist(),
+                             [chunk[i] for i in idx])
+                    pickle.dump(block, files[p], protocol=pickle.HIGHEST_PROTOCOL)
+                position += len(chunk)
+        finally:
+            for f in files:
+                f.close()
+
+        runs = []
+        for path in paths:
+            seen = set()
+            positions, survivors = [], []
+            for block_positions, block_prints, items in _load_all(path):
+                for pos, k, item in zip(block_positions, block_prints, items):
+                    if k not in seen:
+                        seen.add(k)
+                        positions.append(pos)
+                        survivors.append(item)
+            os.remove(path)
+            if survivors:
+                run = path + ".run"
+                with open(run, "wb") as f:
+                    # Small blocks: the merge holds one block per run in memory
+                    for start in range(0, len(survivors), RUN_BLOCK):
+                        block = (positions[start:start + RUN_BLOCK],
+                                 survivors[start:start + RUN_BLOCK])
+                        pickle.dump(block, f, protocol=pickle.HIGHEST_PROTOCOL)
+                runs.append(run)
+
+        # Positions are unique, so the merge never compares the items themselves
+        streams = [(record for block in _load_all(run) for record in zip(*block)) for run in runs]
+        for _, item in heapq.merge(*streams):
+            yield item
+
+
+def _load_all(path):
+    """Helper: every object pickled one after another in a file"""
+    with open(path, "rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+def dedupe(iterable, mode="exact", key=None, capacity=1 << 20, fpr=0.001,
+           chunk_size=DEFAULT_CHUNK_SIZE, **external_options):
+    """
+    Yield the first occurrence of every item, in input order.
+    Time Complexity: O(n log c) for chunk size c ('exact' and 'bloom')
+    Space Complexity: 'exact' O(u) at 16 bytes per distinct item,
+                      'bloom' O(capacity * log(1/fpr)) bits,
+                      'external' O(u / partitions)
+
+    Args:
+        iterable: Any iterable (consumed lazily)
+        mode: 'exact', 'bloom', 'external' or 'set' (plain Python set)
+        key: Optional function giving the identity of an item
+        capacity: Expected number of distinct items (sizes the structures)
+        fpr: Target false-positive rate for mode='bloom'
+        chunk_size: Items processed per vectorized batch
+        **external_options: Passed to dedupe_external (partitions, directory)
+
+    Yields:
+        Items in input order, each distinct key once
+    """
+    if mode == "set":
+        seen = set()
+        for item in iterable:
+            k = item if key is None else key(item)
+            if k not in seen:
+                seen.add(k)
+                yield item
+    elif mode == "exact":
+        yield from _dedupe_filtered(iterable, TypedHashSet(capacity), key, chunk_size)
+    elif mode == "bloom":
+        yield from _dedupe_filtered(iterable, BloomFilter(capacity, fpr), key, chunk_size)
+    elif mode == "external":
+        yield from dedupe_external(iterable, key, chunk_size=chunk_size, **external_options)
+    else:
+        raise ValueError(f"unknown mode {mode!r}")
+
+
+def unique_in_order(values):
+    """
+    Distinct values of an in-memory array, in order of first occurrence.
+    Time Complexity: O(n log n)
+    Space Complexity: O(n)
+
+    Returns:
+        NumPy array
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    values = np.asarray(values)
+    return values[first_occurrences(values)]
+
+
+# -----------------------------------------------------
+# EXAMPLES AND BENCHMARK
+# -----------------------------------------------------
+
+def dedupe_examples():
+    numbers = [3, 8, 1, 7, 2, 9, 5, 4, 6, 8, 3]
+    print(f"Numbers: {numbers}")
+    for mode in ("set", "exact", "bloom", "external"):
+        print(f"dedupe(mode={mode!r}): {list(dedupe(numbers, mode=mode))}")
+    words = ["apple", "Apple", "pear", "APPLE", "fig", "pear"]
+    print(f"Case-insensitive: {list(dedupe(words, key=str.lower))}")
+    print(f"unique_in_order: {unique_in_order(numbers).tolist()}")
+
+
+def benchmark_dedupe(n=5_000_000, distinct=1_000_000):
+    """Throughput and memory of each mode on a stream with repeats"""
+    import random
+    import sys
+    import time
+    import tracemalloc
+
+    random.seed(0)
+    stream = [random.randrange(distinct * 10) for _ in range(n)]
+
+    def remove_duplicates(lst):  # exercise5_solution
+        seen = set()
+        result = []
+        for item in lst:
+            if item not in seen:
+                seen.add(item)
+                result.append(item)
+        return result
+
+    print(f"n = {n:,} items, ~{len(set(stream)):,} distinct")
+    start = time.perf_counter()
+    expected = remove_duplicates(stream)
+    print(f"{'remove_duplicates':<20} {time.perf_counter() - start:7.2f}s")
+
+    capacity = len(expected)
+    for mode, options in (("set", {}), ("exact", {"capacity": capacity}),
+                          ("bloom", {"capacity": capacity, "fpr": 0.001}),
+                          ("external", {"partitions": 16})):
+        start = time.perf_counter()
+        count = sum(1 for _ in dedupe(iter(stream), mode=mode, **options))
+        elapsed = time.perf_counter() - start
+        # Measure memory in a second run: tracemalloc slows allocation down
+        tracemalloc.start()
+        for _ in dedupe(iter(stream), mode=mode, **options):
+            pass
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{'dedupe ' + mode:<20} {elapsed:7.2f}s  {n / elapsed:>12,.0f} items/s  "
+              f"peak {peak / 2**20:7.1f} MB  kept {count:,} of {len(expected):,}")
+
+    start = time.perf_counter()
+    unique_in_order(stream)
+    print(f"{'unique_in_order':<20} {time.perf_counter() - start:7.2f}s")
+    print(f"(Python set of {len(expected):,} ints: ~{sys.getsizeof(set(expected)) / 2**20:.0f} MB "
+          f"plus the int objects)")
+
+
+if __name__ == "__main__":
+    dedupe_examples()
@@ -9,11 +9,13 @@ Each exercise is designed to reinforce understanding of list operations and thei
 # -----------------------------------------------------
 # EXERCISE 1: Basic List Operations
 # -----------------------------------------------------
-print("\n--- EXERCISE 1: Basic List Operations ---")
-print("Problem: Create a list of the first 10 square numbers (1, 4, 9, etc.). Then:")
-print("1. Print the 3rd element")
-print("2. Print the last 3 elements using negative indexing")
-print("3. Print all elements from index 2 to 7")
+def exercise1_problem():
+    print("\n--- EXERCISE 1: Basic List Operations ---")
+    print("Problem: Create a list of the first 10 square numbers (1, 4, 9, etc.). Then:")
+    print("1. Print the 3rd element")
+    print("2. Print the last 3 elements using negative indexing")
+    print("3. Print all elements from index 2 to 7")
+
 
 # Solution to Exercise 1
 def exercise1_solution():
@@ -30,18 +32,18 @@ def exercise1_solution():
     # 3. Print all elements from index 2 to 7 (time complexity: O(k) where k is slice size)
     print(f"Elements from index 2 to 7: {squares[2:8]}")
 
-exercise1_solution()
-
 # -----------------------------------------------------
 # EXERCISE 2: List Modification
 # -----------------------------------------------------
-print("\n--- EXERCISE 2: List Modification ---")
-print("Problem: Start with the list [10, 20, 30, 40, 50].")
-print("1. Add 60 to the end")
-print("2. Insert 15 between 10 and 20")
-print("3. Remove the element 30")
-print("4. Replace 40 with 45")
-print("5. Sort the list in descending order")
+def exercise2_problem():
+    print("\n--- EXERCISE 2: List Modification ---")
+    print("Problem: Start with the list [10, 20, 30, 40, 50].")
+    print("1. Add 60 to the end")
+    print("2. Insert 15 between 10 and 20")
+    print("3. Remove the element 30")
+    print("4. Replace 40 with 45")
+    print("5. Sort the list in descending order")
+
 
 # Solution to Exercise 2
 def exercise2_solution():
@@ -70,17 +72,17 @@ def exercise2_solution():
     my_list.sort(reverse=True)
     print(f"After sorting in descending order: {my_list}")
 
-exercise2_solution()
-
 # -----------------------------------------------------
 # EXERCISE 3: List Comprehension
 # -----------------------------------------------------
-print("\n--- EXERCISE 3: List Comprehension ---")
-print("Problem: Use list comprehension to:")
-print("1. Create a list of all even numbers from 1 to 20")
-print("2. Create a list of squares of even numbers from 1 to 10")
-print("3. Create a list of tuples containing (number, square) for numbers 1-5")
-print("4. Filter out all words starting with 'a' from ['apple', 'banana', 'avocado', 'orange']")
+def exercise3_problem():
+    print("\n--- EXERCISE 3: List Comprehension ---")
+    print("Problem: Use list comprehension to:")
+    print("1. Create a list of all even numbers from 1 to 20")
+    print("2. Create a list of squares of even numbers from 1 to 10")
+    print("3. Create a list of tuples containing (number, square) for numbers 1-5")
+    print("4. Filter out all words starting with 'a' from ['apple', 'banana', 'avocado', 'orange']")
+
 
 # Solution to Exercise 3
 def exercise3_solution():
@@ -101,19 +103,19 @@ def exercise3_solution():
     filtered_fruits = [fruit for fruit in fruits if not fruit.startswith('a')]
     print(f"Fruits not starting with 'a': {filtered_fruits}")
 
-exercise3_solution()
-
 # -----------------------------------------------------
 # EXERCISE 4: Working with Nested Lists
 # -----------------------------------------------------
-print("\n--- EXERCISE 4: Working with Nested Lists ---")
-print("Problem: Given a 3x3 matrix represented as a nested list:")
-print("[[1, 2, 3], [4, 5, 6], [7, 8, 9]]")
-print("1. Calculate the sum of all elements")
-print("2. Calculate the sum of each row")
-print("3. Calculate the sum of each column")
-print("4. Find the maximum value in the matrix")
-print("5. Extract the diagonal elements (1, 5, 9)")
+def exercise4_problem():
+    print("\n--- EXERCISE 4: Working with Nested Lists ---")
+    print("Problem: Given a 3x3 matrix represented as a nested list:")
+    print("[[1, 2, 3], [4, 5, 6], [7, 8, 9]]")
+    print("1. Calculate the sum of all elements")
+    print("2. Calculate the sum of each row")
+    print("3. Calculate the sum of each column")
+    print("4. Find the maximum value in the matrix")
+    print("5. Extract the diagonal elements (1, 5, 9)")
+
 
 # Solution to Exercise 4
 def exercise4_solution():
@@ -151,17 +153,17 @@ def exercise4_solution():
     other_diagonal = [matrix[i][len(matrix)-1-i] for i in range(len(matrix))]
     print(f"Other diagonal elements: {other_diagonal}")
 
-exercise4_solution()
-
 # -----------------------------------------------------
 # EXERCISE 5: List Algorithms
 # -----------------------------------------------------
-print("\n--- EXERCISE 5: List Algorithms ---")
-print("Problem: Implement the following algorithms using lists:")
-print("1. Find the second largest element in a list")
-print("2. Remove duplicates from a list while preserving order")
-print("3. Merge two sorted lists into a single sorted list")
-print("4. Find all pairs of numbers in a list that sum to a given target")
+def exercise5_problem():
+    print("\n--- EXERCISE 5: List Algorithms ---")
+    print("Problem: Implement the following algorithms using lists:")
+    print("1. Find the second largest element in a list")
+    print("2. Remove duplicates from a list while preserving order")
+    print("3. Merge two sorted lists into a single sorted list")
+    print("4. Find all pairs of numbers in a list that sum to a given target")
+
 
 # Solution to Exercise 5
 def exercise5_solution():
@@ -240,17 +242,17 @@ def exercise5_solution():
     
     print(f"Pairs that sum to 10 (efficient): {find_pairs_efficient(numbers, 10)}")
 
-exercise5_solution()
-
 # -----------------------------------------------------
 # EXERCISE 6: Advanced List Operations
 # -----------------------------------------------------
-print("\n--- EXERCISE 6: Advanced List Operations ---")
-print("Problem: Perform these advanced operations:")
-print("1. Flatten a list of lists into a single list")
-print("2. Group a list of numbers into sublists of a specific size")
-print("3. Implement a simple moving average calculator")
-print("4. Rotate a list by k positions")
+def exercise6_problem():
+    print("\n--- EXERCISE 6: Advanced List Operations ---")
+    print("Problem: Perform these advanced operations:")
+    print("1. Flatten a list of lists into a single list")
+    print("2. Group a list of numbers into sublists of a specific size")
+    print("3. Implement a simple moving average calculator")
+    print("4. Rotate a list by k positions")
+
 
 # Solution to Exercise 6
 def exercise6_solution():
@@ -271,7 +273,7 @@ def exercise6_solution():
     
     print(f"List chunked into groups of 3: {chunk_list(numbers, 3)}")
     
-    # 3. Moving average calculator (time complexity: O(n))
+    # 3. Moving average calculator (time complexity: O(n * w); windowed.py does it in O(n))
     def moving_average(lst, window_size):
         results = []
         for i in range(len(lst) - window_size + 1):
@@ -289,17 +291,17 @@ def exercise6_solution():
     
     print(f"List rotated by 3 positions: {rotate_list(numbers, 3)}")
 
-exercise6_solution()
-
 # -----------------------------------------------------
 # EXERCISE 7: Functional Programming with Lists
 # -----------------------------------------------------
-print("\n--- EXERCISE 7: Functional Programming with Lists ---")
-print("Problem: Use functional programming techniques with lists:")
-print("1. Use map to square each element in a list")
-print("2. Use filter to get only even numbers from a list")
-print("3. Use reduce to find the product of all numbers in a list")
-print("4. Chain these operations together")
+def exercise7_problem():
+    print("\n--- EXERCISE 7: Functional Programming with Lists ---")
+    print("Problem: Use functional programming techniques with lists:")
+    print("1. Use map to square each element in a list")
+    print("2. Use filter to get only even numbers from a list")
+    print("3. Use reduce to find the product of all numbers in a list")
+    print("4. Chain these operations together")
+
 
 # Solution to Exercise 7
 def exercise7_solution():
@@ -331,6 +333,39 @@ def exercise7_solution():
     )
     print(f"Product of squares of even numbers: {result}")
 
-exercise7_solution()
 
-print("\nComplete all exercises to master Python lists!")
\ No newline at end of file
+# Problem statement and solution for each exercise, by number
+EXERCISES = {
+    1: (exercise1_problem, exercise1_solution),
+    2: (exercise2_problem, exercise2_solution),
+    3: (exercise3_problem, exercise3_solution),
+    4: (exercise4_problem, exercise4_solution),
+    5: (exercise5_problem, exercise5_solution),
+    6: (exercise6_problem, exercise6_solution),
+    7: (exercise7_problem, exercise7_solution),
+}
+
+
+def main(argv=None):
+    """Print the problem and run the solution for the chosen exercises (default: all)"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("exercises", nargs="*", type=int,
+                        help=f"Exercise numbers to run ({min(EXERCISES)}-{max(EXERCISES)})")
+    args = parser.parse_args(argv)
+    unknown = set(args.exercises) - set(EXERCISES)
+    if unknown:
+        parser.error(f"no such exercise: {', '.join(map(str, sorted(unknown)))}")
+
+    for number in args.exercises or sorted(EXERCISES):
+        problem, solution = EXERCISES[number]
+        problem()
+        if solution is not None:
+            solution()
+
+    print("\nComplete all exercises to master Python lists!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+"""
+k-Way Merge of Sorted Sources
+-----------------------------
+
+merge_sorted_lists in exercises.py (exercise 5) and app.merge combine two
+in-memory lists. Merging k sorted shards by repeating two-way merges either
+copies every element k times (merging into one growing list: O(n * k)) or
+log2(k) times (pairwise rounds: O(n log k)), and needs everything in memory.
+
+This module merges k sorted iterators lazily:
+
+1. merge(): a tournament (loser) tree. Each node remembers the loser of the
+   match played there, so after the winner is output only the path from its
+   leaf to the root is replayed: at most ceil(log2 k) comparisons per
+   element, against up to 2 log2 k for a binary heap's sift-down
+2. Key functions, reverse order and stable ties: equal keys come out in
+   source order, and in arrival order within a source (like heapq.merge)
+3. merge_files(): merges sorted text files (log shards) line by line
+   without reading any of them into memory
+4. merge_arrays() and merge_chunks(): vectorized merges of NumPy arrays and
+   of sources that produce sorted NumPy chunks, with the same stability
+
+NumPy is only imported by the array functions.
+"""
+
+
+# -----------------------------------------------------
+# 1. LOSER TREE
+# -----------------------------------------------------
+
+class LoserTree:
+    """
+    Tournament tree over k sorted iterators.
+
+    Leaves are numbered 0..k-1 and live at heap positions k..2k-1; internal
+    node n (1 <= n < k) stores the index of the source that lost the match
+    at n, and node 0 stores the overall winner. An exhausted source loses
+    every match. Ties go to the lower source index, which makes the merge
+    stable.
+    """
+
+    def __init__(self, iterables, key=None, reverse=False):
+        self.iterators = [iter(it) for it in iterables]
+        self.key = key
+        self.reverse = reverse
+        self.k = k = len(self.iterators)
+        self.items = [None] * k
+        self.keys = [None] * k
+        self.live = [False] * k
+        self.comparisons = 0
+        for i in range(k):
+            self._advance(i)
+
+        self.tree = [0] * max(k, 1)
+        if k:
+            winners = [0] * (2 * k)
+            for n in range(2 * k - 1, 0, -1):
+                if n >= k:
+                    winners[n] = n - k
+                else:
+                    a, b = winners[2 * n], winners[2 * n + 1]
+                    if self._beats(a, b):
+                        winners[n], self.tree[n] = a, b
+                    else:
+                        winners[n], self.tree[n] = b, a
+            self.tree[0] = winners[1] if k > 1 else 0
+
+    def _advance(self, i):
+        """Pull the next item of source i into its leaf"""
+        for item in self.iterators[i]:
+            self.items[i] = item
+            self.keys[i] = item if self.key is None else self.key(item)
+            self.live[i] = True
+            return
+        self.items[i] = self.keys[i] = None
+        self.live[i] = False
+
+    def _beats(self, a, b):
+        """True if source a's current item goes out before source b's"""
+        if not self.live[a]:
+            return False
+        if not self.live[b]:
+            return True
+        self.comparisons += 1
+        ka, kb = self.keys[a], self.keys[b]
+        if self.reverse:
+            ka, kb = kb, ka
+        # One comparison per match: the lower source index wins unless beaten
+        if a < b:
+            return not kb < ka
+        return ka < kb
+
+    def __iter__(self):
+        k = self.k
+        if k == 0:
+            return
+        tree, items, live = self.tree, self.items, self.live
+        beats, advance = self._beats, self._advance
+        while True:
+            winner = tree[0]
+            if not live[winner]:
+                return
+            yield items[winner]
+            advance(winner)
+            # Replay the winner's path: it meets the stored loser at each node
+            node = (winner + k) >> 1
+            while node:
+                if beats(tree[node], winner):
+                    tree[node], winner = winner, tree[node]
+                node >>= 1
+            tree[0] = winner
+
+
+def merge(*iterables, key=None, reverse=False):
+    """
+    Lazily merge sorted iterables into one sorted stream.
+    Time Complexity: O(n log k) with at most ceil(log2 k) comparisons per element
+    Space Complexity: O(k)
+
+    Args:
+        *iterables: Iterables each sorted by key (descending if reverse)
+        key: Optional function extracting the comparison key
+        reverse: Sources (and the output) are in descending order
+
+    Yields:
+        Items in sorted order; equal keys keep the order of their sources
+    """
+    if len(iterables) == 1:
+        yield from iterables[0]
+        return
+    yield from LoserTree(iterables, key, reverse)
+
+
+def merge_files(paths, key=None, reverse=False, encoding="utf-8"):
+    """
+    Merge sorted text files (e.g. log shards) line by line.
+    Time Complexity: O(n log k)
+    Space Complexity: O(k) lines plus one read buffer per file
+
+    All files stay open for the duration of the merge; they are closed when
+    the generator finishes or is closed.
+
+    Yields:
+        Lines (with their newline) in sorted order
+    """
+    from contextlib import ExitStack
+
+    with ExitStack() as stack:
+        files = [stack.enter_context(open(path, encoding=encoding)) for path in paths]
+        yield from merge(*files, key=key, reverse=reverse)
+
+
+# -----------------------------------------------------
+# 2. VECTORIZED MERGES
+# -----------------------------------------------------
+
+def merge_arrays(arrays, return_sources=False):
+    """
+    Merge sorted NumPy arrays in one vectorized pass.
+    Time Complexity: O(n log k) - the stable sort (timsort/radix) finds the k runs
+    Space Complexity: O(n)
+
+    Concatenating in source order and sorting stably keeps equal values in
+    source order, matching merge().
+
+    Args:
+        arrays: Sequence of sorted 1-D arrays
+        return_sources: Also return which array each output element came from
+
+    Returns:
+        Merged array, or (merged, source_index) if return_sources
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    arrays = [np.asarray(a) for a in arrays]
+    if not arrays:
+        merged = np.empty(0)
+        return (merged, np.empty(0, dtype=np.intp)) if return_sources else merged
+    values = np.concatenate(arrays)
+    if not return_sources:
+        return np.sort(values, kind="stable")
+    order = np.argsort(values, kind="stable")
+    sources = np.repeat(np.arange(len(arrays)), [len(a) for a in arrays])
+    return values[order], sources[order]
+
+
+def merge_chunks(*sources):
+    """
+    Merge sources that each yield sorted NumPy chunks, chunk by chunk.
+    Time Complexity: O(n log k)
+    Space Complexity: O(k * chunk size)
+
+    Every source keeps a buffer. The bound is the smallest last value among
+    the buffers (the lowest source index among ties): nothing any source
+    produces later can be below it. Each round emits every buffered value
+    below the bound, plus values equal to it from sources up to the bound's
+    owner, merges them with merge_arrays, and refills the drained buffers.
+
+    Args:
+        *sources: Iterables of sorted 1-D arrays; each source's concatenated
+                  chunks must be sorted
+
+    Yields:
+        Sorted arrays whose concatenation is the merged stream
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    iterators = [iter(s) for s in sources]
+    buffers = [None] * len(iterators)
+
+    def refill(i):
+        for chunk in iterators[i]:
+            chunk = np.asarray(chunk)
+            if len(chunk):
+                buffers[i] = chunk
+                return
+        buffers[i] = None
+
+    for i in range(len(iterators)):
+        refill(i)
+
+    while True:
+        live = [i for i, b in enumerate(buffers) if b is not None]
+        if not live:
+            return
+        if len(live) == 1:
+            i = live[0]
+            yield buffers[i]
+            refill(i)
+            continue
+
+        owner = min(live, key=lambda i: (buffers[i][-1], i))
+        bound = buffers[owner][-1]
+        parts = []
+        for i in live:
+            side = "right" if i <= owner else "left"
+            cut = int(np.searchsorted(buffers[i], bound, side=side))
+            parts.append(buffers[i][:cut])
+            buffers[i] = buffers[i][cut:]
+        yield merge_arrays(parts)
+        for i in live:
+            if len(buffers[i]) == 0:
+                refill(i)
+
+
+# -----------------------------------------------------
+# EXAMPLES AND BENCHMARK
+# -----------------------------------------------------
+
+def kway_merge_examples():
+    shards = [[1, 4, 9], [2, 3, 10, 11], [], [0, 5, 5, 12]]
+    print(f"Shards: {shards}")
+    print(f"merge: {list(merge(*shards))}")
+
+    logs = [["09:00 a", "09:05 b"], ["09:01 c", "09:05 d"], ["09:02 e"]]
+    print(f"Stable on key: {list(merge(*logs, key=lambda line: line[:5]))}")
+    print(f"Descending: {list(merge([9, 5, 1], [8, 2], reverse=True))}")
+
+    tree = LoserTree([range(0, 100, 3), range(1, 100, 3), range(2, 100, 3)])
+    total = sum(1 for _ in tree)
+    print(f"Loser tree: {total} items with {tree.comparisons} comparisons")
+
+    chunks = [[[1, 3], [5, 7]], [[2, 2], [6]], [[0, 8]]]
+    print(f"merge_chunks: {[c.tolist() for c in merge_chunks(*chunks)]}")
+
+
+def benchmark_kway_merge(total=1_000_000, ks=(2, 8, 64, 256, 1024)):
+    """Compare merge() with heapq.merge and repeated two-way app.merge"""
+    import heapq
+    import random
+    import time
+
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    from app import merge as two_way_merge  # Run from the repository root
+
+    class Counted:
+        """Key wrapper counting comparisons"""
+        count = 0
+        __slots__ = ("v",)
+
+        def __init__(self, v):
+            self.v = v
+
+        def __lt__(self, other):
+            Counted.count += 1
+            return self.v < other.v
+
+    def pairwise(shards):  # Repeated two-way merges in balanced rounds
+        while len(shards) > 1:
+            shards = [two_way_merge(shards[i], shards[i + 1]) if i + 1 < len(shards)
+                      else shards[i] for i in range(0, len(shards), 2)]
+        return shards[0]
+
+    random.seed(0)
+    print(f"{'k':>5} {'loser tree':>11} {'heapq.merge':>12} {'2-way rounds':>13} "
+          f"{'merge_arrays':>13} {'cmp/item tree':>14} {'cmp/item heap':>14}")
+    for k in ks:
+        shards = [sorted(random.random() for _ in range(total // k)) for _ in range(k)]
+        timings = []
+        for fn in (lambda: list(merge(*shards)),
+                   lambda: list(heapq.merge(*shards)),
+                   lambda: pairwise(shards)):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        arrays = [np.array(s) for s in shards]
+        start = time.perf_counter()
+        merge_arrays(arrays)
+        timings.append(time.perf_counter() - start)
+
+        small = [s[:2000] for s in shards]
+        m = sum(map(len, small))
+        Counted.count = 0
+        list(merge(*small, key=Counted))
+        tree_cmp = Counted.count / m
+        Counted.count = 0
+        list(heapq.merge(*small, key=Counted))
+        heap_cmp = Counted.count / m
+        print(f"{k:>5} " + " ".join(f"{t:>11.3f}s" for t in timings)
+              + f" {tree_cmp:>14.2f} {heap_cmp:>14.2f}")
+
+
+if __name__ == "__main__":
+    kway_merge_examples()
@@ -0,0 +1,441 @@
+"""
+Pair and k-Sum Search
+---------------------
+
+Generalizes find_pairs / find_pairs_efficient from exercises.py (exercise 5).
+find_pairs checks every pair in O(n^2); find_pairs_efficient is O(n) but
+answers a single target and drops multiplicity (for [5, 5, 5] and target 10
+there are three index pairs, not two). This module provides:
+
+1. Hash-based two-sum: index pairs with full multiplicity, pair counts for
+   many targets from one pass over the data, and distinct value pairs
+2. Sorted two-pointer versions that need O(1) extra memory
+3. Vectorized NumPy versions over np.unique that handle 10^7 integers in
+   bounded memory (targets are processed in batches)
+4. 3-sum / 4-sum / k-sum returning distinct value tuples
+5. The pair whose sum is closest to a target
+
+Values are treated as a multiset: a value can appear in a pair or tuple as
+many times as it occurs in the input, and never pairs with itself.
+NumPy is only imported by the *_array functions.
+"""
+
+from collections import Counter, defaultdict
+
+
+# -----------------------------------------------------
+# 1. HASH-BASED TWO-SUM
+# -----------------------------------------------------
+
+def iter_pair_indices(values, target):
+    """
+    Every index pair (i, j), i < j, with values[i] + values[j] == target.
+    Time Complexity: O(n + k) for k pairs
+    Space Complexity: O(n) for the index lists
+
+    Unlike find_pairs_efficient, repeated values produce every pair
+    (multiplicity is kept). Pairs are generated lazily in order of j.
+
+    Yields:
+        Tuples (i, j)
+    """
+    positions = defaultdict(list)
+    for j, x in enumerate(values):
+        for i in positions.get(target - x, ()):
+            yield i, j
+        positions[x].append(j)
+
+
+def count_pairs(values, targets):
+    """
+    Number of index pairs summing to each target, from one pass over values.
+    Time Complexity: O(n + t * u) for u distinct values and t targets
+    Space Complexity: O(u)
+
+    The data is read once into a Counter; each target is then answered from
+    the distinct values alone, so many targets cost little more than one.
+
+    Args:
+        values: Iterable of numbers (may be a generator)
+        targets: Iterable of target sums
+
+    Returns:
+        Dictionary target -> number of index pairs i < j
+    """
+    counts = Counter(values)
+    result = {}
+    for target in targets:
+        total = 0
+        for x, c in counts.items():
+            y = target - x
+            if x < y:
+                total += c * counts.get(y, 0)
+            elif x == y:
+                total += c * (c - 1) // 2
+        result[target] = total
+    return result
+
+
+def distinct_pairs(values, target):
+    """
+    Distinct value pairs (a, b), a <= b, with a + b == target.
+    Time Complexity: O(n)
+    Space Complexity: O(u)
+
+    Returns:
+        Sorted list of tuples
+    """
+    counts = Counter(values)
+    pairs = []
+    for x, c in counts.items():
+        y = target - x
+        if x < y and y in counts or x == y and c > 1:
+            pairs.append((x, y))
+    pairs.sort()
+    return pairs
+
+
+# -----------------------------------------------------
+# 2. SORTED TWO-POINTER
+# -----------------------------------------------------
+
+def two_pointer_pairs(sorted_values, target, lo=0, hi=None):
+    """
+    Distinct value pairs summing to target in a sorted sequence.
+    Time Complexity: O(n)
+    Space Complexity: O(1) extra (besides the output)
+
+    Args:
+        sorted_values: Sequence sorted in ascending order
+        target: Target sum
+        lo, hi: Search only sorted_values[lo:hi] (used by k_sum)
+
+    Returns:
+        List of (a, b) with a <= b, in ascending order of a
+    """
+    a = sorted_values
+    i, j = lo, (len(a) if hi is None else hi) - 1
+    pairs = []
+    while i < j:
+        s = a[i] + a[j]
+        if s < target:
+            i += 1
+        elif s > target:
+            j -= 1
+        else:
+            pairs.append((a[i], a[j]))
+            left, right = a[i], a[j]
+            while i < j and a[i] == left:
+                i += 1
+            while i < j and a[j] == right:
+                j -= 1
+    return pairs
+
+
+def two_pointer_count(sorted_values, target):
+    """
+    Number of index pairs summing to target in a sorted sequence.
+    Time Complexity: O(n)
+    Space Complexity: O(1)
+
+    Runs of equal values are counted in one step, so multiplicity is kept
+    without extra memory.
+    """
+    a = sorted_values
+    i, j = 0, len(a) - 1
+    total = 0
+    while i < j:
+        s = a[i] + a[j]
+        if s < target:
+            i += 1
+        elif s > target:
+            j -= 1
+        elif a[i] == a[j]:
+            run = j - i + 1
+            total += run * (run - 1) // 2
+            break
+        else:
+            left_run = 1
+            while a[i + left_run] == a[i]:
+                left_run += 1
+            right_run = 1
+            while a[j - right_run] == a[j]:
+                right_run += 1
+            total += left_run * right_run
+            i += left_run
+            j -= right_run
+    return total
+
+
+# -----------------------------------------------------
+# 3. VECTORIZED (NUMPY) TWO-SUM
+# -----------------------------------------------------
+
+def count_pairs_array(values, targets, batch_bytes=64 * 2**20):
+    """
+    count_pairs for a NumPy integer array.
+    Time Complexity: O(n log n + t * u log u)
+    Space Complexity: O(u + batch_bytes)
+
+    np.unique collapses the data to u distinct values with counts; each
+    target is answered with one vectorized searchsorted over them. Targets
+    are processed in batches sized so the (targets x u) work arrays stay
+    under batch_bytes, which keeps memory bounded for 10^7 inputs.
+
+    Args:
+        values: Integer array-like
+        targets: Array-like of target sums
+        batch_bytes: Memory budget for the per-batch work arrays
+
+    Returns:
+        int64 array with the number of index pairs for each target
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    uniq, counts = np.unique(np.asarray(values), return_counts=True)
+    counts = counts.astype(np.int64)
+    targets = np.asarray(targets, dtype=uniq.dtype if len(uniq) else np.int64).ravel()
+    result = np.zeros(len(targets), dtype=np.int64)
+    if len(uniq) == 0:
+        return result
+
+    batch = max(1, batch_bytes // (24 * len(uniq)))
+    for start in range(0, len(targets), batch):
+        t = targets[start:start + batch, None]
+        complement = t - uniq                                  # (batch, u)
+        pos = np.minimum(np.searchsorted(uniq, complement), len(uniq) - 1)
+        found = uniq[pos] == complement
+        other = np.where(found, counts[pos], 0)
+        # x < y: every cross pair once; x == y: choose 2 within the run
+        cross = np.where(uniq < complement, counts * other, 0).sum(axis=1)
+        same = np.where(uniq == complement, counts * (counts - 1) // 2, 0).sum(axis=1)
+        result[start:start + batch] = cross + same
+    return result
+
+
+def distinct_pairs_array(values, target):
+    """
+    distinct_pairs for a NumPy array.
+    Time Complexity: O(n log n)
+    Space Complexity: O(u)
+
+    Returns:
+        Array of shape (k, 2) with rows (a, b), a <= b, sorted by a
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    uniq, counts = np.unique(np.asarray(values), return_counts=True)
+    complement = target - uniq
+    pos = np.minimum(np.searchsorted(uniq, complement), max(len(uniq) - 1, 0))
+    found = (uniq[pos] == complement) if len(uniq) else np.zeros(0, dtype=bool)
+    keep = found & ((uniq < complement) | ((uniq == complement) & (counts > 1)))
+    return np.column_stack([uniq[keep], complement[keep]])
+
+
+# -----------------------------------------------------
+# 4. 3-SUM / 4-SUM / K-SUM
+# -----------------------------------------------------
+
+def k_sum(values, target, k):
+    """
+    Distinct k-tuples of values (a_1 <= ... <= a_k) that sum to target.
+    Time Complexity: O(n^(k-1)) after an O(n log n) sort (k >= 2)
+    Space Complexity: O(n) for the sorted copy, O(k) recursion
+
+    Fixes the smallest element and recurses on the suffix, skipping repeated
+    values at every level so each distinct tuple is reported once, down to a
+    two-pointer scan. For integers, branches whose k smallest or k largest
+    remaining values cannot reach the target are pruned.
+
+    Args:
+        values: Iterable of numbers
+        target: Target sum
+        k: Tuple size (>= 2)
+
+    Returns:
+        Sorted list of tuples
+    """
+    if k < 2:
+        raise ValueError(f"k must be >= 2, got {k}")
+    a = sorted(values)
+    result = []
+
+    def search(start, k, target, prefix):
+        n = len(a)
+        if n - start < k:
+            return
+        if k == 2:
+            for pair in two_pointer_pairs(a, target, start, n):
+                result.append(prefix + pair)
+            return
+        # Prune: the smallest or largest possible sums miss the target
+        if sum(a[start:start + k]) > target or sum(a[n - k:]) < target:
+            return
+        for i in range(start, n - k + 1):
+            if i > start and a[i] == a[i - 1]:
+                continue
+            if a[i] + sum(a[n - k + 1:]) < target:
+                continue  # a[i] too small even with the largest partners
+            if a[i] * k > target and a[i] >= 0:
+                break  # Every later tuple is larger still
+            search(i + 1, k - 1, target - a[i], prefix + (a[i],))
+
+    search(0, k, target, ())
+    return result
+
+
+def three_sum(values, target=0):
+    """Distinct value triples summing to target - O(n^2)"""
+    return k_sum(values, target, 3)
+
+
+def four_sum(values, target=0):
+    """Distinct value quadruples summing to target - O(n^3)"""
+    return k_sum(values, target, 4)
+
+
+# -----------------------------------------------------
+# 5. CLOSEST PAIR TO A TARGET
+# -----------------------------------------------------
+
+def closest_pair(values, target):
+    """
+    Pair of values (from different positions) whose sum is closest to target.
+    Time Complexity: O(n log n)
+    Space Complexity: O(n)
+
+    Sort, then move two pointers inward, keeping the best sum seen. Ties
+    keep the first pair found (the one with the smaller first element).
+
+    Returns:
+        Tuple (a, b) with a <= b, or None if there are fewer than 2 values
+    """
+    a = sorted(values)
+    i, j = 0, len(a) - 1
+    best = None
+    best_gap = None
+    while i < j:
+        s = a[i] + a[j]
+        gap = abs(s - target)
+        if best_gap is None or gap < best_gap:
+            best, best_gap = (a[i], a[j]), gap
+            if gap == 0:
+                break
+        if s < target:
+            i += 1
+        else:
+            j -= 1
+    return best
+
+
+def closest_pair_array(values, target):
+    """
+    closest_pair for a NumPy array, without a Python-level loop.
+    Time Complexity: O(n log n)
+    Space Complexity: O(n)
+
+    For every a[i], the best partner is next to where target - a[i] would be
+    inserted in the sorted array; both neighbours are checked at once, with
+    the element itself excluded.
+
+    Returns:
+        Tuple (a, b) with a <= b, or None if there are fewer than 2 values
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    a = np.sort(np.asarray(values))
+    n = len(a)
+    if n < 2:
+        return None
+
+    idx = np.arange(n)
+    insert = np.searchsorted(a, target - a)
+    best_gap = None
+    best = None
+    for offset in (-1, 0):
+        j = np.clip(insert + offset, 0, n - 1)
+        j = np.where(j == idx, np.where(j + 1 < n, j + 1, j - 1), j)  # Not itself
+        gaps = np.abs(a + a[j] - target)
+        i = int(np.argmin(gaps))
+        if best_gap is None or gaps[i] < best_gap:
+            best_gap = gaps[i]
+            x, y = a[i].item(), a[j[i]].item()
+            best = (min(x, y), max(x, y))
+    return best
+
+
+# -----------------------------------------------------
+# EXAMPLES AND BENCHMARK
+# -----------------------------------------------------
+
+def pair_sums_examples():
+    numbers = [3, 8, 1, 7, 2, 9, 5, 4, 6, 8, 3]
+    print(f"Numbers: {numbers}")
+    print(f"Index pairs summing to 10: {list(iter_pair_indices(numbers, 10))}")
+    print(f"Pair counts for targets 10, 11, 16: {count_pairs(numbers, [10, 11, 16])}")
+    print(f"Distinct pairs summing to 10: {distinct_pairs(numbers, 10)}")
+    print(f"Two-pointer pairs: {two_pointer_pairs(sorted(numbers), 10)}")
+    print(f"Two-pointer count: {two_pointer_count(sorted(numbers), 10)}")
+    print(f"3-sum to 0 of [-1, 0, 1, 2, -1, -4]: {three_sum([-1, 0, 1, 2, -1, -4])}")
+    print(f"4-sum to 0 of [1, 0, -1, 0, -2, 2]: {four_sum([1, 0, -1, 0, -2, 2])}")
+    print(f"Closest pair to 20: {closest_pair(numbers, 20)}")
+
+
+def benchmark_pair_sums(n=10_000_000, num_targets=100):
+    """Compare the exercise solutions with the hash, two-pointer and NumPy versions"""
+    import random
+    import time
+
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    def find_pairs(lst, target):  # exercise5_solution, O(n^2)
+        pairs = []
+        for i in range(len(lst)):
+            for j in range(i + 1, len(lst)):
+                if lst[i] + lst[j] == target:
+                    pairs.append((lst[i], lst[j]))
+        return pairs
+
+    def find_pairs_efficient(lst, target):  # exercise5_solution, O(n)
+        pairs = []
+        seen = set()
+        for num in lst:
+            complement = target - num
+            if complement in seen:
+                pairs.append((complement, num))
+            seen.add(num)
+        return pairs
+
+    def timed(label, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        print(f"{label:<44} {time.perf_counter() - start:8.3f}s")
+        return result
+
+    random.seed(0)
+    small = [random.randrange(10_000) for _ in range(3_000)]
+    print(f"n = {len(small):,}, one target")
+    timed("find_pairs (O(n^2))", find_pairs, small, 10_000)
+    timed("find_pairs_efficient", find_pairs_efficient, small, 10_000)
+    timed("count_pairs", count_pairs, small, [10_000])
+
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 1_000_000, n)
+    targets = rng.integers(0, 2_000_000, num_targets)
+    values = data[:n // 10].tolist()
+    print(f"n = {n // 10:,}, 10 targets")
+    timed("find_pairs_efficient, once per target",
+          lambda: [find_pairs_efficient(values, int(t)) for t in targets[:10]])
+    timed("count_pairs", count_pairs, values, targets[:10].tolist())
+    timed("two_pointer_count (presorted), once per target",
+          lambda sorted_values=sorted(values): [two_pointer_count(sorted_values, int(t))
+                                                for t in targets[:10]])
+
+    print(f"n = {n:,}, {num_targets} targets")
+    timed("count_pairs_array", count_pairs_array, data, targets)
+    timed("distinct_pairs_array (1 target)", distinct_pairs_array, data, int(targets[0]))
+    timed("closest_pair_array (1 target)", closest_pair_array, data, 1_234_567)
+
+
+if __name__ == "__main__":
+    pair_sums_examples()
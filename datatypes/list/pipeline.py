@@ -0,0 +1,591 @@
+"""
+Fused Lazy Pipelines: map / filter / reduce in One Pass
+-------------------------------------------------------
+
+exercise7_solution in exercises.py chains map, filter and reduce with
+lambdas, and compehensions.py builds a new list at every step. Over tens of
+millions of records each step costs a full pass, a full intermediate list
+and a Python function call per element.
+
+Pipeline records the chain lazily and only runs it at a terminal operation
+(to_list, reduce, sum, count, min, max):
+
+1. Fusion: the whole chain becomes one generated loop. Stages written as X
+   expressions (X ** 2, X % 2 == 0) are inlined as Python source, so they
+   cost no function call; other callables are called directly
+2. NumPy lowering: when the source is a numeric ndarray and every stage is
+   an X expression, the same expressions run as ufuncs and boolean masks on
+   blocks of the array, and known reducers become ufunc reductions
+3. Process pool: with workers=N the source is split into contiguous shards,
+   each worker runs the fused chain on its shard, and the partial results
+   are combined in order. This needs an associative reducer (the named ones
+   are) and picklable stages (X expressions and module-level functions)
+4. PipelineStats: per-stage time and item counts for any terminal call
+
+    Pipeline(numbers).filter(X % 2 == 0).map(X ** 2).reduce("prod")
+
+NumPy is only imported when the source is an ndarray.
+"""
+
+import operator
+import time
+
+
+# -----------------------------------------------------
+# 1. X EXPRESSIONS
+# -----------------------------------------------------
+
+_BINARY = {
+    "+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.truediv,
+    "//": operator.floordiv, "%": operator.mod, "**": operator.pow,
+    "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+    "==": operator.eq, "!=": operator.ne, "&": operator.and_, "|": operator.or_,
+    "^": operator.xor,
+}
+
+
+def _invert(value):
+    """~ as NumPy does it: logical not for booleans, bitwise not otherwise"""
+    return not value if value is True or value is False else ~value
+
+
+_UNARY = {"-": operator.neg, "~": _invert, "abs": abs}
+
+
+class Expr:
+    """
+    Expression over one element, built with operators on X.
+
+    An Expr is callable on a single value and, because NumPy overloads the
+    same operators, on a whole ndarray. Use & | ~ instead of and / or / not.
+    """
+
+    __slots__ = ("op", "args")
+    __hash__ = None
+
+    def __init__(self, op, args=()):
+        self.op = op
+        self.args = args
+
+    def __call__(self, value):
+        if self.op == "x":
+            return value
+        if self.op == "const":
+            return self.args[0]
+        if len(self.args) == 1:
+            return _UNARY[self.op](self.args[0](value))
+        left, right = self.args
+        return _BINARY[self.op](left(value), right(value))
+
+    def to_source(self, var, constants=None):
+        """
+        Python source for this expression. Constants are appended to the
+        constants list and referenced as c0, c1, ...; with constants=None
+        they are written out with repr().
+        """
+        if self.op == "x":
+            return var
+        if self.op == "const":
+            if constants is None:
+                return repr(self.args[0])
+            constants.append(self.args[0])
+            return f"c{len(constants) - 1}"
+        if self.op == "abs":
+            return f"abs({self.args[0].to_source(var, constants)})"
+        if self.op == "~" and constants is not None:
+            return f"_invert({self.args[0].to_source(var, constants)})"
+        if len(self.args) == 1:
+            return f"({self.op}{self.args[0].to_source(var, constants)})"
+        left, right = (arg.to_source(var, constants) for arg in self.args)
+        return f"({left} {self.op} {right})"
+
+    def __repr__(self):
+        return self.to_source("X")
+
+    def __bool__(self):
+        raise TypeError("an X expression has no truth value; use & | ~ instead of and / or / not")
+
+    def __reduce__(self):
+        return Expr, (self.op, self.args)
+
+    def __neg__(self):
+        return Expr("-", (self,))
+
+    def __invert__(self):
+        return Expr("~", (self,))
+
+    def __abs__(self):
+        return Expr("abs", (self,))
+
+
+def _lift(value):
+    return value if isinstance(value, Expr) else Expr("const", (value,))
+
+
+def _binary(symbol):
+    def method(self, other):
+        return Expr(symbol, (self, _lift(other)))
+
+    def reflected(self, other):
+        return Expr(symbol, (_lift(other), self))
+
+    return method, reflected
+
+
+for _symbol, _name in [("+", "add"), ("-", "sub"), ("*", "mul"), ("/", "truediv"),
+                       ("//", "floordiv"), ("%", "mod"), ("**", "pow"),
+                       ("&", "and"), ("|", "or"), ("^", "xor")]:
+    _method, _reflected = _binary(_symbol)
+    setattr(Expr, f"__{_name}__", _method)
+    setattr(Expr, f"__r{_name}__", _reflected)
+
+for _symbol, _name in [("<", "lt"), ("<=", "le"), (">", "gt"), (">=", "ge"),
+                       ("==", "eq"), ("!=", "ne")]:
+    setattr(Expr, f"__{_name}__", _binary(_symbol)[0])
+
+X = Expr("x")
+
+
+# -----------------------------------------------------
+# 2. REDUCERS
+# -----------------------------------------------------
+
+class Reducer:
+    """
+    Binary reduction with an optional NumPy lowering.
+
+    Args:
+        name: Label for reports
+        combine: Python function (accumulator, value) -> accumulator
+        ufunc: Name of the NumPy ufunc whose .reduce does the same, if any
+        initial: Result for an empty input (None: empty input is an error)
+        associative: Whether shards may be reduced separately
+        inline: Python statement updating acc from x in the fused loop
+        merge: Function combining two partial results (default: combine)
+    """
+
+    def __init__(self, name, combine, ufunc=None, initial=None, associative=False,
+                 inline=None, merge=None):
+        self.name = name
+        self.combine = combine
+        self.merge = merge or combine
+        self.ufunc = ufunc
+        self.initial = initial
+        self.associative = associative
+        self.inline = inline
+
+    def __repr__(self):
+        return f"Reducer({self.name!r})"
+
+
+def _count(acc, _value):
+    return acc + 1
+
+
+REDUCERS = {
+    "sum": Reducer("sum", operator.add, "add", 0, True, "acc += x"),
+    "prod": Reducer("prod", operator.mul, "multiply", 1, True, "acc *= x"),
+    "min": Reducer("min", min, "minimum", None, True, "if x < acc: acc = x"),
+    "max": Reducer("max", max, "maximum", None, True, "if acc < x: acc = x"),
+    "count": Reducer("count", _count, None, 0, True, "acc += 1", operator.add),
+}
+
+
+def _reducer(op, associative):
+    if isinstance(op, Reducer):
+        return op
+    if isinstance(op, str):
+        try:
+            return REDUCERS[op]
+        except KeyError:
+            raise ValueError(f"unknown reducer {op!r}; choose from {sorted(REDUCERS)}") from None
+    return Reducer(getattr(op, "__name__", repr(op)), op, associative=associative)
+
+
+# -----------------------------------------------------
+# 3. STATISTICS
+# -----------------------------------------------------
+
+class PipelineStats:
+    """Per-stage wall time and item counts collected by a terminal operation"""
+
+    def __init__(self):
+        self.backend = None
+        self.workers = 1
+        self.stages = []
+        self.total = 0.0
+
+    def _reset(self, labels):
+        self.stages = [{"stage": label, "seconds": 0.0, "in": 0, "out": 0} for label in labels]
+
+    def _merge(self, other):
+        for mine, theirs in zip(self.stages, other.stages):
+            for field in ("seconds", "in", "out"):
+                mine[field] += theirs[field]
+
+    def report(self):
+        lines = [f"backend={self.backend} workers={self.workers} total={self.total:.4f}s"]
+        for row in self.stages:
+            lines.append(f"  {row['stage']:<44} {row['seconds']:9.4f}s "
+                         f"{row['in']:>12,} in {row['out']:>12,} out")
+        return "\n".join(lines)
+
+
+# -----------------------------------------------------
+# 4. PIPELINE
+# -----------------------------------------------------
+
+_EMPTY = object()
+
+
+def _is_numeric_array(obj):
+    return (type(obj).__module__ == "numpy" and type(obj).__name__ == "ndarray"
+            and obj.ndim == 1 and obj.dtype.kind in "biuf")
+
+
+def _stage_label(kind, fn):
+    return f"{kind} {fn!r}" if isinstance(fn, Expr) else f"{kind} {getattr(fn, '__name__', fn)}"
+
+
+def _compile(stages, reducer=None):
+    """
+    Generate one loop running every stage, then yielding or reducing each item.
+    Returns a function (source, acc) -> generator or final accumulator.
+    """
+    constants, names, body = [], {}, []
+    for i, (kind, fn) in enumerate(stages):
+        if isinstance(fn, Expr):
+            code = fn.to_source("x", constants)
+        else:
+            names[f"f{i}"] = fn
+            code = f"f{i}(x)"
+        body.append(f"x = {code}" if kind == "map" else f"if not {code}: continue")
+    names.update((f"c{i}", value) for i, value in enumerate(constants))
+    names["_EMPTY"] = _EMPTY
+    names["_invert"] = _invert
+
+    if reducer is None:
+        body.append("yield x")
+        tail = []
+    else:
+        names["combine"] = reducer.combine
+        update = reducer.inline or "acc = combine(acc, x)"
+        if reducer.name == "count":
+            body.append(update)
+        else:
+            body.append(f"if acc is _EMPTY:\n    acc = x\nelse:\n    {update}")
+        tail = ["return acc"]
+
+    params = "".join(f", {name}={name}" for name in names)
+    lines = [f"def fused(source, acc{params}):", "    for x in source:"]
+    for statement in body:
+        lines.extend("        " + line for line in statement.split("\n"))
+    lines.extend("    " + line for line in tail)
+    namespace = dict(names)
+    exec("\n".join(lines), namespace)
+    return namespace["fused"]
+
+
+class Pipeline:
+    """
+    Lazy chain of map / filter stages over a source iterable or array.
+
+    Every chaining method returns a new Pipeline; nothing runs until a
+    terminal method is called.
+    """
+
+    def __init__(self, source, stages=()):
+        self.source = source
+        self.stages = tuple(stages)
+
+    def map(self, fn):
+        return Pipeline(self.source, self.stages + (("map", fn),))
+
+    def filter(self, predicate):
+        return Pipeline(self.source, self.stages + (("filter", predicate),))
+
+    def __repr__(self):
+        chain = "".join(f".{kind}({fn!r})" for kind, fn in self.stages)
+        return f"Pipeline(<{type(self.source).__name__}>){chain}"
+
+    def lowerable(self):
+        """True if the chain can run as NumPy operations on the source"""
+        return _is_numeric_array(self.source) and all(isinstance(fn, Expr) for _, fn in self.stages)
+
+    # -- terminals --------------------------------------------------------
+
+    def __iter__(self):
+        return _compile(self.stages)(self.source, None)
+
+    def to_list(self, workers=None, stats=None):
+        """Run the chain and collect the results in a list (or ndarray when lowered)"""
+        return self._run(None, _EMPTY, workers, stats)
+
+    def reduce(self, op, initial=_EMPTY, workers=None, associative=False, stats=None):
+        """
+        Run the chain and fold the results.
+        Time Complexity: O(n) in one pass
+
+        Args:
+            op: Name in REDUCERS ("sum", "prod", "min", "max", "count"), a
+                Reducer, or a binary function
+            initial: Starting accumulator (default: the reducer's identity,
+                     or the first item)
+            workers: Processes to shard the source across (None: this process)
+            associative: Declare a binary function safe to reduce per shard
+            stats: PipelineStats to fill with per-stage timings
+
+        A lowered run uses the array's dtype arithmetic, so an int64 product
+        can wrap around where the Python loop would grow a big int.
+        """
+        reducer = _reducer(op, associative)
+        if initial is _EMPTY and reducer.initial is not None:
+            initial = reducer.initial
+        result = self._run(reducer, initial, workers, stats)
+        if result is _EMPTY:
+            raise TypeError(f"reduce of empty pipeline with no initial value ({reducer.name})")
+        return result
+
+    def sum(self, **options):
+        return self.reduce("sum", **options)
+
+    def count(self, **options):
+        return self.reduce("count", **options)
+
+    def min(self, **options):
+        return self.reduce("min", **options)
+
+    def max(self, **options):
+        return self.reduce("max", **options)
+
+    # -- execution --------------------------------------------------------
+
+    def _run(self, reducer, initial, workers, stats):
+        start = time.perf_counter()
+        if stats is not None:
+            stats._reset([_stage_label(kind, fn) for kind, fn in self.stages]
+                         + ([f"reduce {reducer.name}"] if reducer else []))
+            stats.backend = "numpy" if self.lowerable() else "python"
+            stats.workers = workers or 1
+        if workers and workers > 1:
+            result = self._run_parallel(reducer, initial, workers, stats)
+        else:
+            result = _run_shard(self.source, self.stages, reducer, initial, stats)
+        if stats is not None:
+            stats.total = time.perf_counter() - start
+        return result
+
+    def _run_parallel(self, reducer, initial, workers, stats):
+        from multiprocessing import Pool
+
+        if reducer is not None and not reducer.associative:
+            raise ValueError(f"reducer {reducer.name} must be associative to run in parallel")
+        source = self.source
+        if not hasattr(source, "__getitem__"):
+            source = list(source)
+        n = len(source)
+        shards = max(1, min(n, workers * 4))
+        bounds = [(n * i // shards, n * (i + 1) // shards) for i in range(shards)]
+
+        # The source reaches the workers once through the initializer (inherited
+        # without pickling under fork); tasks only carry shard bounds
+        initargs = (source, self.stages, reducer, stats is not None)
+        with Pool(workers, _init_shard_worker, initargs) as pool:
+            partials = pool.map(_run_shard_task, bounds)
+
+        if reducer is None:
+            if self.lowerable():
+                import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+                result = np.concatenate([values for _, values, _ in partials])
+            else:
+                result = [item for _, values, _ in partials for item in values]
+        else:
+            result = initial
+            for found, value, _ in partials:
+                if found:
+                    result = value if result is _EMPTY else reducer.merge(result, value)
+        if stats is not None:
+            for _, _, shard_stats in partials:
+                stats._merge(shard_stats)
+            if reducer is not None:
+                # Each shard reports its own partial; the run yields one value
+                stats.stages[-1]["out"] = 0 if result is _EMPTY else 1
+        return result
+
+
+_worker_state = None
+
+
+def _init_shard_worker(source, stages, reducer, timed):
+    global _worker_state
+    _worker_state = (source, stages, reducer, timed)
+
+
+def _run_shard_task(bounds):
+    """Process-pool entry point: run the chain on source[lo:hi]"""
+    source, stages, reducer, timed = _worker_state
+    lo, hi = bounds
+    source = source[lo:hi]
+    stats = None
+    if timed:
+        stats = PipelineStats()
+        stats._reset([_stage_label(kind, fn) for kind, fn in stages]
+                     + ([f"reduce {reducer.name}"] if reducer else []))
+    # Partials start from the identity, or empty (the sentinel does not
+    # survive pickling, hence the flag); the parent folds in initial once
+    start = _EMPTY if reducer is None or reducer.initial is None else reducer.initial
+    value = _run_shard(source, stages, reducer, start, stats)
+    if value is _EMPTY:
+        return False, None, stats
+    return True, value, stats
+
+
+def _run_shard(source, stages, reducer, initial, stats):
+    if _is_numeric_array(source) and all(isinstance(fn, Expr) for _, fn in stages):
+        return _run_numpy(source, stages, reducer, initial, stats)
+    if stats is not None:
+        return _run_timed(source, stages, reducer, initial, stats)
+    if reducer is None:
+        return list(_compile(stages)(source, None))
+    return _compile(stages, reducer)(source, initial)
+
+
+def _run_timed(source, stages, reducer, initial, stats):
+    """Stage-by-stage loop that times every call (slower than the fused loop)"""
+    clock = time.perf_counter
+    rows = stats.stages
+    out = []
+    acc = initial
+    for x in source:
+        keep = True
+        for (kind, fn), row in zip(stages, rows):
+            row["in"] += 1
+            start = clock()
+            result = fn(x)
+            row["seconds"] += clock() - start
+            if kind == "map":
+                x = result
+            elif not result:
+                keep = False
+                break
+            row["out"] += 1
+        if not keep:
+            continue
+        if reducer is None:
+            out.append(x)
+            continue
+        row = rows[-1]
+        row["in"] += 1
+        start = clock()
+        if reducer.name == "count":
+            acc = (0 if acc is _EMPTY else acc) + 1
+        else:
+            acc = x if acc is _EMPTY else reducer.combine(acc, x)
+        row["seconds"] += clock() - start
+    if reducer is None:
+        return out
+    rows[-1]["out"] = 0 if acc is _EMPTY else 1
+    return acc
+
+
+def _run_numpy(source, stages, reducer, initial, stats, block=1 << 16):
+    """Apply the chain as ufunc / mask operations on cache-sized blocks"""
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    clock = time.perf_counter
+    ufunc = getattr(np, reducer.ufunc) if reducer is not None and reducer.ufunc else None
+    pieces = []
+    acc = initial
+    for lo in range(0, len(source), block):
+        x = source[lo:lo + block]
+        for i, (kind, fn) in enumerate(stages):
+            start = clock()
+            n_in = len(x)
+            result = fn(x)
+            if kind == "map":
+                x = np.broadcast_to(result, x.shape) if np.ndim(result) == 0 else result
+            else:
+                x = x[np.broadcast_to(np.asarray(result, dtype=bool), x.shape)]
+            if stats is not None:
+                row = stats.stages[i]
+                row["seconds"] += clock() - start
+                row["in"] += n_in
+                row["out"] += len(x)
+        if reducer is None:
+            pieces.append(x)
+            continue
+        if not len(x):
+            continue
+        start = clock()
+        if reducer.name == "count":
+            value = len(x)
+            acc = value if acc is _EMPTY else acc + value
+        elif ufunc is not None:
+            value = ufunc.reduce(x).item()
+            acc = value if acc is _EMPTY else reducer.combine(acc, value)
+        else:
+            for value in x.tolist():
+                acc = value if acc is _EMPTY else reducer.combine(acc, value)
+        if stats is not None:
+            row = stats.stages[-1]
+            row["seconds"] += clock() - start
+            row["in"] += len(x)
+    if reducer is None:
+        return np.concatenate(pieces) if pieces else source[:0]
+    if stats is not None:
+        stats.stages[-1]["out"] = 0 if acc is _EMPTY else 1
+    return acc
+
+
+# -----------------------------------------------------
+# EXAMPLES AND BENCHMARK
+# -----------------------------------------------------
+
+def pipeline_examples():
+    numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    evens_squared = Pipeline(numbers).filter(X % 2 == 0).map(X ** 2)
+    print(f"Pipeline: {evens_squared!r}")
+    print(f"to_list: {evens_squared.to_list()}")
+    print(f"Product of squares of even numbers: {evens_squared.reduce('prod')}")
+    print(f"With a plain function: {Pipeline(numbers).map(str).filter(str.isdigit).count()}")
+
+    stats = PipelineStats()
+    Pipeline(range(100_000)).map(X * 3).filter((X % 7 == 0) | (X % 5 == 0)).sum(stats=stats)
+    print(stats.report())
+
+
+def benchmark_pipeline(n=10_000_000, workers=4):
+    """Compare exercise 7's map/filter/reduce chain with fused, lowered and parallel runs"""
+    from functools import reduce
+
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    numbers = list(range(n))
+    array = np.arange(n, dtype=np.int64)
+    chain = Pipeline(numbers).filter(X % 3 == 0).map(X * X + 1)
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        print(f"{label:<40} {time.perf_counter() - start:8.3f}s  -> {result}")
+
+    print(f"n = {n:,}: sum of x*x + 1 over multiples of 3")
+    timed("map/filter/reduce with lambdas",
+          lambda: reduce(lambda a, b: a + b,
+                         map(lambda x: x * x + 1, filter(lambda x: x % 3 == 0, numbers))))
+    timed("intermediate list comprehensions",
+          lambda: sum([x * x + 1 for x in [x for x in numbers if x % 3 == 0]]))
+    timed("Pipeline (fused loop)", chain.sum)
+    timed(f"Pipeline (fused, {workers} workers)", lambda: chain.sum(workers=workers))
+    lowered = Pipeline(array).filter(X % 3 == 0).map(X * X + 1)
+    timed("Pipeline (NumPy lowering)", lowered.sum)
+
+    stats = PipelineStats()
+    Pipeline(numbers[:n // 10]).filter(X % 3 == 0).map(X * X + 1).sum(stats=stats)
+    print("Per-stage timing on n / 10 (instrumented, unfused):")
+    print(stats.report())
+
+
+if __name__ == "__main__":
+    pipeline_examples()
@@ -0,0 +1,488 @@
+"""
+Selection: k-th Order Statistics, Top-k and Quantiles
+-----------------------------------------------------
+
+second_largest in exercises.py (exercise 1) hand-codes k = 2, and the usual
+way to get a percentile is sorted(values)[i], which costs O(n log n) to read
+one position. Selection finds the k-th smallest element in O(n):
+
+1. quickselect(): introselect. Quickselect with median-of-three pivots, which
+   falls back to median-of-medians pivots (guaranteed O(n)) when the
+   partitions stop shrinking
+2. top_k(): bounded heap over any iterable, O(n log k) time and O(k) memory;
+   top_k_array() uses np.argpartition
+3. quantiles(): several quantiles from one recursive multi-selection
+   (np.partition with every rank at once for arrays), interpolated like
+   np.quantile's default "linear" method
+4. KLLSketch: streaming approximate quantiles in O(k log(n / k)) memory
+   (Karnin, Lang and Liberty), mergeable across shards
+
+NumPy is only imported by the *_array functions.
+"""
+
+import heapq
+
+
+# -----------------------------------------------------
+# 1. INTROSELECT
+# -----------------------------------------------------
+
+def _partition(items, lo, hi, pivot):
+    """
+    Three-way partition items[lo:hi] around pivot.
+    Returns (lt, gt): items[lo:lt] < pivot, items[lt:gt] == pivot, items[gt:hi] > pivot
+    """
+    lt, i, gt = lo, lo, hi
+    while i < gt:
+        x = items[i]
+        if x < pivot:
+            items[lt], items[i] = x, items[lt]
+            lt += 1
+            i += 1
+        elif pivot < x:
+            gt -= 1
+            items[gt], items[i] = x, items[gt]
+        else:
+            i += 1
+    return lt, gt
+
+
+def _median_of_medians(items, lo, hi):
+    """Pivot guaranteed to have at least ~30% of items[lo:hi] on each side"""
+    if hi - lo <= 5:
+        return sorted(items[lo:hi])[(hi - lo - 1) // 2]
+    medians = [sorted(items[i:min(i + 5, hi)])[(min(i + 5, hi) - i - 1) // 2]
+               for i in range(lo, hi, 5)]
+    return _select(medians, 0, len(medians), (len(medians) - 1) // 2, 0)
+
+
+def _select(items, lo, hi, k, budget):
+    """k-th smallest of items[lo:hi] (k is an absolute index), partially reordering items"""
+    while hi - lo > 1:
+        if budget > 0:
+            a, b, c = items[lo], items[(lo + hi) // 2], items[hi - 1]
+            pivot = sorted((a, b, c))[1]
+        else:
+            pivot = _median_of_medians(items, lo, hi)
+        size = hi - lo
+        lt, gt = _partition(items, lo, hi, pivot)
+        if k < lt:
+            hi = lt
+        elif k >= gt:
+            lo = gt
+        else:
+            return pivot
+        # A partition that kept more than half the range counts as a bad step
+        if (hi - lo) * 2 > size:
+            budget -= 1
+    return items[lo]
+
+
+def quickselect(values, k):
+    """
+    k-th smallest element (0-based) with introselect.
+    Time Complexity: O(n) average and worst case
+    Space Complexity: O(n) for the working copy
+
+    Args:
+        values: Iterable of mutually comparable items
+        k: Rank to select; negative k counts from the largest (-1 = maximum)
+
+    Returns:
+        The element that sorted(values)[k] would return
+    """
+    items = list(values)
+    n = len(items)
+    if not -n <= k < n:
+        raise IndexError(f"rank {k} out of range for {n} items")
+    k %= n
+    return _select(items, 0, n, k, 2 * n.bit_length())
+
+
+def median_of_medians_select(values, k):
+    """
+    k-th smallest element using only median-of-medians pivots.
+    Time Complexity: O(n) worst case (with a larger constant than quickselect)
+    Space Complexity: O(n)
+    """
+    items = list(values)
+    n = len(items)
+    if not -n <= k < n:
+        raise IndexError(f"rank {k} out of range for {n} items")
+    return _select(items, 0, n, k % n, 0)
+
+
+def kth_largest(values, k):
+    """
+    k-th largest element, 1-based (k = 2 is exercise 1's second_largest,
+    except that duplicates of the maximum count as separate elements).
+    Time Complexity: O(n)
+    """
+    return quickselect(values, -k)
+
+
+# -----------------------------------------------------
+# 2. TOP-K
+# -----------------------------------------------------
+
+def top_k(iterable, k, key=None, largest=True):
+    """
+    The k largest (or smallest) items of a stream, best first.
+    Time Complexity: O(n log k)
+    Space Complexity: O(k) - only a k-item heap is kept
+
+    heapq.nlargest / nsmallest keep a bounded heap and are stable: ties
+    keep arrival order, as in sorted(..., reverse=True)[:k].
+
+    Args:
+        iterable: Any iterable, consumed once
+        k: Number of items to keep
+        key: Optional key function
+        largest: Keep the largest items (False keeps the smallest)
+
+    Returns:
+        List of up to k items
+    """
+    if k <= 0:
+        return []
+    pick = heapq.nlargest if largest else heapq.nsmallest
+    return pick(k, iterable, key=key)
+
+
+def top_k_array(values, k, largest=True):
+    """
+    Indices of the k largest (or smallest) entries of an array, best first.
+    Time Complexity: O(n + k log k) - np.partition for the cutoff value,
+                     masks, then a sort of k items
+    Space Complexity: O(n) for the masks and index array
+
+    Selection is stable: among entries tied at the cutoff value, the lowest
+    indices are kept, and ties come out in index order. NaNs rank above
+    every number, as in np.sort.
+
+    Returns:
+        Index array of length min(k, n); values[result] are the top values
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    values = np.asarray(values)
+    n = len(values)
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    # No negation: -values wraps for unsigned dtypes and fails for bool
+    if k == n:
+        idx = np.arange(n)
+    else:
+        cut = n - k if largest else k - 1
+        threshold = np.partition(values, cut)[cut]
+        if threshold != threshold:
+            # NaN cutoff: the NaNs are the ties, and only numbers rank below
+            tied = np.isnan(values)
+            better = np.zeros(n, dtype=bool) if largest else ~tied
+        else:
+            tied = values == threshold
+            better = values > threshold if largest else values < threshold
+            if largest and values.dtype.kind in "fc":
+                better |= np.isnan(values)
+        # argpartition would keep an arbitrary subset of the ties
+        ties = np.flatnonzero(tied)[:k - np.count_nonzero(better)]
+        idx = np.concatenate((np.flatnonzero(better), ties))
+    if largest:
+        # Ascending by (value, -index), reversed: ties keep index order
+        return idx[np.lexsort((-idx, values[idx]))[::-1]]
+    return idx[np.lexsort((idx, values[idx]))]
+
+
+# -----------------------------------------------------
+# 3. MULTI-QUANTILE SELECTION
+# -----------------------------------------------------
+
+def _quantile_ranks(n, qs):
+    ranks = []
+    for q in qs:
+        if not 0 <= q <= 1:
+            raise ValueError(f"quantile must be in [0, 1], got {q}")
+        h = (n - 1) * q
+        lower = int(h)
+        ranks.append((lower, min(lower + 1, n - 1), h - lower))
+    return ranks
+
+
+def multiselect(values, ranks):
+    """
+    Elements at several ranks from one recursive selection.
+    Time Complexity: O(n log m) for m ranks - each partition splits the ranks
+    Space Complexity: O(n)
+
+    Returns:
+        Dict {rank: element}
+    """
+    items = list(values)
+    n = len(items)
+    wanted = sorted(set(r % n if -n <= r < n else _bad_rank(r, n) for r in ranks))
+    found = {}
+    stack = [(0, n, 0, len(wanted))]
+    while stack:
+        lo, hi, first, last = stack.pop()
+        if first >= last:
+            continue
+        if hi - lo <= 16:
+            block = sorted(items[lo:hi])
+            for r in wanted[first:last]:
+                found[r] = block[r - lo]
+            continue
+        a, b, c = items[lo], items[(lo + hi) // 2], items[hi - 1]
+        pivot = sorted((a, b, c))[1]
+        lt, gt = _partition(items, lo, hi, pivot)
+        i = first
+        while i < last and wanted[i] < lt:
+            i += 1
+        j = i
+        while j < last and wanted[j] < gt:
+            found[wanted[j]] = pivot
+            j += 1
+        stack.append((lo, lt, first, i))
+        stack.append((gt, hi, j, last))
+    return {r: found[r % n] for r in ranks}
+
+
+def _bad_rank(rank, n):
+    raise IndexError(f"rank {rank} out of range for {n} items")
+
+
+def quantiles(values, qs):
+    """
+    Several quantiles at once, interpolated like np.quantile(method="linear").
+    Time Complexity: O(n log m) for m quantiles, instead of O(n log n) sorting
+    Space Complexity: O(n)
+
+    Args:
+        values: Iterable of numbers
+        qs: Quantiles in [0, 1] (e.g. 0.5, 0.95, 0.99)
+
+    Returns:
+        List of quantile values, in the order of qs
+    """
+    items = list(values)
+    if not items:
+        raise ValueError("quantiles of an empty sequence")
+    ranks = _quantile_ranks(len(items), qs)
+    picked = multiselect(items, [r for lower, upper, _ in ranks for r in (lower, upper)])
+    return [picked[lower] + (picked[upper] - picked[lower]) * frac if frac else picked[lower]
+            for lower, upper, frac in ranks]
+
+
+def quantiles_array(values, qs):
+    """
+    Several quantiles of an array with a single np.partition over all ranks.
+    Time Complexity: O(n log m)
+    Space Complexity: O(n) for the partitioned copy
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    values = np.asarray(values)
+    if values.size == 0:
+        raise ValueError("quantiles of an empty array")
+    ranks = _quantile_ranks(len(values), qs)
+    kth = sorted({r for lower, upper, _ in ranks for r in (lower, upper)})
+    part = np.partition(values, kth)
+    lower = part[[r[0] for r in ranks]]
+    upper = part[[r[1] for r in ranks]]
+    frac = np.array([r[2] for r in ranks])
+    return lower + (upper - lower) * frac
+
+
+# -----------------------------------------------------
+# 4. STREAMING QUANTILES: KLL SKETCH
+# -----------------------------------------------------
+
+class KLLSketch:
+    """
+    Mergeable streaming quantile sketch.
+
+    Items live in compactors (levels); an item at level h stands for 2**h
+    inputs. When a level overflows its capacity it is sorted and every other
+    item (random offset) is promoted to the next level, halving it. Level
+    capacities shrink geometrically (factor 2/3) below the top level, so
+    memory stays O(k) items plus O(log(n / k)) small levels, and rank error
+    is about 1.7 / k of n with high probability.
+    """
+
+    C = 2 / 3
+
+    def __init__(self, k=200, seed=None):
+        if k < 8:
+            raise ValueError(f"k must be >= 8, got {k}")
+        self.k = k
+        self.levels = [[]]
+        self.count = 0
+        self.size = 0
+        self.min = None
+        self.max = None
+        import random
+
+        self._random = random.Random(seed)
+        self._limit = self._max_size()
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(self.k * self.C ** depth) + 1)
+
+    def update(self, value):
+        """Add one value. Time Complexity: O(1) amortized (O(k log k) per compaction)"""
+        self.levels[0].append(value)
+        self.count += 1
+        self.size += 1
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or self.max < value:
+            self.max = value
+        if self.size >= self._limit:
+            self._compress()
+
+    def extend(self, values):
+        for value in values:
+            self.update(value)
+        return self
+
+    def _max_size(self):
+        return sum(self._capacity(h) for h in range(len(self.levels)))
+
+    def _compress(self):
+        for h in range(len(self.levels)):
+            if len(self.levels[h]) >= self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append([])
+                    self._limit = self._max_size()
+                level = sorted(self.levels[h])
+                # An odd item stays behind so the promoted half is exact
+                keep = [level.pop()] if len(level) % 2 else []
+                offset = self._random.getrandbits(1)
+                self.levels[h + 1].extend(level[offset::2])
+                self.size -= len(level) - len(level[offset::2])
+                self.levels[h] = keep
+                break
+
+    def merge(self, other):
+        """Fold another sketch (e.g. from another shard) into this one"""
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        self._limit = self._max_size()
+        for h, level in enumerate(other.levels):
+            self.levels[h].extend(level)
+        self.count += other.count
+        self.size += other.size
+        for bound in (other.min, other.max):
+            if bound is not None:
+                if self.min is None or bound < self.min:
+                    self.min = bound
+                if self.max is None or self.max < bound:
+                    self.max = bound
+        while self.size >= self._limit:
+            self._compress()
+        return self
+
+    def _weighted(self):
+        return sorted((x, 1 << h) for h, level in enumerate(self.levels) for x in level)
+
+    def rank(self, value):
+        """Approximate number of inputs <= value"""
+        return sum(w for x, w in self._weighted() if not value < x)
+
+    def quantile(self, q):
+        """Approximate q-quantile, q in [0, 1]"""
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs):
+        """Approximate quantiles for several q at once (one sort of the sketch)"""
+        if not self.count:
+            raise ValueError("quantiles of an empty sketch")
+        pairs = self._weighted()
+        total = sum(w for _, w in pairs)
+        results = []
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError(f"quantile must be in [0, 1], got {q}")
+            if q == 0:
+                results.append(self.min)
+                continue
+            if q == 1:
+                results.append(self.max)
+                continue
+            target = q * total
+            seen = 0
+            for x, w in pairs:
+                seen += w
+                if seen >= target:
+                    results.append(x)
+                    break
+            else:
+                results.append(self.max)
+        return results
+
+    def __len__(self):
+        return self.count
+
+    def retained(self):
+        """Number of items actually stored"""
+        return self.size
+
+
+# -----------------------------------------------------
+# EXAMPLES AND BENCHMARK
+# -----------------------------------------------------
+
+def selection_examples():
+    numbers = [12, 45, 2, 41, 45, 10, 8, 33, 27, 19]
+    print(f"Numbers: {numbers}")
+    print(f"quickselect(numbers, 0) (minimum): {quickselect(numbers, 0)}")
+    print(f"kth_largest(numbers, 3): {kth_largest(numbers, 3)}")
+    print(f"median_of_medians_select(numbers, 4): {median_of_medians_select(numbers, 4)}")
+    print(f"top_k(numbers, 3): {top_k(numbers, 3)}")
+    print(f"top_k(numbers, 3, largest=False): {top_k(numbers, 3, largest=False)}")
+    print(f"quantiles p50/p90/p99: {quantiles(numbers, [0.5, 0.9, 0.99])}")
+
+    sketch = KLLSketch(k=100, seed=0).extend(range(100_000))
+    print(f"KLL p50/p99 of 0..99999: {sketch.quantiles([0.5, 0.99])} "
+          f"keeping {sketch.retained()} items")
+
+
+def benchmark_selection(n=1_000_000, k=100):
+    """Compare sorting with selection for order statistics, top-k and percentiles"""
+    import random
+    import time
+
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    rng = random.Random(0)
+    values = [rng.random() for _ in range(n)]
+    array = np.array(values)
+    qs = [0.5, 0.9, 0.95, 0.99, 0.999]
+
+    def timed(label, fn, *args):
+        start = time.perf_counter()
+        fn(*args)
+        print(f"{label:<40} {time.perf_counter() - start:8.3f}s")
+
+    print(f"n = {n:,}")
+    timed("sorted()[n // 2]", lambda: sorted(values)[n // 2])
+    timed("quickselect (introselect)", quickselect, values, n // 2)
+    timed("median_of_medians_select", median_of_medians_select, values, n // 2)
+    timed(f"sorted()[-{k}:]", lambda: sorted(values)[-k:])
+    timed(f"top_k({k}) (bounded heap)", top_k, values, k)
+    timed(f"top_k_array({k})", top_k_array, array, k)
+    timed("5 percentiles by sorting", lambda: [sorted(values)[int((n - 1) * q)] for q in qs])
+    timed("quantiles (multiselect)", quantiles, values, qs)
+    timed("np.quantile", np.quantile, array, qs)
+    timed("quantiles_array (one np.partition)", quantiles_array, array, qs)
+
+    sketch = KLLSketch(k=200, seed=0)
+    timed("KLLSketch.extend", sketch.extend, values)
+    exact = np.quantile(array, qs)
+    errors = [abs(a - b) for a, b in zip(sketch.quantiles(qs), exact)]
+    print(f"KLL: {sketch.retained()} items kept, max rank error ~{max(errors):.4f} of n")
+
+
+if __name__ == "__main__":
+    selection_examples()
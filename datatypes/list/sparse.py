@@ -0,0 +1,521 @@
+"""
+Sparse Matrices: COO, CSR and CSC
+---------------------------------
+
+Section 4 of list.py builds matrices as lists of lists. Every cell is a
+pointer to a Python object, so a 10k x 10k matrix that is 99.9% zeros
+still costs 800 MB of pointers, and a dense NumPy array of it costs as
+much. Sparse formats store only the non-zeros:
+
+1. SparseBuilder: appends (row, col, value) triplets into compact
+   array.array buffers; duplicates are summed when the matrix is built
+2. COOMatrix: parallel row / col / value arrays. Easy to build and convert
+   (from nested lists or dict-of-dicts)
+3. CSRMatrix: rows compressed with an indptr offsets array (row i is
+   data[indptr[i]:indptr[i + 1]]). Fast row slicing, matrix-vector and
+   matrix-matrix products
+4. CSCMatrix: the same layout by columns (CSR of the transpose). Fast
+   column slicing and products with the transpose
+
+All formats keep NumPy arrays (int64 indices); NumPy is imported lazily.
+"""
+
+from array import array
+from numbers import Integral
+
+
+def _expand(indptr):
+    """Row (or column) index of every stored entry: the inverse of compressing"""
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    return np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+
+
+def _compress(major, minor, data, n_major, sum_duplicates=True):
+    """
+    Sort triplets by (major, minor), sum duplicates and compress major.
+    Time Complexity: O(nnz log nnz)
+    Returns (indptr, indices, data)
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    order = np.lexsort((minor, major))
+    major, minor, data = major[order], minor[order], data[order]
+    if sum_duplicates and len(major):
+        first = np.ones(len(major), dtype=bool)
+        first[1:] = (major[1:] != major[:-1]) | (minor[1:] != minor[:-1])
+        starts = np.flatnonzero(first)
+        data = np.add.reduceat(data, starts)
+        major, minor = major[starts], minor[starts]
+    indptr = np.zeros(n_major + 1, dtype=np.int64)
+    np.cumsum(np.bincount(major, minlength=n_major), out=indptr[1:])
+    return indptr, minor.astype(np.int64, copy=False), data
+
+
+# -----------------------------------------------------
+# 1. BUILDER
+# -----------------------------------------------------
+
+class SparseBuilder:
+    """
+    Accumulates (row, col, value) entries; repeated positions are summed.
+
+    Entries go into array.array buffers (8 bytes each), so building costs
+    24 bytes per entry instead of a tuple per entry. Values are stored with
+    `typecode`: the default "d" is float64; pass "q" to keep int64 values
+    exact past 2^53.
+    """
+
+    def __init__(self, shape=None, typecode="d"):
+        self.shape = shape
+        self.rows = array("q")
+        self.cols = array("q")
+        self.values = array(typecode)
+
+    def add(self, row, col, value=1):
+        self.rows.append(row)
+        self.cols.append(col)
+        self.values.append(value)
+
+    def add_many(self, rows, cols, values):
+        """Append parallel sequences (lists, arrays or ndarrays) of entries"""
+        if not len(rows) == len(cols) == len(values):
+            raise ValueError("rows, cols and values must have the same length")
+        for buffer, items in ((self.rows, rows), (self.cols, cols), (self.values, values)):
+            if hasattr(items, "tobytes") and not isinstance(items, array):
+                import numpy as np  # If NumPy is not installed, run: pip install numpy
+                buffer.frombytes(np.asarray(items, dtype=buffer.typecode).tobytes())
+            else:
+                buffer.extend(items)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def build_coo(self):
+        """COOMatrix of the entries, duplicates summed, sorted by row then column"""
+        return self.build_csr().to_coo()
+
+    def build_csr(self):
+        """
+        CSRMatrix of the entries, duplicates summed.
+        Time Complexity: O(nnz log nnz)
+        """
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        rows = np.frombuffer(self.rows, dtype=np.int64)
+        cols = np.frombuffer(self.cols, dtype=np.int64)
+        values = np.frombuffer(self.values, dtype=self.values.typecode)
+        shape = self.shape or ((int(rows.max()) + 1, int(cols.max()) + 1) if len(rows) else (0, 0))
+        _check_bounds(rows, cols, shape)
+        return CSRMatrix(shape, *_compress(rows, cols, values, shape[0]))
+
+    def build_csc(self):
+        return self.build_csr().to_csc()
+
+
+def _scatter_sum(ids, values, n):
+    """out[i] = sum of values[ids == i]; integer values stay integers"""
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    if values.dtype.kind == "f":
+        return np.bincount(ids, values, n)
+    if values.dtype.kind == "c":
+        return np.bincount(ids, values.real, n) + 1j * np.bincount(ids, values.imag, n)
+    # bincount weights go through float64 and round integers past 2^53
+    out = np.zeros(n, dtype=np.int64 if values.dtype.kind == "b" else values.dtype)
+    np.add.at(out, ids, values)
+    return out
+
+
+def _check_bounds(rows, cols, shape):
+    if len(rows) and (rows.min() < 0 or cols.min() < 0
+                      or rows.max() >= shape[0] or cols.max() >= shape[1]):
+        raise IndexError(f"entry outside a matrix of shape {shape}")
+
+
+# -----------------------------------------------------
+# 2. COO
+# -----------------------------------------------------
+
+class COOMatrix:
+    """Coordinate format: entry k is data[k] at (rows[k], cols[k])"""
+
+    def __init__(self, shape, rows, cols, data):
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        self.shape = tuple(shape)
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self.cols = np.asarray(cols, dtype=np.int64)
+        self.data = np.asarray(data)
+        if not len(self.rows) == len(self.cols) == len(self.data):
+            raise ValueError("rows, cols and data must have the same length")
+        _check_bounds(self.rows, self.cols, self.shape)
+
+    @classmethod
+    def from_lists(cls, nested):
+        """
+        From a list-of-lists matrix (list.py section 4), keeping non-zeros.
+        Time Complexity: O(n * m) - every cell is read once
+
+        Integer matrices stay int64; the first non-integer value switches
+        the values to float64.
+        """
+        builder = SparseBuilder(typecode="q")
+        n_cols = 0
+        for i, row in enumerate(nested):
+            n_cols = max(n_cols, len(row))
+            for j, value in enumerate(row):
+                if value:
+                    if builder.values.typecode == "q" and not isinstance(value, Integral):
+                        builder.values = array("d", builder.values)
+                    builder.add(i, j, value)
+        builder.shape = (len(nested), n_cols)
+        return builder.build_coo()
+
+    @classmethod
+    def from_dict(cls, rows, shape=None):
+        """
+        From a dict-of-dicts {row: {col: value}}.
+        Time Complexity: O(nnz)
+        """
+        builder = SparseBuilder(shape)
+        for i, columns in rows.items():
+            for j, value in columns.items():
+                builder.add(i, j, value)
+        return builder.build_coo()
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def to_csr(self):
+        return CSRMatrix(self.shape, *_compress(self.rows, self.cols, self.data, self.shape[0]))
+
+    def to_csc(self):
+        return CSCMatrix(self.shape, *_compress(self.cols, self.rows, self.data, self.shape[1]))
+
+    def to_dense(self):
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        dense = np.zeros(self.shape, dtype=self.data.dtype)
+        np.add.at(dense, (self.rows, self.cols), self.data)
+        return dense
+
+    def to_lists(self):
+        return self.to_dense().tolist()
+
+    def to_dict(self):
+        """dict-of-dicts {row: {col: value}} of the non-zeros"""
+        result = {}
+        for i, j, value in zip(self.rows.tolist(), self.cols.tolist(), self.data.tolist()):
+            row = result.setdefault(i, {})
+            row[j] = row.get(j, 0) + value
+        return result
+
+    def memory_usage(self):
+        return self.rows.nbytes + self.cols.nbytes + self.data.nbytes
+
+    def __repr__(self):
+        return f"COOMatrix(shape={self.shape}, nnz={self.nnz})"
+
+
+# -----------------------------------------------------
+# 3. CSR / CSC
+# -----------------------------------------------------
+
+class _Compressed:
+    """Shared layout of CSR (major axis = rows) and CSC (major axis = columns)"""
+
+    def __init__(self, shape, indptr, indices, data):
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        self.shape = tuple(shape)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data)
+        if len(self.indptr) != self.shape[self._major] + 1:
+            raise ValueError(f"indptr needs {self.shape[self._major] + 1} entries")
+        self._major_ids = None
+
+    @property
+    def nnz(self):
+        return int(self.indptr[-1])
+
+    def major_ids(self):
+        """Major-axis index of every stored entry (cached)"""
+        if self._major_ids is None:
+            self._major_ids = _expand(self.indptr)
+        return self._major_ids
+
+    def memory_usage(self):
+        """Bytes held by indptr, indices and data"""
+        return self.indptr.nbytes + self.indices.nbytes + self.data.nbytes
+
+    def to_dense(self):
+        return self.to_coo().to_dense()
+
+    def to_lists(self):
+        return self.to_dense().tolist()
+
+    def __repr__(self):
+        return f"{type(self).__name__}(shape={self.shape}, nnz={self.nnz})"
+
+    def _slice_major(self, index):
+        """Zero-copy slice of a contiguous major range (indices / data are views)"""
+        start, stop, step = index.indices(self.shape[self._major])
+        if step != 1:
+            return self._take_major(range(start, stop, step))
+        stop = max(start, stop)
+        lo, hi = self.indptr[start], self.indptr[stop]
+        shape = list(self.shape)
+        shape[self._major] = stop - start
+        return type(self)(shape, self.indptr[start:stop + 1] - lo,
+                          self.indices[lo:hi], self.data[lo:hi])
+
+    def _take_major(self, selection):
+        """Gather arbitrary rows (CSR) or columns (CSC), in the given order"""
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        selection = np.asarray(selection, dtype=np.int64)
+        n = self.shape[self._major]
+        if len(selection) and (selection.min() < -n or selection.max() >= n):
+            raise IndexError(f"index out of range for {n} {('rows', 'columns')[self._major]}")
+        selection = selection % max(n, 1)
+        starts, stops = self.indptr[selection], self.indptr[selection + 1]
+        lengths = stops - starts
+        indptr = np.zeros(len(selection) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        # Positions of every selected entry: each run starts[k] .. stops[k]
+        positions = np.arange(indptr[-1]) - np.repeat(indptr[:-1] - starts, lengths)
+        shape = list(self.shape)
+        shape[self._major] = len(selection)
+        return type(self)(shape, indptr, self.indices[positions], self.data[positions])
+
+
+class CSRMatrix(_Compressed):
+    """
+    Compressed sparse rows: row i has columns indices[indptr[i]:indptr[i + 1]]
+    and values data[indptr[i]:indptr[i + 1]].
+    """
+
+    _major = 0
+
+    def __getitem__(self, index):
+        """A slice of rows gives a CSRMatrix; an int gives (columns, values) views"""
+        if isinstance(index, slice):
+            return self._slice_major(index)
+        if isinstance(index, Integral):  # Not ndarrays, which also have __index__
+            index = index.__index__()
+            n = self.shape[0]
+            if not -n <= index < n:
+                raise IndexError("row index out of range")
+            index %= n
+            lo, hi = self.indptr[index], self.indptr[index + 1]
+            return self.indices[lo:hi], self.data[lo:hi]
+        return self._take_major(index)
+
+    def row_dense(self, i):
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        columns, values = self[i]
+        row = np.zeros(self.shape[1], dtype=self.data.dtype)
+        row[columns] = values
+        return row
+
+    def to_coo(self):
+        return COOMatrix(self.shape, self.major_ids(), self.indices, self.data)
+
+    def to_csc(self):
+        return CSCMatrix(self.shape, *_compress(self.indices, self.major_ids(), self.data,
+                                                self.shape[1], sum_duplicates=False))
+
+    def transpose(self):
+        """The transpose as a CSCMatrix sharing these arrays (O(1))"""
+        return CSCMatrix(self.shape[::-1], self.indptr, self.indices, self.data)
+
+    T = property(transpose)
+
+    def matvec(self, x):
+        """
+        y = A @ x.
+        Time Complexity: O(nnz + n)
+        Space Complexity: O(nnz) for the products
+        """
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        x = np.asarray(x)
+        if x.shape != (self.shape[1],):
+            raise ValueError(f"vector of length {self.shape[1]} expected, got shape {x.shape}")
+        return _scatter_sum(self.major_ids(), self.data * x[self.indices], self.shape[0])
+
+    def matmat(self, other):
+        """
+        A @ B for a dense 2-D ndarray B (dense result) or a sparse B (CSR result).
+        Time Complexity: O(nnz * k) for dense B with k columns; for sparse B,
+                         O(p log p) where p is the number of partial products
+        """
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        if isinstance(other, CSCMatrix):
+            other = other.to_csr()
+        if isinstance(other, CSRMatrix):
+            return self._matmat_sparse(other)
+        other = np.asarray(other)
+        if other.ndim != 2 or other.shape[0] != self.shape[1]:
+            raise ValueError(f"shapes {self.shape} and {other.shape} are not aligned")
+        return np.column_stack([self.matvec(other[:, k]) for k in range(other.shape[1])]) \
+            if other.shape[1] else np.zeros((self.shape[0], 0))
+
+    def _matmat_sparse(self, other):
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"shapes {self.shape} and {other.shape} are not aligned")
+        # Entry (i, k, a) of A pairs with every entry (k, j, b) of row k of B
+        counts = other.indptr[self.indices + 1] - other.indptr[self.indices]
+        total = int(counts.sum())
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        positions = (np.arange(total)
+                     - np.repeat(offsets[:-1] - other.indptr[self.indices], counts))
+        rows = np.repeat(self.major_ids(), counts)
+        values = np.repeat(self.data, counts) * other.data[positions]
+        shape = (self.shape[0], other.shape[1])
+        return CSRMatrix(shape, *_compress(rows, other.indices[positions], values, shape[0]))
+
+    def __matmul__(self, other):
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        if isinstance(other, _Compressed):
+            return self.matmat(other)
+        other = np.asarray(other)
+        return self.matvec(other) if other.ndim == 1 else self.matmat(other)
+
+
+class CSCMatrix(_Compressed):
+    """
+    Compressed sparse columns: column j has rows indices[indptr[j]:indptr[j + 1]]
+    and values data[indptr[j]:indptr[j + 1]].
+    """
+
+    _major = 1
+
+    def column(self, j):
+        """(rows, values) views of column j"""
+        n = self.shape[1]
+        if not -n <= j < n:
+            raise IndexError("column index out of range")
+        j %= n
+        lo, hi = self.indptr[j], self.indptr[j + 1]
+        return self.indices[lo:hi], self.data[lo:hi]
+
+    def columns(self, index):
+        """A slice (zero-copy) or list of columns, as a CSCMatrix"""
+        if isinstance(index, slice):
+            return self._slice_major(index)
+        return self._take_major(index)
+
+    def to_coo(self):
+        return COOMatrix(self.shape, self.indices, self.major_ids(), self.data)
+
+    def to_csr(self):
+        return CSRMatrix(self.shape, *_compress(self.indices, self.major_ids(), self.data,
+                                                self.shape[0], sum_duplicates=False))
+
+    def transpose(self):
+        """The transpose as a CSRMatrix sharing these arrays (O(1))"""
+        return CSRMatrix(self.shape[::-1], self.indptr, self.indices, self.data)
+
+    T = property(transpose)
+
+    def matvec(self, x):
+        """
+        y = A @ x, scattering each column times x[j].
+        Time Complexity: O(nnz + n)
+        """
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        x = np.asarray(x)
+        if x.shape != (self.shape[1],):
+            raise ValueError(f"vector of length {self.shape[1]} expected, got shape {x.shape}")
+        return _scatter_sum(self.indices, self.data * x[self.major_ids()], self.shape[0])
+
+    def __matmul__(self, other):
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+        if isinstance(other, _Compressed):
+            return self.to_csr().matmat(other)
+        other = np.asarray(other)
+        if other.ndim == 1:
+            return self.matvec(other)
+        return self.to_csr().matmat(other)
+
+
+# -----------------------------------------------------
+# EXAMPLES AND BENCHMARK
+# -----------------------------------------------------
+
+def list_matrix_bytes(nested):
+    """Bytes of a list-of-lists matrix: the lists plus every distinct cell object"""
+    import sys
+
+    total = sys.getsizeof(nested)
+    seen = set()
+    for row in nested:
+        total += sys.getsizeof(row)
+        for value in row:
+            if id(value) not in seen:
+                seen.add(id(value))
+                total += sys.getsizeof(value)
+    return total
+
+
+def sparse_examples():
+    matrix = [
+        [0, 0, 3, 0],
+        [4, 0, 0, 0],
+        [0, 0, 0, 0],
+        [0, 5, 0, 6],
+    ]
+    csr = COOMatrix.from_lists(matrix).to_csr()
+    print(f"From list of lists: {csr}")
+    print(f"indptr={csr.indptr.tolist()} indices={csr.indices.tolist()} data={csr.data.tolist()}")
+    print(f"A @ [1, 2, 3, 4] = {(csr @ [1, 2, 3, 4]).tolist()}")
+    print(f"Rows 1:4 as lists: {csr[1:4].to_lists()}")
+    print(f"A @ A: {(csr @ csr).to_lists()}")
+
+    builder = SparseBuilder((3, 3))
+    for i, j, v in [(0, 0, 1), (2, 1, 2), (0, 0, 5), (1, 2, 3)]:
+        builder.add(i, j, v)
+    print(f"Builder with a repeated (0, 0): {builder.build_csr().to_lists()}")
+
+    ratings = {0: {1: 5.0}, 2: {0: 3.0, 2: 4.0}}
+    csc = COOMatrix.from_dict(ratings, shape=(3, 3)).to_csc()
+    print(f"From dict of dicts, column 0: {[a.tolist() for a in csc.column(0)]}")
+
+
+def benchmark_sparse(n=4_000, density=0.001, k=16):
+    """Compare memory and products of a list-of-lists matrix with CSR"""
+    import random
+    import time
+
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    rng = random.Random(0)
+    nnz = int(n * n * density)
+    builder = SparseBuilder((n, n))
+    for _ in range(nnz):
+        builder.add(rng.randrange(n), rng.randrange(n), rng.random())
+    csr = builder.build_csr()
+    dense = csr.to_dense()
+    nested = dense.tolist()
+    x = np.arange(n, dtype=np.float64)
+    x_list = x.tolist()
+    block = np.ones((n, k))
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        fn()
+        print(f"{label:<40} {time.perf_counter() - start:9.4f}s")
+
+    print(f"n = {n:,}, density = {density}, nnz = {csr.nnz:,}")
+    print(f"{'list of lists':<40} {list_matrix_bytes(nested) / 2**20:9.1f} MiB")
+    print(f"{'dense ndarray':<40} {dense.nbytes / 2**20:9.1f} MiB")
+    print(f"{'CSR':<40} {csr.memory_usage() / 2**20:9.1f} MiB")
+    timed("matvec, list of lists", lambda: [sum(a * b for a, b in zip(row, x_list)) for row in nested])
+    timed("matvec, dense ndarray", lambda: dense @ x)
+    timed("matvec, CSR", lambda: csr @ x)
+    timed("matvec, CSC", lambda: csr.to_csc() @ x)
+    timed(f"A @ (n x {k}) dense block, dense", lambda: dense @ block)
+    timed(f"A @ (n x {k}) dense block, CSR", lambda: csr @ block)
+    timed("A @ A, CSR (sparse result)", lambda: csr @ csr)
+    timed("row slice [n/4:n/2], list of lists", lambda: nested[n // 4:n // 2])
+    timed("row slice [n/4:n/2], CSR (views)", lambda: csr[n // 4:n // 2])
+
+
+if __name__ == "__main__":
+    sparse_examples()
@@ -0,0 +1,412 @@
+"""
+Sequence Views: Zero-Copy Rotate, Chunk and Flatten
+---------------------------------------------------
+
+flatten, chunk_list and rotate_list in exercises.py (exercise 6) each build
+a new list: rotate_list's lst[-k:] + lst[:-k] copies every element, and
+chaining them over a large buffer copies it again at every step. The
+helpers here only do index arithmetic over the original storage:
+
+1. RotatedView and SliceView: read (and write) through to the underlying
+   sequence in O(1) per access; rotating a view, or slicing it with step 1,
+   makes a new view
+2. chunks(): splits a buffer into memoryview slices (bytes, bytearray,
+   array.array), ndarray views or SliceViews, never copying elements
+3. RaggedArray: a CSR-style flattened layout, with one flat values buffer
+   plus an offsets array, whose rows are zero-copy slices
+4. rotate_in_place(): triple-reversal rotation when mutation is allowed,
+   O(n) time and O(1) extra space
+
+NumPy is only imported when an ndarray is involved.
+"""
+
+from collections.abc import Sequence
+
+
+def _is_ndarray(obj):
+    return type(obj).__module__ == "numpy" and type(obj).__name__ == "ndarray"
+
+
+def _normalize_index(index, n):
+    if index < 0:
+        index += n
+    if not 0 <= index < n:
+        raise IndexError("view index out of range")
+    return index
+
+
+# -----------------------------------------------------
+# 1. ROTATED AND SLICED VIEWS
+# -----------------------------------------------------
+
+class SliceView(Sequence):
+    """
+    Contiguous window [start, stop) of a sequence, without copying it.
+
+    Unlike seq[start:stop] on a list, creating a SliceView is O(1) and
+    writes go through to the underlying sequence.
+    """
+
+    __slots__ = ("base", "start", "stop")
+
+    def __init__(self, base, start=0, stop=None):
+        n = len(base)
+        start, stop, _ = slice(start, stop).indices(n)
+        self.base = base
+        self.start = start
+        self.stop = max(start, stop)
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return SliceView(self.base, self.start + start, self.start + max(start, stop))
+            return [self.base[self.start + i] for i in range(start, stop, step)]
+        return self.base[self.start + _normalize_index(index, len(self))]
+
+    def __setitem__(self, index, value):
+        self.base[self.start + _normalize_index(index, len(self))] = value
+
+    def __iter__(self):
+        base = self.base
+        for i in range(self.start, self.stop):
+            yield base[i]
+
+    def __repr__(self):
+        return f"SliceView({list(self)!r})"
+
+    def tolist(self):
+        """Copy the window out (one slice of the base)"""
+        if isinstance(self.base, RotatedView):
+            return self.base._copy(self.start, self.stop)
+        return list(self.base[self.start:self.stop])
+
+
+class RotatedView(Sequence):
+    """
+    Sequence rotated right by k, without moving any element.
+
+    view[i] is base[(i - k) % n], so RotatedView(lst, k) reads exactly like
+    exercises.py's rotate_list(lst, k). Rotating a view again only adds to
+    its offset. The view tracks the base's current length, so it stays valid
+    while the base is modified in place.
+    """
+
+    __slots__ = ("base", "shift")
+
+    def __init__(self, base, k=0):
+        if isinstance(base, RotatedView):
+            k += base.shift
+            base = base.base
+        self.base = base
+        self.shift = k
+
+    def __len__(self):
+        return len(self.base)
+
+    def _offset(self):
+        n = len(self.base)
+        return (n - self.shift % n) % n if n else 0
+
+    def __getitem__(self, index):
+        n = len(self.base)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(n)
+            if step == 1:
+                return SliceView(self, start, stop)
+            offset = self._offset()
+            return [self.base[(i + offset) % n] for i in range(start, stop, step)]
+        return self.base[(_normalize_index(index, n) + self._offset()) % n]
+
+    def _copy(self, start, stop):
+        """Helper: list of view[start:stop], as at most two slices of the base"""
+        n = len(self.base)
+        if start >= stop:
+            return []
+        offset = self._offset()
+        first, last = (start + offset) % n, (stop - 1 + offset) % n
+        if first <= last:
+            return list(self.base[first:last + 1])
+        return list(self.base[first:]) + list(self.base[:last + 1])
+
+    def __setitem__(self, index, value):
+        n = len(self.base)
+        self.base[(_normalize_index(index, n) + self._offset()) % n] = value
+
+    def __iter__(self):
+        offset = self._offset()
+        base = self.base
+        for i in range(offset, len(base)):
+            yield base[i]
+        for i in range(offset):
+            yield base[i]
+
+    def __repr__(self):
+        return f"RotatedView({list(self)!r})"
+
+    def rotate(self, k):
+        """Return a view rotated right by k more positions, in O(1)"""
+        return RotatedView(self.base, self.shift + k)
+
+    def tolist(self):
+        """Materialize the rotation (two slices of the base)"""
+        return self._copy(0, len(self.base))
+
+
+# -----------------------------------------------------
+# 2. ZERO-COPY CHUNKING
+# -----------------------------------------------------
+
+def chunk_bounds(length, size):
+    """
+    (start, stop) pairs covering range(length) in steps of size.
+    Time Complexity: O(length / size)
+    Space Complexity: O(1) per pair
+    """
+    if size < 1:
+        raise ValueError(f"chunk size must be >= 1, got {size}")
+    for start in range(0, length, size):
+        yield start, min(start + size, length)
+
+
+def chunks(buffer, size):
+    """
+    Split a buffer into consecutive chunks of at most size elements, without copying.
+    Time Complexity: O(n / size)
+    Space Complexity: O(1) per chunk
+
+    ndarrays yield ndarray views, objects supporting the buffer protocol
+    (bytes, bytearray, array.array, mmap) yield memoryview slices, and any
+    other sequence yields SliceViews. Writes through a chunk reach the
+    buffer whenever the buffer itself is writable.
+
+    Args:
+        buffer: Sequence or buffer-protocol object
+        size: Maximum chunk length (in elements)
+
+    Yields:
+        Views of buffer[i:i + size]
+    """
+    if _is_ndarray(buffer):
+        for start, stop in chunk_bounds(len(buffer), size):
+            yield buffer[start:stop]
+        return
+    try:
+        view = memoryview(buffer)
+    except TypeError:
+        for start, stop in chunk_bounds(len(buffer), size):
+            yield SliceView(buffer, start, stop)
+        return
+    if view.ndim != 1:
+        view = view.cast("B")
+    for start, stop in chunk_bounds(len(view), size):
+        yield view[start:stop]
+
+
+# -----------------------------------------------------
+# 3. RAGGED (CSR-STYLE) FLATTENING
+# -----------------------------------------------------
+
+class RaggedArray(Sequence):
+    """
+    List of variable-length rows stored as one flat buffer plus offsets.
+
+    Row i is values[offsets[i]:offsets[i + 1]]. values is the flattened
+    sequence, ready to use without another copy; rows come back as zero-copy
+    views (ndarray slices, memoryviews or SliceViews depending on storage).
+    """
+
+    __slots__ = ("values", "offsets")
+
+    def __init__(self, values, offsets):
+        if len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(values):
+            raise ValueError("offsets must start at 0 and end at len(values)")
+        self.values = values
+        self.offsets = offsets
+
+    @classmethod
+    def from_nested(cls, nested, typecode=None):
+        """
+        Flatten a nested iterable in one pass.
+        Time Complexity: O(total elements)
+        Space Complexity: O(total elements + rows)
+
+        Args:
+            nested: Iterable of iterables
+            typecode: array.array typecode for compact numeric storage;
+                      None keeps a plain list of values
+
+        Returns:
+            RaggedArray
+        """
+        from array import array
+
+        values = array(typecode) if typecode else []
+        offsets = array("q", [0])
+        for row in nested:
+            values.extend(row)
+            offsets.append(len(values))
+        return cls(values, offsets)
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """
+        Flatten a list of 1-D ndarrays with a single concatenate.
+        Time Complexity: O(total elements)
+        Space Complexity: O(total elements + rows)
+        """
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+        lengths = np.fromiter((len(a) for a in arrays), dtype=np.int64, count=len(arrays))
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        values = np.concatenate(arrays) if len(arrays) else np.empty(0)
+        return cls(values, offsets)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def row_length(self, index):
+        index = _normalize_index(index, len(self))
+        return int(self.offsets[index + 1] - self.offsets[index])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = _normalize_index(index, len(self))
+        start, stop = int(self.offsets[index]), int(self.offsets[index + 1])
+        if _is_ndarray(self.values):
+            return self.values[start:stop]
+        if isinstance(self.values, list):
+            return SliceView(self.values, start, stop)
+        return memoryview(self.values)[start:stop]
+
+    def __repr__(self):
+        return f"RaggedArray({[list(row) for row in self]!r})"
+
+    def row_ids(self):
+        """
+        Row index of every flat value (the CSR "expand offsets" step).
+        Time Complexity: O(total elements)
+        Space Complexity: O(total elements)
+        """
+        import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+        return np.repeat(np.arange(len(self)), np.diff(np.asarray(self.offsets)))
+
+
+# -----------------------------------------------------
+# 4. IN-PLACE ROTATION
+# -----------------------------------------------------
+
+def reverse_range(seq, lo, hi):
+    """
+    Reverse seq[lo:hi] in place.
+    Time Complexity: O(hi - lo)
+    Space Complexity: O(1) for lists; ndarrays use NumPy's overlap buffer
+    """
+    if _is_ndarray(seq):
+        seq[lo:hi] = seq[lo:hi][::-1]
+        return
+    if lo == 0 and hi == len(seq) and hasattr(seq, "reverse"):
+        seq.reverse()
+        return
+    hi -= 1
+    while lo < hi:
+        seq[lo], seq[hi] = seq[hi], seq[lo]
+        lo += 1
+        hi -= 1
+
+
+def rotate_in_place(seq, k):
+    """
+    Rotate a mutable sequence right by k positions using three reversals.
+    Time Complexity: O(n) - every element is moved twice
+    Space Complexity: O(1)
+
+    Same result as rotate_list(seq, k), but no second list is allocated:
+    reverse everything, then reverse the first k and the last n - k.
+
+    Returns:
+        seq (for chaining)
+    """
+    n = len(seq)
+    if n == 0:
+        return seq
+    k %= n
+    if k:
+        reverse_range(seq, 0, n)
+        reverse_range(seq, 0, k)
+        reverse_range(seq, k, n)
+    return seq
+
+
+# -----------------------------------------------------
+# EXAMPLES AND BENCHMARK
+# -----------------------------------------------------
+
+def views_examples():
+    from array import array
+
+    numbers = list(range(1, 11))
+    view = RotatedView(numbers, 3)
+    print(f"RotatedView(numbers, 3): {view}")
+    print(f"view[0], view[-1], view[2:5]: {view[0]}, {view[-1]}, {view[2:5]}")
+    print(f"Rotated again by -1: {view.rotate(-1)}")
+
+    print(f"SliceView chunks: {[chunk.tolist() for chunk in chunks(numbers, 4)]}")
+    data = array("i", numbers)
+    first = next(chunks(data, 4))
+    first[0] = 100
+    print(f"memoryview chunk write-through: {data.tolist()[:4]}")
+
+    ragged = RaggedArray.from_nested([[1, 2, 3], [4, 5], [6, 7, 8, 9]], typecode="i")
+    print(f"RaggedArray values: {ragged.values.tolist()}, offsets: {ragged.offsets.tolist()}")
+    print(f"Row 1: {ragged[1].tolist()}")
+
+    print(f"rotate_in_place(numbers, 3): {rotate_in_place(list(range(1, 11)), 3)}")
+
+
+def benchmark_views(n=10_000_000, chunk_size=1000):
+    """Compare the copying exercise helpers with the views"""
+    import time
+
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    numbers = list(range(n))
+    array = np.arange(n)
+    nested = [list(range(i, i + 10)) for i in range(0, n // 10, 10)]
+
+    def rotate_list(lst, k):  # exercise6_solution's rotate_list
+        k = k % len(lst)
+        return lst[-k:] + lst[:-k]
+
+    def chunk_list(lst, size):  # exercise6_solution's chunk_list
+        return [lst[i:i + size] for i in range(0, len(lst), size)]
+
+    def flatten(nested_lists):  # exercise6_solution's flatten
+        return [item for sublist in nested_lists for item in sublist]
+
+    def timed(label, fn, *args):
+        start = time.perf_counter()
+        fn(*args)
+        print(f"{label:<40} {time.perf_counter() - start:8.4f}s")
+
+    print(f"n = {n:,}")
+    timed("rotate_list (copy)", rotate_list, numbers, 12345)
+    timed("RotatedView + 1000 lookups", lambda: [RotatedView(numbers, 12345)[i] for i in range(1000)])
+    timed("rotate_in_place (list, triple reversal)", rotate_in_place, numbers, 12345)
+    timed("rotate_in_place (ndarray)", rotate_in_place, array, 12345)
+    timed("np.roll (copy)", np.roll, array, 12345)
+    timed("chunk_list (copy)", chunk_list, numbers, chunk_size)
+    timed("chunks (SliceView)", lambda: list(chunks(numbers, chunk_size)))
+    timed("chunks (ndarray views)", lambda: list(chunks(array, chunk_size)))
+    timed("flatten (list comprehension)", flatten, nested)
+    timed("RaggedArray.from_nested", RaggedArray.from_nested, nested, "q")
+
+
+if __name__ == "__main__":
+    views_examples()
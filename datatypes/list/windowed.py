@@ -0,0 +1,469 @@
+"""
+Windowed Statistics: Rolling Metrics in Linear Time
+---------------------------------------------------
+
+The moving_average in exercises.py (exercise 6) re-slices and re-sums every
+window, which costs O(n * w). The functions here compute the same rolling
+metrics in O(n) total, whatever the window size:
+
+1. Running-sum moving average (pure Python, compensated against float drift)
+2. Rolling min / max with a monotonic deque
+3. Rolling variance with Welford's update for a sliding window
+4. NumPy versions (*_array) built on np.cumsum, sliding_window_view and the
+   van Herk / Gil-Werman block algorithm for min / max
+5. RollingWindow, a push-based object for unbounded streams (sensor feeds)
+   that keeps every statistic current in O(1) amortized time per sample
+
+All list functions return one value per full window ("valid" windows), so
+for n samples and window w the result has n - w + 1 entries.
+
+NumPy is only imported by the *_array functions, so importing this module
+stays cheap.
+"""
+
+from collections import deque
+
+
+def _check_window(window):
+    if window < 1:
+        raise ValueError(f"window must be >= 1, got {window}")
+
+
+# -----------------------------------------------------
+# 1. PURE-PYTHON ROLLING STATISTICS
+# -----------------------------------------------------
+
+def moving_average(values, window):
+    """
+    Moving average with a running sum.
+    Time Complexity: O(n) - independent of the window size
+    Space Complexity: O(n) for the result
+
+    Each step adds the entering value and subtracts the leaving one. The sum
+    carries a Neumaier compensation term, so long float series do not drift
+    the way a naive running sum does.
+
+    Args:
+        values: Sequence of numbers
+        window: Window size >= 1
+
+    Returns:
+        List of n - window + 1 averages
+    """
+    _check_window(window)
+    n = len(values)
+    if n < window:
+        return []
+
+    total = 0.0
+    compensation = 0.0
+
+    def add(x):
+        nonlocal total, compensation
+        t = total + x
+        if abs(total) >= abs(x):
+            compensation += (total - t) + x
+        else:
+            compensation += (x - t) + total
+        total = t
+
+    for i in range(window):
+        add(values[i])
+
+    result = [(total + compensation) / window]
+    for i in range(window, n):
+        add(values[i])
+        add(-values[i - window])
+        result.append((total + compensation) / window)
+    return result
+
+
+def _rolling_extreme(values, window, better):
+    """Helper: rolling min or max with a monotonic deque of indices"""
+    _check_window(window)
+    result = []
+    candidates = deque()  # Indices whose values are monotonic from front to back
+    for i, x in enumerate(values):
+        # Drop candidates that x dominates; they can never be the answer again
+        while candidates and not better(values[candidates[-1]], x):
+            candidates.pop()
+        candidates.append(i)
+        if candidates[0] <= i - window:
+            candidates.popleft()
+        if i >= window - 1:
+            result.append(values[candidates[0]])
+    return result
+
+
+def rolling_min(values, window):
+    """
+    Minimum of every window.
+    Time Complexity: O(n) - each index enters and leaves the deque once
+    Space Complexity: O(w)
+
+    Returns:
+        List of n - window + 1 minima
+    """
+    return _rolling_extreme(values, window, lambda kept, new: kept < new)
+
+
+def rolling_max(values, window):
+    """
+    Maximum of every window.
+    Time Complexity: O(n)
+    Space Complexity: O(w)
+
+    Returns:
+        List of n - window + 1 maxima
+    """
+    return _rolling_extreme(values, window, lambda kept, new: kept > new)
+
+
+def rolling_variance(values, window, ddof=1):
+    """
+    Variance of every window with Welford's sliding update.
+    Time Complexity: O(n)
+    Space Complexity: O(n) for the result
+
+    Sliding the window replaces x_old by x_new:
+        mean' = mean + (x_new - x_old) / w
+        M2'   = M2 + (x_new - x_old) * (x_new - mean' + x_old - mean)
+    which avoids the catastrophic cancellation of sum(x^2) - sum(x)^2 / w.
+
+    Args:
+        values: Sequence of numbers
+        window: Window size (must exceed ddof)
+        ddof: Delta degrees of freedom (1 = sample variance, 0 = population)
+
+    Returns:
+        List of n - window + 1 variances
+    """
+    _check_window(window)
+    if window <= ddof:
+        raise ValueError(f"window must be greater than ddof={ddof}")
+    n = len(values)
+    if n < window:
+        return []
+
+    mean = 0.0
+    m2 = 0.0
+    for count, x in enumerate(values[:window], start=1):
+        delta = x - mean
+        mean += delta / count
+        m2 += delta * (x - mean)
+
+    result = [max(m2, 0.0) / (window - ddof)]
+    for i in range(window, n):
+        x_new, x_old = values[i], values[i - window]
+        old_mean = mean
+        mean += (x_new - x_old) / window
+        m2 += (x_new - x_old) * (x_new - mean + x_old - old_mean)
+        result.append(max(m2, 0.0) / (window - ddof))
+    return result
+
+
+# -----------------------------------------------------
+# 2. VECTORIZED (NUMPY) ROLLING STATISTICS
+# -----------------------------------------------------
+
+def moving_average_array(values, window, method="cumsum"):
+    """
+    Moving average of a NumPy array.
+    Time Complexity: O(n) with method='cumsum', O(n * w) with method='window'
+    Space Complexity: O(n)
+
+    'cumsum' differences a prefix sum: (c[i + w] - c[i]) / w. The data is
+    centered first, which keeps the prefix sums small and the rounding error
+    low even for long series with a large offset. 'window' averages a
+    zero-copy sliding_window_view and is exact per window but does w work
+    per output.
+
+    Args:
+        values: Array-like of numbers
+        window: Window size >= 1
+        method: 'cumsum' or 'window'
+
+    Returns:
+        float64 array of n - window + 1 averages
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    _check_window(window)
+    x = np.asarray(values, dtype=np.float64)
+    if len(x) < window:
+        return np.empty(0)
+
+    if method == "window":
+        return np.lib.stride_tricks.sliding_window_view(x, window).mean(axis=1)
+    if method != "cumsum":
+        raise ValueError(f"unknown method {method!r}")
+
+    shift = x.mean()
+    prefix = np.concatenate(([0.0], np.cumsum(x - shift)))
+    return (prefix[window:] - prefix[:-window]) / window + shift
+
+
+def _rolling_extreme_array(values, window, accumulate, combine):
+    """
+    Helper: van Herk / Gil-Werman rolling extreme.
+
+    The array is cut into blocks of w. Within each block we take running
+    extremes from the left (prefix) and from the right (suffix); any window
+    spans the tail of one block and the head of the next, so its extreme is
+    combine(suffix[i], prefix[i + w - 1]). Three vectorized passes, O(n).
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    _check_window(window)
+    x = np.asarray(values)
+    n = len(x)
+    if n < window:
+        return x[:0].copy()
+    if window == 1:
+        return x.copy()
+
+    blocks = -(-n // window)
+    padded = np.empty(blocks * window, dtype=x.dtype)
+    padded[:n] = x
+    padded[n:] = x[-1]  # Padding never leaks into a valid window
+    grid = padded.reshape(blocks, window)
+
+    prefix = accumulate(grid, axis=1).ravel()
+    suffix = accumulate(grid[:, ::-1], axis=1)[:, ::-1].ravel()
+    return combine(suffix[:n - window + 1], prefix[window - 1:n])
+
+
+def rolling_min_array(values, window):
+    """
+    Minimum of every window of a NumPy array.
+    Time Complexity: O(n)
+    Space Complexity: O(n)
+
+    Returns:
+        Array of n - window + 1 minima (same dtype as the input)
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    return _rolling_extreme_array(values, window, np.minimum.accumulate, np.minimum)
+
+
+def rolling_max_array(values, window):
+    """
+    Maximum of every window of a NumPy array.
+    Time Complexity: O(n)
+    Space Complexity: O(n)
+
+    Returns:
+        Array of n - window + 1 maxima (same dtype as the input)
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+    return _rolling_extreme_array(values, window, np.maximum.accumulate, np.maximum)
+
+
+def rolling_variance_array(values, window, ddof=1):
+    """
+    Variance of every window of a NumPy array.
+    Time Complexity: O(n)
+    Space Complexity: O(n)
+
+    Uses prefix sums of the centered data and its square:
+        var = (S2 - S1^2 / w) / (w - ddof)
+    Centering on the global mean removes the offset that makes this formula
+    lose precision; tiny negative results from rounding are clipped to 0.
+
+    Returns:
+        float64 array of n - window + 1 variances
+    """
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    _check_window(window)
+    if window <= ddof:
+        raise ValueError(f"window must be greater than ddof={ddof}")
+    x = np.asarray(values, dtype=np.float64)
+    if len(x) < window:
+        return np.empty(0)
+
+    centered = x - x.mean()
+    s1 = np.concatenate(([0.0], np.cumsum(centered)))
+    s2 = np.concatenate(([0.0], np.cumsum(centered * centered)))
+    window_s1 = s1[window:] - s1[:-window]
+    window_s2 = s2[window:] - s2[:-window]
+    return np.maximum(window_s2 - window_s1 * window_s1 / window, 0.0) / (window - ddof)
+
+
+# -----------------------------------------------------
+# 3. PUSH-BASED STREAMING WINDOW
+# -----------------------------------------------------
+
+class RollingWindow:
+    """
+    Sliding window over an unbounded stream, updated one sample at a time.
+
+    push(x) costs O(1) amortized and keeps the count, mean, variance, min
+    and max of the last `window` samples current. Memory is O(window) no
+    matter how many samples are pushed.
+
+    Usage:
+        stats = RollingWindow(60)
+        for reading in sensor_feed():
+            stats.push(reading)
+            if stats.full and stats.max > limit:
+                alert(stats.mean, stats.std)
+    """
+
+    def __init__(self, window, ddof=1):
+        _check_window(window)
+        self.window = window
+        self.ddof = ddof
+        self.samples = 0          # Total samples ever pushed
+        self._values = deque()
+        self._mins = deque()      # (index, value), values increasing
+        self._maxs = deque()      # (index, value), values decreasing
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def push(self, x):
+        """
+        Add a sample, evicting the oldest one once the window is full.
+
+        Returns:
+            self, so calls can be chained with a statistic
+        """
+        i = self.samples
+        self.samples += 1
+
+        if len(self._values) == self.window:
+            old = self._values.popleft()
+            old_mean = self._mean
+            self._mean += (x - old) / self.window
+            self._m2 += (x - old) * (x - self._mean + old - old_mean)
+        else:
+            delta = x - self._mean
+            self._mean += delta / (len(self._values) + 1)
+            self._m2 += delta * (x - self._mean)
+        self._values.append(x)
+
+        while self._mins and self._mins[-1][1] >= x:
+            self._mins.pop()
+        self._mins.append((i, x))
+        while self._maxs and self._maxs[-1][1] <= x:
+            self._maxs.pop()
+        self._maxs.append((i, x))
+
+        oldest = i - self.window
+        if self._mins[0][0] <= oldest:
+            self._mins.popleft()
+        if self._maxs[0][0] <= oldest:
+            self._maxs.popleft()
+        return self
+
+    def extend(self, values):
+        """
+        Push many samples, yielding a snapshot after each full window.
+
+        Yields:
+            Dictionaries from snapshot() once the window has filled
+        """
+        for x in values:
+            self.push(x)
+            if self.full:
+                yield self.snapshot()
+
+    @property
+    def count(self):
+        return len(self._values)
+
+    @property
+    def full(self):
+        return len(self._values) == self.window
+
+    @property
+    def mean(self):
+        return self._mean if self._values else float("nan")
+
+    @property
+    def variance(self):
+        n = len(self._values)
+        if n <= self.ddof:
+            return float("nan")
+        return max(self._m2, 0.0) / (n - self.ddof)
+
+    @property
+    def std(self):
+        return self.variance ** 0.5
+
+    @property
+    def min(self):
+        return self._mins[0][1] if self._mins else None
+
+    @property
+    def max(self):
+        return self._maxs[0][1] if self._maxs else None
+
+    def snapshot(self):
+        """All current statistics as a dictionary"""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "variance": self.variance,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    def __repr__(self):
+        return (f"RollingWindow(window={self.window}, count={self.count}, "
+                f"mean={self.mean:.6g}, min={self.min}, max={self.max})")
+
+
+# -----------------------------------------------------
+# EXAMPLES AND BENCHMARK
+# -----------------------------------------------------
+
+def windowed_examples():
+    numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    print(f"Numbers: {numbers}")
+    print(f"Moving average (window 3): {moving_average(numbers, 3)}")
+    print(f"Rolling min (window 3): {rolling_min([4, 2, 12, 3, 8, 1, 7], 3)}")
+    print(f"Rolling max (window 3): {rolling_max([4, 2, 12, 3, 8, 1, 7], 3)}")
+    print(f"Rolling variance (window 4): {rolling_variance(numbers, 4)}")
+
+    stats = RollingWindow(3)
+    for reading in [20.5, 21.0, 35.2, 21.3, 20.9]:
+        stats.push(reading)
+        print(f"  pushed {reading}: {stats}")
+
+
+def benchmark_windowed(n=1_000_000, window=1000):
+    """Compare the O(n * w) exercise solution with the O(n) versions"""
+    import random
+    import time
+
+    import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+    random.seed(0)
+    values = [random.gauss(0, 1) for _ in range(n)]
+    array = np.array(values)
+
+    def naive(lst, window_size):  # exercise6_solution's moving_average
+        return [sum(lst[i:i + window_size]) / window_size
+                for i in range(len(lst) - window_size + 1)]
+
+    def timed(label, fn, *args, scale=1):
+        start = time.perf_counter()
+        fn(*args)
+        print(f"{label:<36} {(time.perf_counter() - start) * scale:8.3f}s")
+
+    print(f"n = {n:,}, window = {window}")
+    timed("naive slicing (estimated from n/20)", naive, values[:n // 20], window, scale=20)
+    timed("moving_average (running sum)", moving_average, values, window)
+    timed("moving_average_array (cumsum)", moving_average_array, array, window)
+    timed("rolling_max (monotonic deque)", rolling_max, values, window)
+    timed("rolling_max_array (van Herk)", rolling_max_array, array, window)
+    timed("rolling_variance (Welford)", rolling_variance, values, window)
+    timed("rolling_variance_array (cumsum)", rolling_variance_array, array, window)
+
+    stats = RollingWindow(window)
+    timed("RollingWindow.push", lambda: [stats.push(x) for x in values])
+
+
+if __name__ == "__main__":
+    windowed_examples()
@@ -0,0 +1,553 @@
+"""
+Roaring Bitmaps: Compressed Sets of 32-bit Integers
+---------------------------------------------------
+
+sets.py covers set union, intersection and difference on a handful of
+elements. A Python set of 10^7 ints takes ~500 MB (a hash slot plus a
+28-byte int object per element) and its operations walk every element
+one at a time. A roaring bitmap splits each value into its high and low
+16 bits and keeps one container of low halves per high half (a "chunk" of
+65536 values), choosing per chunk whichever of three forms is smallest:
+
+1. Array container:  sorted uint16 values, 2 bytes each (up to 4096 values)
+2. Bitmap container: 1024 uint64 words, a fixed 8 KB (more than 4096)
+3. Run container:    (start, last) pairs, 4 bytes per run of consecutive
+                     values (ranges and clustered IDs)
+
+Set operations (&, |, -, ^) pair up chunks by their high half and combine
+the two containers with NumPy: merges of sorted arrays, searchsorted
+membership tests, or whole-word bitwise ops, so no per-element Python
+loop runs. len() adds up cached container sizes, and and_cardinality()
+counts an intersection without building it. serialize() writes the
+portable Roaring format read by CRoaring, pyroaring and the Java library.
+
+Bitmaps cannot work without NumPy, so it is imported with the module;
+`import datatypes` still only loads this module on first use.
+"""
+
+import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+
+ARRAY_MAX = 4096           # Largest array container; past it a bitmap is smaller
+BITMAP_WORDS = 1 << 10     # 65536 bits
+BITMAP_BYTES = BITMAP_WORDS * 8
+
+_SERIAL_COOKIE_NO_RUNS = 12346
+_SERIAL_COOKIE = 12347
+_NO_OFFSET_THRESHOLD = 4
+
+
+def _popcount(words):
+    if hasattr(np, "bitwise_count"):  # NumPy >= 2.0
+        return int(np.bitwise_count(words).sum())
+    return int(np.unpackbits(words.view(np.uint8)).sum())
+
+
+# -----------------------------------------------------
+# 1. CONTAINERS
+# -----------------------------------------------------
+
+class _ArrayContainer:
+    """Sorted, distinct uint16 low halves"""
+    kind = "array"
+    __slots__ = ("values",)
+
+    def __init__(self, values):
+        self.values = values
+
+    def __len__(self):
+        return len(self.values)
+
+    def contains(self, lows):
+        at = np.searchsorted(self.values, lows)
+        found = at < len(self.values)
+        found[found] = self.values[at[found]] == lows[found]
+        return found
+
+    def lows(self):
+        return self.values
+
+    def words(self):
+        bits = np.zeros(1 << 16, dtype=np.uint8)
+        bits[self.values] = 1
+        return np.packbits(bits, bitorder="little").view("<u8")
+
+    @property
+    def nbytes(self):
+        return 2 * len(self.values)
+
+
+class _BitmapContainer:
+    """1024 little-endian uint64 words; bit i of word w is value 64 * w + i"""
+    kind = "bitmap"
+    __slots__ = ("bits", "cardinality")
+
+    def __init__(self, bits, cardinality):
+        self.bits = bits
+        self.cardinality = cardinality
+
+    def __len__(self):
+        return self.cardinality
+
+    def contains(self, lows):
+        word = self.bits[lows >> 6]
+        return ((word >> (lows & 63).astype(np.uint64)) & np.uint64(1)).astype(bool)
+
+    def lows(self):
+        bits = np.unpackbits(self.bits.view(np.uint8), bitorder="little")
+        return np.flatnonzero(bits).astype(np.uint16)
+
+    def words(self):
+        return self.bits
+
+    @property
+    def nbytes(self):
+        return BITMAP_BYTES
+
+
+class _RunContainer:
+    """Runs of consecutive values as inclusive [start, last] int32 pairs"""
+    kind = "run"
+    __slots__ = ("starts", "lasts", "cardinality")
+
+    def __init__(self, starts, lasts):
+        self.starts = starts
+        self.lasts = lasts
+        self.cardinality = int((lasts - starts).sum()) + len(starts)
+
+    def __len__(self):
+        return self.cardinality
+
+    def contains(self, lows):
+        run = np.searchsorted(self.starts, lows, side="right") - 1
+        return (run >= 0) & (lows <= self.lasts[run])
+
+    def lows(self):
+        lengths = self.lasts - self.starts + 1
+        offsets = np.cumsum(lengths) - lengths
+        return (np.repeat(self.starts - offsets, lengths)
+                + np.arange(self.cardinality)).astype(np.uint16)
+
+    def words(self):
+        edges = np.zeros((1 << 16) + 1, dtype=np.int32)
+        # Accumulate: runs read from the portable format may be adjacent, so
+        # one run can start where the previous one ends
+        np.add.at(edges, self.starts, 1)
+        np.add.at(edges, self.lasts.astype(np.int64) + 1, -1)
+        bits = (np.cumsum(edges[:-1]) > 0).astype(np.uint8)
+        return np.packbits(bits, bitorder="little").view("<u8")
+
+    @property
+    def nbytes(self):
+        return 2 + 4 * len(self.starts)
+
+
+def _best_kind(cardinality, runs):
+    """Smallest container for a chunk, by serialized size"""
+    array_bytes = 2 * cardinality if cardinality <= ARRAY_MAX else BITMAP_BYTES + 1
+    if 2 + 4 * runs < min(array_bytes, BITMAP_BYTES):
+        return "run"
+    return "array" if cardinality <= ARRAY_MAX else "bitmap"
+
+
+def _from_lows(lows):
+    """Best container for sorted, distinct low halves (None when empty)"""
+    if not len(lows):
+        return None
+    lows = lows.astype(np.int32, copy=False)
+    breaks = np.flatnonzero(np.diff(lows) != 1)
+    kind = _best_kind(len(lows), len(breaks) + 1)
+    if kind == "run":
+        return _RunContainer(lows[np.concatenate(([0], breaks + 1))],
+                             lows[np.concatenate((breaks, [len(lows) - 1]))])
+    array = _ArrayContainer(lows.astype(np.uint16))
+    if kind == "array":
+        return array
+    return _BitmapContainer(array.words(), len(lows))
+
+
+def _from_words(words):
+    """Best container for a 1024-word bitmap (None when empty)"""
+    cardinality = _popcount(words)
+    if not cardinality:
+        return None
+    # A run starts at every set bit whose lower neighbour is clear
+    carry = np.zeros_like(words)
+    carry[1:] = words[:-1] >> np.uint64(63)
+    runs = _popcount(words & ~((words << np.uint64(1)) | carry))
+    kind = _best_kind(cardinality, runs)
+    if kind == "bitmap":
+        return _BitmapContainer(words, cardinality)
+    lows = _BitmapContainer(words, cardinality).lows()
+    if kind == "array":
+        return _ArrayContainer(lows)
+    return _from_lows(lows)
+
+
+def _union(a, b, assume_unique=True):
+    """Sorted union of two sorted, distinct arrays (np.union1d hashes first)"""
+    merged = np.sort(np.concatenate((a, b)), kind="stable")
+    return merged[np.concatenate(([True], merged[1:] != merged[:-1]))]
+
+
+def _combine(op, a, b):
+    """Container for a <op> b, op one of 'and', 'or', 'sub', 'xor'"""
+    if op == "and" and (a.kind == "array" or b.kind == "array"):
+        small, other = (a, b) if a.kind == "array" else (b, a)
+        return _from_lows(small.values[other.contains(small.values)])
+    if op == "sub" and a.kind == "array":
+        return _from_lows(a.values[~b.contains(a.values)])
+    if "bitmap" not in (a.kind, b.kind) and len(a) + len(b) <= 2 * ARRAY_MAX:
+        # Small operands: merging sorted values beats two 8 KB bitmaps
+        merge = {"and": np.intersect1d, "or": _union,
+                 "sub": np.setdiff1d, "xor": np.setxor1d}[op]
+        return _from_lows(merge(a.lows(), b.lows(), assume_unique=True))
+    words = {"and": np.bitwise_and, "or": np.bitwise_or, "xor": np.bitwise_xor}
+    if op == "sub":
+        return _from_words(a.words() & ~b.words())
+    return _from_words(words[op](a.words(), b.words()))
+
+
+def _and_cardinality(a, b):
+    if a.kind == "array":
+        return int(b.contains(a.values).sum())
+    if b.kind == "array":
+        return int(a.contains(b.values).sum())
+    return _popcount(a.words() & b.words())
+
+
+# -----------------------------------------------------
+# 2. ROARING BITMAP
+# -----------------------------------------------------
+
+class RoaringBitmap:
+    """
+    Set of integers in [0, 2^32) stored as one container per 16-bit chunk.
+
+    Bulk updates and set operations are vectorized within each chunk;
+    add() and discard() rebuild one container and are meant for
+    occasional single changes.
+    """
+
+    def __init__(self, values=None):
+        self._chunks = {}  # high 16 bits -> container
+        if values is not None:
+            self.update(values)
+
+    @classmethod
+    def _of(cls, chunks):
+        bitmap = cls()
+        bitmap._chunks = chunks
+        return bitmap
+
+    @staticmethod
+    def _as_array(values):
+        """ndarray of any integer input; sets, dict keys and generators go through fromiter"""
+        if isinstance(values, (np.ndarray, list, tuple)):
+            return np.asarray(values)
+        return np.fromiter(values, dtype=np.int64)
+
+    @staticmethod
+    def _as_uint32(values):
+        values = np.asarray(values)
+        if values.dtype.kind not in "iub":
+            if values.size:
+                raise TypeError(f"values must be integers, got dtype {values.dtype}")
+            values = values.astype(np.int64)
+        if values.size and (values.min() < 0 or values.max() >= 1 << 32):
+            raise ValueError("values must be in [0, 2**32)")
+        return values.astype(np.uint32, copy=False).ravel()
+
+    def update(self, values):
+        """
+        Add every value of an integer array (or iterable).
+        Time Complexity: O(n log n) for the sort, then O(n) per chunk touched
+        """
+        values = np.sort(self._as_uint32(self._as_array(values)))
+        if not len(values):
+            return
+        values = values[np.concatenate(([True], values[1:] != values[:-1]))]
+        highs = (values >> 16).astype(np.int64)
+        bounds = np.flatnonzero(np.diff(highs)) + 1
+        for lo, hi in zip(np.concatenate(([0], bounds)), np.concatenate((bounds, [len(values)]))):
+            key = int(highs[lo])
+            container = _from_lows((values[lo:hi] & 0xFFFF).astype(np.uint16))
+            if key in self._chunks:
+                container = _combine("or", self._chunks[key], container)
+            self._chunks[key] = container
+
+    def add(self, value):
+        self.update([value])
+
+    def discard(self, value):
+        key, low = divmod(int(value), 1 << 16)
+        container = self._chunks.get(key)
+        if container is not None:
+            container = _combine("sub", container, _ArrayContainer(np.array([low], dtype=np.uint16)))
+            if container is None:
+                del self._chunks[key]
+            else:
+                self._chunks[key] = container
+
+    def contains_many(self, values):
+        """Boolean mask of which values are in the set"""
+        values = self._as_array(values).astype(np.int64, copy=False)
+        found = np.zeros(len(values), dtype=bool)
+        valid = np.flatnonzero((values >= 0) & (values < 1 << 32))
+        highs = values[valid] >> 16
+        for key in np.unique(highs).tolist():
+            container = self._chunks.get(key)
+            if container is not None:
+                rows = valid[highs == key]
+                found[rows] = container.contains((values[rows] & 0xFFFF).astype(np.uint16))
+        return found
+
+    def __contains__(self, value):
+        if not 0 <= value < 1 << 32:
+            return False
+        container = self._chunks.get(value >> 16)
+        if container is None:
+            return False
+        return bool(container.contains(np.array([value & 0xFFFF], dtype=np.uint16))[0])
+
+    def __len__(self):
+        """O(chunks): every container knows its own size"""
+        return sum(len(container) for container in self._chunks.values())
+
+    def __bool__(self):
+        return bool(self._chunks)
+
+    # -- set algebra --------------------------------------------------
+
+    def _binary(self, other, op):
+        if not isinstance(other, RoaringBitmap):
+            return NotImplemented
+        mine, theirs = self._chunks, other._chunks
+        if op == "and":
+            keys = mine.keys() & theirs.keys()
+        elif op == "sub":
+            keys = mine.keys()
+        else:
+            keys = mine.keys() | theirs.keys()
+        chunks = {}
+        for key in keys:
+            a, b = mine.get(key), theirs.get(key)
+            if a is None or b is None:
+                container = a if b is None else b
+            else:
+                container = _combine(op, a, b)
+            if container is not None:
+                chunks[key] = container
+        return RoaringBitmap._of(chunks)
+
+    def __and__(self, other):
+        return self._binary(other, "and")
+
+    def __or__(self, other):
+        return self._binary(other, "or")
+
+    def __sub__(self, other):
+        return self._binary(other, "sub")
+
+    def __xor__(self, other):
+        return self._binary(other, "xor")
+
+    def and_cardinality(self, other):
+        """len(self & other) without building the intersection"""
+        return sum(_and_cardinality(self._chunks[key], other._chunks[key])
+                   for key in self._chunks.keys() & other._chunks.keys())
+
+    def __eq__(self, other):
+        if not isinstance(other, RoaringBitmap):
+            return NotImplemented
+        if self._chunks.keys() != other._chunks.keys():
+            return False
+        return all(np.array_equal(container.lows(), other._chunks[key].lows())
+                   for key, container in self._chunks.items())
+
+    __hash__ = None
+
+    # -- export -------------------------------------------------------
+
+    def to_array(self):
+        """Sorted uint32 array of every value"""
+        parts = [container.lows().astype(np.uint32) | np.uint32(key << 16)
+                 for key, container in sorted(self._chunks.items())]
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.uint32)
+
+    def __iter__(self):
+        for key, container in sorted(self._chunks.items()):
+            base = key << 16
+            for low in container.lows().tolist():
+                yield base | low
+
+    def memory_usage(self):
+        """Container payload bytes by kind, plus the total and bytes per value"""
+        usage = {"array": 0, "bitmap": 0, "run": 0}
+        counts = {"array": 0, "bitmap": 0, "run": 0}
+        for container in self._chunks.values():
+            usage[container.kind] += container.nbytes
+            counts[container.kind] += 1
+        total = sum(usage.values())
+        return {**usage, "total": total, "containers": counts,
+                "bytes_per_value": total / max(len(self), 1)}
+
+    def __repr__(self):
+        return f"RoaringBitmap({len(self):,} values in {len(self._chunks):,} chunks)"
+
+    # -- serialization ------------------------------------------------
+
+    def serialize(self):
+        """
+        Bytes in the portable Roaring format (cookie, key/cardinality
+        headers, offsets, then each container little-endian).
+        """
+        import struct
+
+        items = sorted(self._chunks.items())
+        n = len(items)
+        has_runs = any(container.kind == "run" for _, container in items)
+        if has_runs:
+            flags = np.zeros(-(-n // 8) * 8, dtype=np.uint8)
+            flags[[i for i, (_, c) in enumerate(items) if c.kind == "run"]] = 1
+            header = (struct.pack("<I", _SERIAL_COOKIE | ((n - 1) << 16))
+                      + np.packbits(flags, bitorder="little").tobytes())
+        else:
+            header = struct.pack("<II", _SERIAL_COOKIE_NO_RUNS, n)
+        header += np.array([(key, len(c) - 1) for key, c in items], dtype="<u2").tobytes()
+
+        payloads = []
+        for _, container in items:
+            if container.kind == "array":
+                payloads.append(container.values.astype("<u2").tobytes())
+            elif container.kind == "bitmap":
+                payloads.append(container.bits.tobytes())
+            else:
+                pairs = np.stack([container.starts, container.lasts - container.starts], axis=1)
+                payloads.append(struct.pack("<H", len(pairs)) + pairs.astype("<u2").tobytes())
+        if not has_runs or n >= _NO_OFFSET_THRESHOLD:
+            start = len(header) + 4 * n
+            sizes = np.fromiter(map(len, payloads), dtype=np.int64, count=n)
+            offsets = start + np.cumsum(sizes) - sizes
+            header += offsets.astype("<u4").tobytes()
+        return header + b"".join(payloads)
+
+    @classmethod
+    def deserialize(cls, data):
+        """Inverse of serialize(); accepts bytes from any Roaring implementation"""
+        import struct
+
+        data = memoryview(data)
+        cookie, = struct.unpack_from("<I", data, 0)
+        if cookie & 0xFFFF == _SERIAL_COOKIE:
+            n = (cookie >> 16) + 1
+            flag_bytes = (n + 7) // 8
+            is_run = np.unpackbits(np.frombuffer(data, np.uint8, flag_bytes, 4), bitorder="little")[:n]
+            position = 4 + flag_bytes
+        elif cookie == _SERIAL_COOKIE_NO_RUNS:
+            n, = struct.unpack_from("<I", data, 4)
+            is_run = np.zeros(n, dtype=np.uint8)
+            position = 8
+        else:
+            raise ValueError("not a serialized roaring bitmap")
+        keys_cards = np.frombuffer(data, "<u2", 2 * n, position).reshape(n, 2).astype(np.int64)
+        position += 4 * n
+        if not is_run.any() or n >= _NO_OFFSET_THRESHOLD:
+            position += 4 * n  # Offsets are implied by reading in order
+
+        chunks = {}
+        for (key, cardinality), run in zip(keys_cards.tolist(), is_run.tolist()):
+            cardinality += 1
+            if run:
+                count, = struct.unpack_from("<H", data, position)
+                pairs = np.frombuffer(data, "<u2", 2 * count, position + 2).reshape(count, 2).astype(np.int32)
+                chunks[key] = _RunContainer(pairs[:, 0].copy(), pairs[:, 0] + pairs[:, 1])
+                position += 2 + 4 * count
+            elif cardinality <= ARRAY_MAX:
+                chunks[key] = _ArrayContainer(np.frombuffer(data, "<u2", cardinality, position).astype(np.uint16))
+                position += 2 * cardinality
+            else:
+                chunks[key] = _BitmapContainer(np.frombuffer(data, "<u8", BITMAP_WORDS, position).copy(), cardinality)
+                position += BITMAP_BYTES
+        return cls._of(chunks)
+
+    def __reduce__(self):
+        return (RoaringBitmap.deserialize, (self.serialize(),))
+
+
+# -----------------------------------------------------
+# 3. EXAMPLES AND BENCHMARK
+# -----------------------------------------------------
+
+def roaring_examples():
+    evens = RoaringBitmap(np.arange(0, 200_000, 2))
+    block = RoaringBitmap(np.arange(50_000, 150_000))
+    sparse = RoaringBitmap([3, 70_000, 1 << 31])
+    print(f"{evens}, {block}, {sparse}")
+    print(f"Containers: {evens.memory_usage()['containers']} / {block.memory_usage()['containers']}")
+
+    both = evens & block
+    print(f"evens & block: {len(both):,} values, first {both.to_array()[:3].tolist()}")
+    print(f"evens | block: {len(evens | block):,}, evens - block: {len(evens - block):,}, "
+          f"evens ^ block: {len(evens ^ block):,}")
+    print(f"and_cardinality without materializing: {evens.and_cardinality(block):,}")
+    print(f"contains_many([3, 4, 70_000]) in sparse: {sparse.contains_many([3, 4, 70_000]).tolist()}")
+
+    data = block.serialize()
+    print(f"block serialized to {len(data)} bytes; round trip equal: {RoaringBitmap.deserialize(data) == block}")
+
+
+def _set_bytes(values):
+    """Measured bytes of a Python set built from a list of ints"""
+    import tracemalloc
+
+    tracemalloc.start()
+    result = set(values)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def benchmark_roaring(sizes=(10**6, 10**7, 5 * 10**7), universe=10**9, set_max=10**7):
+    """
+    Memory and & | - ^ times of RoaringBitmap against Python sets.
+
+    Two sets of n IDs each: one uniform over the universe, one clustered
+    into ranges of 1000 consecutive IDs (run containers). Sets above set_max
+    values are skipped (~60 bytes per element).
+    """
+    import time
+
+    rng = np.random.default_rng(0)
+
+    def timed(label, fn):
+        start = time.perf_counter()
+        result = fn()
+        print(f"  {label:<34} {time.perf_counter() - start:8.3f}s")
+        return result
+
+    for n in sizes:
+        print(f"n = {n:,} per operand")
+        uniform = rng.integers(0, universe, n)
+        clustered = (rng.integers(0, universe // 1000, n // 1000)[:, None] * 1000
+                     + np.arange(1000)).ravel()
+        a = timed("RoaringBitmap build (uniform)", lambda: RoaringBitmap(uniform))
+        b = timed("RoaringBitmap build (clustered)", lambda: RoaringBitmap(clustered))
+        usage = a.memory_usage()["total"] + b.memory_usage()["total"]
+        print(f"  RoaringBitmap memory {usage / 2**20:11.1f} MiB")
+        for symbol, op in (("&", "__and__"), ("|", "__or__"), ("-", "__sub__"), ("^", "__xor__")):
+            timed(f"RoaringBitmap {symbol}", lambda: getattr(a, op)(b))
+        timed("RoaringBitmap and_cardinality", lambda: a.and_cardinality(b))
+        timed("RoaringBitmap serialize", lambda: (a | b).serialize())
+
+        if n <= set_max:
+            sa, size_a = timed("set build (uniform)", lambda: _set_bytes(uniform.tolist()))
+            sb, size_b = timed("set build (clustered)", lambda: _set_bytes(clustered.tolist()))
+            print(f"  set memory           {(size_a + size_b) / 2**20:11.1f} MiB")
+            for symbol, op in (("&", "__and__"), ("|", "__or__"), ("-", "__sub__"), ("^", "__xor__")):
+                timed(f"set {symbol}", lambda: getattr(sa, op)(sb))
+            del sa, sb
+
+
+if __name__ == "__main__":
+    roaring_examples()
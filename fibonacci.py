@@ -0,0 +1,362 @@
+"""
+FAST FIBONACCI
+==============
+
+O(log n) Fibonacci numbers, exact or modulo m.
+
+app.py shows three classic versions: the O(n) loop (fibonacci), the
+exponential recursion (fibonacci_recursive) and the memoized recursion
+(fibonacci_memoized), which recurses n levels deep and keeps every value it
+has ever seen. This module adds:
+
+1. Fast doubling, using F(2k) = F(k) * (2F(k+1) - F(k)) and
+   F(2k+1) = F(k)^2 + F(k+1)^2 - only O(log n) big-integer multiplications
+2. The equivalent 2x2 matrix-power formulation, for comparison
+3. Modular evaluation that first reduces n by the Pisano period of m
+4. Batch evaluation of many n at once, vectorized with NumPy for small moduli
+5. A bounded LRU cache with hit/miss statistics
+"""
+
+from functools import lru_cache
+from math import gcd
+from operator import index
+
+import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+
+# Maximum number of exact results kept by the LRU cache
+CACHE_SIZE = 256
+
+
+# =============================================================================
+# 1. FAST DOUBLING AND MATRIX POWER
+# =============================================================================
+
+def fibonacci_pair(n, mod=None):
+    """
+    Return (F(n), F(n + 1)) by fast doubling.
+    Time Complexity: O(log n) multiplications
+    Space Complexity: O(1) besides the size of the numbers
+
+    The bits of n are consumed from the most significant end, so there is
+    no recursion at all.
+
+    Args:
+        n: Non-negative integer
+        mod: Optional modulus; all arithmetic is done modulo mod
+
+    Returns:
+        Tuple (F(n), F(n + 1)), reduced modulo mod if given
+    """
+    if n < 0:
+        raise ValueError("Fibonacci not defined for negative numbers")
+
+    a, b = 0, 1  # F(0), F(1)
+    for bit in bin(n)[2:]:
+        # (a, b) = (F(k), F(k+1))  ->  (F(2k), F(2k+1))
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if mod is not None:
+            c %= mod
+            d %= mod
+        if bit == "1":
+            # (F(2k), F(2k+1))  ->  (F(2k+1), F(2k+2))
+            c, d = d, c + d
+            if mod is not None:
+                d %= mod
+        a, b = c, d
+
+    if mod is not None:
+        return a % mod, b % mod
+    return a, b
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _fibonacci_cached(n):
+    return fibonacci_pair(n)[0]
+
+
+def fibonacci(n, mod=None):
+    """
+    Calculate the nth Fibonacci number by fast doubling.
+    Time Complexity: O(log n) multiplications
+    Space Complexity: O(1) besides the size of the result
+
+    Exact results are kept in a bounded LRU cache (see cache_info); modular
+    results are first reduced by the Pisano period of the modulus.
+
+    Args:
+        n: Non-negative integer position in Fibonacci sequence
+        mod: Optional modulus
+
+    Returns:
+        nth Fibonacci number, or F(n) mod `mod`
+    """
+    if n < 0:
+        raise ValueError("Fibonacci not defined for negative numbers")
+    if mod is None:
+        return _fibonacci_cached(n)
+    return fibonacci_mod(n, mod)
+
+
+def cache_info():
+    """Hit/miss statistics of the exact-result LRU cache"""
+    return _fibonacci_cached.cache_info()
+
+
+def cache_clear():
+    """Drop every cached exact result"""
+    _fibonacci_cached.cache_clear()
+
+
+def _mat_mult(x, y, mod):
+    """Multiply two 2x2 matrices stored as (a, b, c, d) tuples"""
+    a = x[0] * y[0] + x[1] * y[2]
+    b = x[0] * y[1] + x[1] * y[3]
+    c = x[2] * y[0] + x[3] * y[2]
+    d = x[2] * y[1] + x[3] * y[3]
+    if mod is not None:
+        return a % mod, b % mod, c % mod, d % mod
+    return a, b, c, d
+
+
+def fibonacci_matrix(n, mod=None):
+    """
+    Calculate the nth Fibonacci number as a power of [[1, 1], [1, 0]].
+    Time Complexity: O(log n) matrix multiplications (8 products each)
+    Space Complexity: O(1) besides the size of the numbers
+
+    Same asymptotics as fast doubling but roughly 3-4x the multiplications;
+    kept as the textbook reference implementation.
+
+    Args:
+        n: Non-negative integer position in Fibonacci sequence
+        mod: Optional modulus
+
+    Returns:
+        nth Fibonacci number, or F(n) mod `mod`
+    """
+    if n < 0:
+        raise ValueError("Fibonacci not defined for negative numbers")
+
+    result = (1, 0, 0, 1)
+    base = (1, 1, 1, 0)
+    while n:
+        if n & 1:
+            result = _mat_mult(result, base, mod)
+        base = _mat_mult(base, base, mod)
+        n >>= 1
+    return result[1]
+
+
+# =============================================================================
+# 2. MODULAR FIBONACCI AND PISANO PERIODS
+# =============================================================================
+
+def _factorize(m):
+    """Prime factorization of m by trial division, as {prime: exponent}"""
+    factors = {}
+    for p in (2, 3):
+        while m % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            m //= p
+    p = 5
+    while p * p <= m:
+        for q in (p, p + 2):
+            while m % q == 0:
+                factors[q] = factors.get(q, 0) + 1
+                m //= q
+        p += 6
+    if m > 1:
+        factors[m] = factors.get(m, 0) + 1
+    return factors
+
+
+def _divisors(n):
+    """All divisors of n in increasing order"""
+    divisors = [1]
+    for p, e in _factorize(n).items():
+        divisors = [d * p ** k for d in divisors for k in range(e + 1)]
+    return sorted(divisors)
+
+
+def _lcm(a, b):
+    return a // gcd(a, b) * b
+
+
+def _pisano_prime(p):
+    """Pisano period of a prime p"""
+    if p == 2:
+        return 3
+    if p == 5:
+        return 20
+    # pi(p) divides p - 1 when p = +-1 (mod 5), and 2(p + 1) when p = +-2 (mod 5)
+    bound = p - 1 if p % 5 in (1, 4) else 2 * (p + 1)
+    for d in _divisors(bound):
+        if fibonacci_pair(d, p) == (0, 1):
+            return d
+    return bound
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def pisano_period(m):
+    """
+    Length of the period of the Fibonacci sequence modulo m.
+    Time Complexity: O(sqrt(m)) for the factorization, plus O(log^2 m) per prime factor
+    Space Complexity: O(log m)
+
+    Uses pi(p^k) = p^(k-1) * pi(p) and pi(lcm) = lcm of the periods of the
+    prime-power factors.
+
+    Args:
+        m: Modulus >= 1
+
+    Returns:
+        The Pisano period pi(m)
+    """
+    if m < 1:
+        raise ValueError("Modulus must be a positive integer")
+    if m == 1:
+        return 1
+
+    period = 1
+    for p, e in _factorize(m).items():
+        period = _lcm(period, p ** (e - 1) * _pisano_prime(p))
+    return period
+
+
+# Moduli above this are not factored for a Pisano reduction; the O(log n)
+# doubling is already cheap and trial division would dominate
+PISANO_LIMIT = 10**12
+
+
+def fibonacci_mod(n, mod):
+    """
+    Calculate F(n) mod `mod`.
+    Time Complexity: O(log(min(n, pi(mod)))) multiplications of mod-sized numbers
+    Space Complexity: O(1)
+
+    For moduli up to PISANO_LIMIT, n is first reduced by the Pisano period,
+    so astronomically large n (e.g. 10**100000) cost the same as n < 6 * mod.
+
+    Args:
+        n: Non-negative integer
+        mod: Positive modulus
+
+    Returns:
+        F(n) mod `mod`
+    """
+    n, mod = index(n), index(mod)  # Accept NumPy integers, reject floats
+    if n < 0:
+        raise ValueError("Fibonacci not defined for negative numbers")
+    if mod < 1:
+        raise ValueError("Modulus must be a positive integer")
+    if mod <= PISANO_LIMIT and n.bit_length() > 2 * mod.bit_length() + 3:
+        n %= pisano_period(mod)
+    return fibonacci_pair(n, mod)[0]
+
+
+# =============================================================================
+# 3. BATCH EVALUATION
+# =============================================================================
+
+def _fibonacci_many_vectorized(ns, mod):
+    """
+    Fast doubling for a whole uint64 array at once, with mod < 2**32.
+
+    Every element walks the same bit positions from the top; elements whose
+    current bit is 1 take the extra step, selected with np.where.
+    """
+    m = np.uint64(mod)
+    a = np.zeros(len(ns), dtype=np.uint64)
+    b = np.ones(len(ns), dtype=np.uint64)
+    top = int(ns.max()).bit_length() if len(ns) else 0
+
+    for shift in range(top - 1, -1, -1):
+        # All intermediate products stay below 2**64 because a, b < 2**32
+        two_b_minus_a = (2 * b + m - a) % m
+        c = (a * two_b_minus_a) % m
+        d = (a * a % m + b * b % m) % m
+        bit = ((ns >> np.uint64(shift)) & np.uint64(1)).astype(bool)
+        a = np.where(bit, d, c)
+        b = np.where(bit, (c + d) % m, d)
+
+    return a % m
+
+
+def fibonacci_many(ns, mod=None):
+    """
+    Evaluate F(n) for many n.
+    Time Complexity: O(k log max(n)) vectorized steps when mod < 2**32,
+                     otherwise O(k log max(n)) multiplications in Python
+    Space Complexity: O(k)
+
+    With a modulus below 2**32 the whole batch is computed by one vectorized
+    fast-doubling pass. Otherwise each distinct n is evaluated once (duplicates
+    share the result) and exact values come from the LRU cache when possible.
+
+    Args:
+        ns: Iterable or array of non-negative integers
+        mod: Optional modulus
+
+    Returns:
+        uint64 ndarray for mod < 2**32, otherwise a list of Python ints
+    """
+    if mod is not None and 1 <= mod < 2**32:
+        ns = np.asarray(ns)
+        if ns.size == 0:  # np.asarray([]) is float64, which the check below rejects
+            return np.zeros(ns.shape, dtype=np.uint64)
+        if ns.dtype.kind not in "iu" or (ns.dtype.kind == "i" and len(ns) and ns.min() < 0):
+            raise ValueError("Fibonacci not defined for negative numbers")
+        if len(ns) and int(ns.max()) >= 2**63:
+            ns = ns % pisano_period(mod)
+        return _fibonacci_many_vectorized(ns.astype(np.uint64), mod)
+
+    ns = [int(n) for n in ns]
+    results = {}
+    for n in sorted(set(ns)):
+        results[n] = fibonacci(n, mod)
+    return [results[n] for n in ns]
+
+
+# Example usage of fast Fibonacci
+def fibonacci_examples():
+    print(f"F(10) = {fibonacci(10)}")
+    print(f"F(100) = {fibonacci(100)}")
+    print(f"F(100) via matrix power = {fibonacci_matrix(100)}")
+    print(f"Bits in F(10**6): {fibonacci(10**6).bit_length()}")
+    print(f"F(10**18) mod 10**9+7 = {fibonacci(10**18, 10**9 + 7)}")
+    print(f"Pisano period of 10: {pisano_period(10)}, of 1000: {pisano_period(1000)}")
+    print(f"F(n) mod 1000 for n = 0..15: {fibonacci_many(range(16), 1000).tolist()}")
+
+    fibonacci(10**6)
+    print(f"Cache stats: {cache_info()}")
+
+
+def benchmark_fibonacci(sizes=(10**3, 10**4, 10**5, 10**6, 10**7)):
+    """Compare fast doubling and matrix power with app.fibonacci"""
+    import time
+    import app
+
+    for n in sizes:
+        row = [f"n={n:>9,}"]
+        for name, fn in (("doubling", lambda k: fibonacci_pair(k)[0]),
+                         ("matrix", fibonacci_matrix),
+                         ("app.fibonacci", app.fibonacci)):
+            if fn is app.fibonacci and n > 10**5:
+                continue  # Quadratic in n: minutes at 10**7
+            if fn is fibonacci_matrix and n > 10**6:
+                continue  # ~10x slower than doubling at this size
+            start = time.perf_counter()
+            fn(n)
+            row.append(f"{name} {time.perf_counter() - start:.4f}s")
+        print("  ".join(row))
+
+    ns = np.random.default_rng(0).integers(0, 2**62, 10**6)
+    start = time.perf_counter()
+    fibonacci_many(ns, 10**9 + 7)
+    print(f"10**6 values of F(n) mod 10**9+7: {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    fibonacci_examples()
@@ -0,0 +1,435 @@
+"""
+GRAPH I/O
+=========
+
+Loading large graphs from edge-list files into CSR form (see csr_graph.py),
+with a compact binary cache that later runs open through `np.memmap`.
+
+Building an app.py-style adjacency dictionary for tens of millions of edges
+takes minutes and gigabytes. Here the edge list is parsed in chunks with
+NumPy, turned into CSR arrays with a counting sort, and written once to a
+cache file. Opening the cache afterwards only maps the file into memory, so
+startup cost no longer depends on the size of the graph.
+
+The CSRAdjacency adapter exposes a CSR graph through the dictionary interface
+that app.bfs, app.dfs_iterative and app.shortest_path_bfs expect.
+
+Cache file layout (little-endian):
+    64-byte header: magic, version, flags, vertex count, edge count,
+                    16-byte digest of the parse options
+    offsets   int64[n + 1]
+    targets   int32[m] or int64[m]
+    weights   float64[m]        (if flag FLAG_WEIGHTS)
+    labels    int64[n]          (if flag FLAG_LABELS)
+Every array starts on a 64-byte boundary.
+"""
+
+import hashlib
+import inspect
+import os
+import struct
+from collections.abc import Mapping
+
+import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+from csr_graph import CSRGraph, index_dtype
+
+
+CACHE_MAGIC = b"CSRGRAPH"
+CACHE_VERSION = 2
+CACHE_SUFFIX = ".csr"
+
+FLAG_WEIGHTS = 1
+FLAG_LABELS = 2
+FLAG_WIDE_TARGETS = 4
+
+_HEADER = struct.Struct("<8sIIqq16s")
+_ALIGN = 64
+
+
+# =============================================================================
+# 1. EDGE-LIST PARSING
+# =============================================================================
+
+def iter_edge_chunks(path, delimiter=None, comments="#", skip_header=0,
+                     weighted=False, chunk_bytes=64 * 2**20):
+    """
+    Parse an edge-list or CSV file in chunks.
+    Time Complexity: O(E)
+    Space Complexity: O(chunk size)
+
+    Each line holds `source target` or `source target weight`. Vertex ids
+    must be integers; any further columns are ignored.
+
+    Args:
+        path: Path to the edge-list file
+        delimiter: Column separator (None means any whitespace, ',' for CSV)
+        comments: Lines starting with this prefix are skipped
+        skip_header: Number of leading lines to skip (e.g. 1 for a CSV header)
+        weighted: Whether to read a third column of edge weights
+        chunk_bytes: Approximate number of bytes to parse per chunk
+
+    Yields:
+        Tuples (sources, targets, weights) of NumPy arrays; weights is None
+        when weighted is False
+    """
+    usecols = (0, 1, 2) if weighted else (0, 1)
+
+    with open(path, "r") as f:
+        for _ in range(skip_header):
+            f.readline()
+
+        while True:
+            lines = f.readlines(chunk_bytes)
+            if not lines:
+                break
+
+            # loadtxt has a C parser and accepts a list of lines directly
+            data = np.loadtxt(lines, delimiter=delimiter, comments=comments,
+                              usecols=usecols, ndmin=2,
+                              dtype=np.float64 if weighted else np.int64)
+            if len(data) == 0:
+                continue
+
+            if weighted:
+                yield data[:, 0].astype(np.int64), data[:, 1].astype(np.int64), data[:, 2]
+            else:
+                yield data[:, 0], data[:, 1], None
+
+
+def edges_to_csr(sources, targets, weights=None, num_vertices=None, relabel=False):
+    """
+    Build a CSR graph from parallel edge arrays with a counting sort.
+    Time Complexity: O(V + E) for the offsets, O(E log E) for the stable ordering
+    Space Complexity: O(V + E)
+
+    Args:
+        sources, targets: Integer arrays of edge endpoints
+        weights: Optional array of edge weights
+        num_vertices: Total vertex count (default: max id + 1)
+        relabel: Compact sparse ids (e.g. 10**12-scale user ids) to 0..n-1
+                 and keep the originals as sorted labels
+
+    Returns:
+        CSRGraph
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    labels = None
+
+    if relabel:
+        labels, inverse = np.unique(np.concatenate([sources, targets]), return_inverse=True)
+        sources = inverse[:len(sources)]
+        targets = inverse[len(sources):]
+        num_vertices = len(labels)
+    elif num_vertices is None:
+        num_vertices = int(max(sources.max(initial=-1), targets.max(initial=-1))) + 1
+
+    if len(sources) and (sources.min() < 0 or targets.min() < 0):
+        raise ValueError("Vertex ids must be non-negative (use relabel=True)")
+
+    counts = np.bincount(sources, minlength=num_vertices)
+    if len(counts) > num_vertices or (len(targets) and targets.max() >= num_vertices):
+        raise ValueError("Edge endpoint exceeds num_vertices")
+    offsets = np.zeros(num_vertices + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    # Stable sort keeps each vertex's neighbors in file order
+    order = np.argsort(sources, kind="stable")
+    csr_targets = targets[order].astype(index_dtype(num_vertices))
+    csr_weights = None if weights is None else np.asarray(weights, dtype=np.float64)[order]
+
+    return CSRGraph(offsets, csr_targets, csr_weights, labels)
+
+
+def read_edge_list(path, delimiter=None, comments="#", skip_header=0,
+                   weighted=False, undirected=False, num_vertices=None,
+                   relabel=False, chunk_bytes=64 * 2**20):
+    """
+    Parse an edge-list file into a CSR graph.
+    Time Complexity: O(E log E)
+    Space Complexity: O(V + E)
+
+    Args:
+        path: Path to the edge-list file
+        delimiter, comments, skip_header, weighted, chunk_bytes: See iter_edge_chunks
+        undirected: Add the reverse of every edge
+        num_vertices, relabel: See edges_to_csr
+
+    Returns:
+        CSRGraph
+    """
+    src_chunks, dst_chunks, weight_chunks = [], [], []
+    for src, dst, w in iter_edge_chunks(path, delimiter, comments, skip_header,
+                                        weighted, chunk_bytes):
+        # Narrow each chunk right away so peak memory stays close to the final size
+        fits = -2**31 <= min(src.min(), dst.min()) and max(src.max(), dst.max()) < 2**31
+        narrow = np.int32 if fits else np.int64
+        src_chunks.append(src.astype(narrow))
+        dst_chunks.append(dst.astype(narrow))
+        if weighted:
+            weight_chunks.append(w)
+
+    if src_chunks:
+        sources = np.concatenate(src_chunks)
+        targets = np.concatenate(dst_chunks)
+        weights = np.concatenate(weight_chunks) if weighted else None
+    else:
+        sources = targets = np.empty(0, dtype=np.int64)
+        weights = np.empty(0) if weighted else None
+    del src_chunks, dst_chunks, weight_chunks
+
+    if undirected:
+        sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+        if weights is not None:
+            weights = np.concatenate([weights, weights])
+
+    return edges_to_csr(sources, targets, weights, num_vertices, relabel)
+
+
+# =============================================================================
+# 2. BINARY CACHE
+# =============================================================================
+
+def _pad(f):
+    """Advance the file position to the next _ALIGN boundary"""
+    position = f.tell()
+    remainder = position % _ALIGN
+    if remainder:
+        f.write(b"\0" * (_ALIGN - remainder))
+
+
+def options_digest(**parse_options):
+    """
+    16-byte digest of read_edge_list options, with defaults filled in.
+
+    chunk_bytes only changes how the file is read, not the graph, so it is
+    left out.
+    """
+    bound = inspect.signature(read_edge_list).bind(None, **parse_options)
+    bound.apply_defaults()
+    options = {name: value for name, value in bound.arguments.items()
+               if name not in ("path", "chunk_bytes")}
+    return hashlib.blake2b(repr(sorted(options.items())).encode(), digest_size=16).digest()
+
+
+def save_csr_cache(graph, path, digest=bytes(16)):
+    """
+    Write a CSR graph to the binary cache format.
+    Time Complexity: O(V + E)
+
+    The file is written to a temporary name and renamed into place, so a
+    crashed run never leaves a truncated cache behind.
+
+    Args:
+        graph: CSRGraph whose labels are None or an integer ndarray
+        path: Destination file path
+        digest: options_digest() of the options the graph was parsed with
+
+    Raises:
+        ValueError: If the graph has non-integer labels
+    """
+    flags = 0
+    labels = graph.labels
+    if labels is not None:
+        labels = np.asarray(labels)
+        if labels.dtype.kind not in "iu":
+            raise ValueError("Only integer vertex labels can be cached")
+        flags |= FLAG_LABELS
+    if graph.weights is not None:
+        flags |= FLAG_WEIGHTS
+    if index_dtype(graph.num_vertices) == np.int64:
+        flags |= FLAG_WIDE_TARGETS
+
+    target_dtype = np.int64 if flags & FLAG_WIDE_TARGETS else np.int32
+    tmp_path = f"{path}.tmp{os.getpid()}"
+
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, flags,
+                             graph.num_vertices, graph.num_edges, digest))
+        _pad(f)
+        for array, dtype in ((graph.offsets, np.int64),
+                             (graph.targets, target_dtype),
+                             (graph.weights, np.float64),
+                             (labels, np.int64)):
+            if array is None:
+                continue
+            np.ascontiguousarray(array, dtype=np.dtype(dtype).newbyteorder("<")).tofile(f)
+            _pad(f)
+
+    os.replace(tmp_path, path)
+
+
+def open_csr_cache(path, digest=None):
+    """
+    Open a binary cache with memory-mapped, read-only arrays.
+    Time Complexity: O(1) - pages are loaded lazily by the operating system
+    Space Complexity: O(1) resident until arrays are touched
+
+    Args:
+        path: Path to a file written by save_csr_cache
+        digest: If given, the options digest the cache must have been saved with
+
+    Returns:
+        CSRGraph backed by np.memmap arrays
+
+    Raises:
+        ValueError: If the file is not a compatible cache, or its digest differs
+    """
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise ValueError(f"{path} is not a CSR cache file")
+
+    magic, version, flags, n, m, saved_digest = _HEADER.unpack(header)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION:
+        raise ValueError(f"{path} is not a CSR cache file (version {CACHE_VERSION})")
+    if digest is not None and digest != saved_digest:
+        raise ValueError(f"{path} was built with different parse options")
+
+    position = _ALIGN
+
+    def take(dtype, count):
+        nonlocal position
+        dtype = np.dtype(dtype).newbyteorder("<")
+        if count == 0:
+            array = np.empty(0, dtype=dtype)
+        else:
+            array = np.memmap(path, dtype=dtype, mode="r", offset=position, shape=(count,))
+        size = dtype.itemsize * count
+        position += size + (-size % _ALIGN)
+        return array
+
+    offsets = take(np.int64, n + 1)
+    targets = take(np.int64 if flags & FLAG_WIDE_TARGETS else np.int32, m)
+    weights = take(np.float64, m) if flags & FLAG_WEIGHTS else None
+    labels = take(np.int64, n) if flags & FLAG_LABELS else None
+
+    return CSRGraph(offsets, targets, weights, labels)
+
+
+def load_graph(path, cache_path=None, rebuild=False, **parse_options):
+    """
+    Load an edge-list file, using the binary cache when it is up to date.
+    Time Complexity: O(1) with a fresh cache, O(E log E) otherwise
+
+    The cache is fresh when it is newer than the edge list and was built
+    with the same parse options (weighted, undirected, relabel, ...);
+    otherwise it is rebuilt.
+
+    Args:
+        path: Path to the edge-list file
+        cache_path: Cache location (default: path + '.csr'); False disables caching
+        rebuild: Ignore any existing cache and re-parse the edge list
+        **parse_options: Forwarded to read_edge_list
+
+    Returns:
+        CSRGraph (memory-mapped when served from the cache)
+    """
+    if cache_path is False:
+        return read_edge_list(path, **parse_options)
+    if cache_path is None:
+        cache_path = path + CACHE_SUFFIX
+
+    digest = options_digest(**parse_options)
+    fresh = (os.path.exists(cache_path)
+             and os.path.getmtime(cache_path) >= os.path.getmtime(path))
+    if fresh and not rebuild:
+        try:
+            return open_csr_cache(cache_path, digest)
+        except ValueError:
+            pass  # Stale format, other options or foreign file: rebuild
+
+    graph = read_edge_list(path, **parse_options)
+    save_csr_cache(graph, cache_path, digest)
+    return open_csr_cache(cache_path, digest)
+
+
+# =============================================================================
+# 3. ADJACENCY ADAPTER FOR app.py
+# =============================================================================
+
+class CSRAdjacency(Mapping):
+    """
+    Read-only dictionary view of a CSR graph.
+
+    Lets the existing app.py functions (bfs, dfs_iterative, dfs_recursive,
+    shortest_path_bfs) run unchanged on a loaded graph:
+
+        adjacency = CSRAdjacency(load_graph("edges.txt"))
+        app.bfs(adjacency, 0)
+
+    graph[v] returns the neighbor labels of v as a list, built on demand
+    from the CSR slice; nothing is materialized up front.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+
+    def __getitem__(self, label):
+        v = self.graph.index_of(label)
+        neighbors = self.graph.neighbors(v)
+        if self.graph.labels is None:
+            return neighbors.tolist()
+        if isinstance(self.graph.labels, np.ndarray):
+            return self.graph.labels[neighbors].tolist()
+        return [self.graph.labels[t] for t in neighbors]
+
+    def __contains__(self, label):
+        return label in self.graph
+
+    def __iter__(self):
+        for v in range(self.graph.num_vertices):
+            yield self.graph.label_of(v)
+
+    def __len__(self):
+        return self.graph.num_vertices
+
+
+# Example usage of graph loading
+def graph_io_examples():
+    import tempfile
+    import app
+
+    edges = "# source target\n0 1\n0 2\n1 3\n1 4\n2 5\n4 5\n"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "edges.txt")
+        with open(path, "w") as f:
+            f.write(edges)
+
+        graph = load_graph(path, undirected=True)
+        print(f"Loaded {graph} (cached at {path + CACHE_SUFFIX})")
+        print(f"Offsets backed by: {type(graph.offsets).__name__}")
+
+        adjacency = CSRAdjacency(graph)
+        print(f"BFS from 0: {app.bfs(adjacency, 0)}")
+        print(f"DFS from 0: {app.dfs_iterative(adjacency, 0)}")
+        print(f"Shortest path 3 -> 5: {app.shortest_path_bfs(adjacency, 3, 5)}")
+        del graph, adjacency  # Release the memory map before the directory is removed
+
+
+def benchmark_graph_io(num_vertices=1_000_000, num_edges=10_000_000):
+    """Compare parse time against cold-open time of the memory-mapped cache"""
+    import tempfile
+    import time
+
+    rng = np.random.default_rng(0)
+    edges = rng.integers(0, num_vertices, size=(num_edges, 2))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "edges.txt")
+        np.savetxt(path, edges, fmt="%d")
+
+        start = time.perf_counter()
+        graph = load_graph(path, rebuild=True)
+        print(f"Parse + build + cache {num_edges:,} edges: {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        graph = load_graph(path)
+        print(f"Open from cache: {(time.perf_counter() - start) * 1e3:.2f}ms")
+        del graph
+
+
+if __name__ == "__main__":
+    graph_io_examples()
@@ -0,0 +1,454 @@
+"""
+ALGORITHM INSTRUMENTATION
+=========================
+
+Opt-in operation counters for the algorithms in app.py.
+
+Wall-clock time says that bubble_sort or bfs is slow on some input, not why.
+This module counts what the algorithms actually do:
+
+- comparisons between elements (<, <=, >, >=, ==, !=)
+- element writes (moves) and swaps inside the input list
+- calls and maximum recursion depth per function
+- container operations (list.append, list.pop, ...) made by the algorithm,
+  which is how bfs/dfs use their queues and stacks
+- bytes allocated, through tracemalloc
+
+Nothing in app.py is modified. Counting happens through two mechanisms that
+only exist inside an enabled Probe, so disabled code paths are exactly the
+original ones and cost nothing:
+
+1. Tracked values and TrackedList wrap the input data and count the
+   comparisons and writes performed on them
+2. A sys.setprofile hook, installed only for the duration of the probe,
+   sees Python calls/returns (recursion depth) and builtin method calls
+   (queue/stack operations) made from the instrumented module
+
+Usage:
+
+    with Probe(app, label="bubble_sort") as probe:
+        result = app.bubble_sort(probe.track([5, 3, 1, 4]))
+    print(probe.report())
+    print(probe.to_prometheus())
+"""
+
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from functools import wraps
+
+
+# Builtin container methods reported as queue / stack operations
+CONTAINER_METHODS = frozenset({
+    "append", "appendleft", "pop", "popleft", "insert", "extend",
+    "extendleft", "remove", "add", "discard", "clear", "copy",
+})
+
+
+# =============================================================================
+# 1. TRACKED DATA
+# =============================================================================
+
+class Counters:
+    """Plain counter record shared by a probe and the data it tracks"""
+
+    __slots__ = ("comparisons", "moves", "swaps", "_last_write")
+
+    def __init__(self):
+        self.comparisons = 0
+        self.moves = 0
+        self.swaps = 0
+        self._last_write = None
+
+
+class Tracked:
+    """
+    Value wrapper that counts every comparison made on it.
+
+    Supports ordering, equality, hashing and use as an index (so counting
+    sort can do count[value]); the original value is in .value. All six
+    rich comparisons are defined directly so each counts exactly once.
+    """
+
+    __slots__ = ("value", "_counters")
+
+    def __init__(self, value, counters):
+        self.value = value
+        self._counters = counters
+
+    @staticmethod
+    def _raw(other):
+        return other.value if isinstance(other, Tracked) else other
+
+    def __eq__(self, other):
+        self._counters.comparisons += 1
+        return self.value == self._raw(other)
+
+    def __ne__(self, other):
+        self._counters.comparisons += 1
+        return self.value != self._raw(other)
+
+    def __lt__(self, other):
+        self._counters.comparisons += 1
+        return self.value < self._raw(other)
+
+    def __le__(self, other):
+        self._counters.comparisons += 1
+        return self.value <= self._raw(other)
+
+    def __gt__(self, other):
+        self._counters.comparisons += 1
+        return self.value > self._raw(other)
+
+    def __ge__(self, other):
+        self._counters.comparisons += 1
+        return self.value >= self._raw(other)
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __index__(self):
+        return self.value.__index__()
+
+    def __int__(self):
+        return int(self.value)
+
+    def __float__(self):
+        return float(self.value)
+
+    # Arithmetic is not counted and returns plain values (e.g. max_val + 1)
+    def __add__(self, other):
+        return self.value + self._raw(other)
+
+    def __radd__(self, other):
+        return self._raw(other) + self.value
+
+    def __sub__(self, other):
+        return self.value - self._raw(other)
+
+    def __rsub__(self, other):
+        return self._raw(other) - self.value
+
+    def __mul__(self, other):
+        return self.value * self._raw(other)
+
+    __rmul__ = __mul__
+
+    def __repr__(self):
+        return repr(self.value)
+
+
+class TrackedList(list):
+    """
+    List that counts element writes and detects swaps.
+
+    Two consecutive writes that exchange the values at positions i and j
+    (as in `a[i], a[j] = a[j], a[i]`) count as one swap and two moves.
+    Slices and copies stay tracked, so algorithms that copy or split their
+    input (bubble_sort, merge_sort) keep counting.
+    """
+
+    def __init__(self, items, counters):
+        super().__init__(items)
+        self._counters = counters
+
+    def __setitem__(self, index, value):
+        c = self._counters
+        if isinstance(index, slice):
+            super().__setitem__(index, value)
+            c.moves += len(range(*index.indices(len(self))))
+            c._last_write = None
+            return
+
+        old = list.__getitem__(self, index)
+        super().__setitem__(index, value)
+        c.moves += 1
+
+        last = c._last_write
+        if (last is not None and last[0] is self and last[1] != index
+                and value is last[2] and old is last[3]):
+            c.swaps += 1
+            c._last_write = None
+        else:
+            c._last_write = (self, index, old, value)
+
+    def __getitem__(self, index):
+        result = super().__getitem__(index)
+        if isinstance(index, slice):
+            return TrackedList(result, self._counters)
+        return result
+
+    def copy(self):
+        return TrackedList(self, self._counters)
+
+
+def untrack(data):
+    """Strip Tracked wrappers from a value or a (nested) list"""
+    if isinstance(data, Tracked):
+        return data.value
+    if isinstance(data, list):
+        return [untrack(x) for x in data]
+    return data
+
+
+# =============================================================================
+# 2. PROBE
+# =============================================================================
+
+class Probe:
+    """
+    Context manager collecting operation counts for code in a module.
+
+    Only one probe per thread can be active at a time; nesting replaces the
+    outer profile hook until the inner probe exits.
+    """
+
+    def __init__(self, module, label=None, memory=False):
+        """
+        Args:
+            module: Module whose functions are instrumented (e.g. app)
+            label: Name used in reports and Prometheus labels
+            memory: Also measure allocations with tracemalloc (slower)
+        """
+        self.module = module
+        self.label = label or module.__name__
+        self.memory = memory
+        self.counters = Counters()
+        self.calls = Counter()
+        self.max_depth = Counter()
+        self.container_ops = Counter()
+        self.allocated_bytes = 0
+        self.peak_bytes = 0
+        self._depth = Counter()
+        self._codes = {}
+        self._previous_profile = None
+        self._started_tracemalloc = False
+
+    def track(self, data):
+        """
+        Wrap input data so comparisons and writes on it are counted.
+
+        Lists become TrackedLists of Tracked values (nested lists are
+        tracked recursively); other values are wrapped in Tracked.
+        """
+        if isinstance(data, list):
+            return TrackedList((self.track(x) for x in data), self.counters)
+        if isinstance(data, Tracked):
+            return data
+        return Tracked(data, self.counters)
+
+    def _collect_codes(self):
+        """Code objects of every function and method defined in the module"""
+        codes = {}
+        for name, obj in vars(self.module).items():
+            if getattr(obj, "__module__", None) != self.module.__name__:
+                continue
+            if isinstance(obj, type):
+                for attr, member in vars(obj).items():
+                    code = getattr(member, "__code__", None)
+                    if code is not None:
+                        codes[code] = f"{name}.{attr}"
+            elif hasattr(obj, "__code__"):
+                codes[obj.__code__] = name
+        return codes
+
+    def _profile(self, frame, event, arg):
+        if event == "call":
+            name = self._codes.get(frame.f_code)
+            if name is not None:
+                self.calls[name] += 1
+                self._depth[name] += 1
+                if self._depth[name] > self.max_depth[name]:
+                    self.max_depth[name] = self._depth[name]
+        elif event == "return":
+            name = self._codes.get(frame.f_code)
+            if name is not None:
+                self._depth[name] -= 1
+        elif event == "c_call":
+            # frame is the caller; only count operations made by module code
+            if frame.f_code in self._codes and getattr(arg, "__name__", None) in CONTAINER_METHODS:
+                owner = type(getattr(arg, "__self__", None)).__name__
+                self.container_ops[f"{owner}.{arg.__name__}"] += 1
+
+    def __enter__(self):
+        self._codes = self._collect_codes()
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            tracemalloc.reset_peak()
+            self._memory_start = tracemalloc.get_traced_memory()[0]
+        self._previous_profile = sys.getprofile()
+        sys.setprofile(self._profile)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        sys.setprofile(self._previous_profile)
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            self.allocated_bytes = current - self._memory_start
+            self.peak_bytes = peak - self._memory_start
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+        return False
+
+    def report(self):
+        """
+        Structured summary of everything counted.
+
+        Returns:
+            Dict with comparisons, moves, swaps, calls, max_recursion_depth,
+            container_ops and (with memory=True) allocated/peak bytes
+        """
+        result = {
+            "label": self.label,
+            "comparisons": self.counters.comparisons,
+            "moves": self.counters.moves,
+            "swaps": self.counters.swaps,
+            "calls": dict(self.calls),
+            "max_recursion_depth": dict(self.max_depth),
+            "container_ops": dict(self.container_ops),
+        }
+        if self.memory:
+            result["allocated_bytes"] = self.allocated_bytes
+            result["peak_bytes"] = self.peak_bytes
+        return result
+
+    def to_prometheus(self, prefix="algorithm"):
+        """
+        Render the counters in the Prometheus text exposition format.
+
+        Returns:
+            String with HELP/TYPE headers and one sample per series
+        """
+        label = _escape(self.label)
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for extra, value in samples:
+                labels = f'label="{label}"' + "".join(f',{k}="{_escape(v)}"' for k, v in extra)
+                lines.append(f"{prefix}_{name}{{{labels}}} {value}")
+
+        metric("comparisons_total", "counter", "Element comparisons.",
+               [((), self.counters.comparisons)])
+        metric("moves_total", "counter", "Element writes into tracked lists.",
+               [((), self.counters.moves)])
+        metric("swaps_total", "counter", "Element swaps in tracked lists.",
+               [((), self.counters.swaps)])
+        metric("calls_total", "counter", "Function calls.",
+               [((("function", f),), n) for f, n in sorted(self.calls.items())])
+        metric("max_recursion_depth", "gauge", "Deepest recursion reached.",
+               [((("function", f),), n) for f, n in sorted(self.max_depth.items())])
+        metric("container_ops_total", "counter", "Queue/stack/container method calls.",
+               [((("op", op),), n) for op, n in sorted(self.container_ops.items())])
+        if self.memory:
+            metric("allocated_bytes", "gauge", "Net bytes allocated.",
+                   [((), self.allocated_bytes)])
+            metric("peak_bytes", "gauge", "Peak bytes allocated.",
+                   [((), self.peak_bytes)])
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    """Escape a Prometheus label value"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# =============================================================================
+# 3. CONVENIENCE WRAPPERS
+# =============================================================================
+
+# Flip to True (or use enable()) to make @instrumented functions record reports
+_enabled = threading.local()
+
+
+def enable(flag=True):
+    """Turn @instrumented reporting on or off for the current thread"""
+    _enabled.value = flag
+
+
+def profile_call(module, fn, *args, memory=False, **kwargs):
+    """
+    Run fn(*args, **kwargs) under a Probe, tracking list arguments.
+
+    Returns:
+        Tuple (result with Tracked wrappers removed, report dict)
+    """
+    with Probe(module, label=fn.__name__, memory=memory) as probe:
+        tracked = [probe.track(a) if isinstance(a, list) else a for a in args]
+        result = fn(*tracked, **kwargs)
+    return untrack(result), probe.report()
+
+
+def instrumented(module, memory=False, sink=None):
+    """
+    Decorator form of profile_call, active only while enable() is on.
+
+    When disabled, the wrapper is a single thread-local flag check followed
+    by the original call. When enabled, each call's report is passed to
+    sink (default: appended to the wrapper's .reports list).
+
+    Args:
+        module: Module whose functions are instrumented
+        memory: Measure allocations with tracemalloc
+        sink: Optional callable receiving each report dict
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not getattr(_enabled, "value", False):
+                return fn(*args, **kwargs)
+            result, report = profile_call(module, fn, *args, memory=memory, **kwargs)
+            (sink or wrapper.reports.append)(report)
+            return result
+
+        wrapper.reports = []
+        return wrapper
+
+    return decorator
+
+
+# Example usage of the instrumentation layer
+def instrument_examples():
+    import random
+    import app
+
+    # [3, 2, 1] takes exactly 3 adjacent comparisons to bubble sort
+    _, report = profile_call(app, app.bubble_sort, [3, 2, 1])
+    print(f"bubble_sort([3, 2, 1]): {report['comparisons']} comparisons")
+    if report["comparisons"] != 3:
+        raise AssertionError(f"expected 3 comparisons, counted {report['comparisons']}")
+
+    random.seed(0)
+    data = [random.randrange(100) for _ in range(200)]
+
+    for fn in (app.bubble_sort, app.insertion_sort, app.merge_sort, app.quick_sort):
+        _, report = profile_call(app, fn, data)
+        depth = max(report["max_recursion_depth"].values(), default=0)
+        print(f"{fn.__name__:>15}: comparisons={report['comparisons']:>6} "
+              f"moves={report['moves']:>6} swaps={report['swaps']:>6} depth={depth}")
+
+    print("Already sorted input:")
+    _, report = profile_call(app, app.quick_sort, sorted(data))
+    print(f"     quick_sort: max depth {report['max_recursion_depth']['quick_sort_helper']} "
+          f"(worst case: last-element pivot on sorted data)")
+
+    graph = {v: [(v * 7 + k) % 500 for k in (1, 2, 3)] for v in range(500)}
+    _, report = profile_call(app, app.bfs, graph, 0, memory=True)
+    print(f"bfs queue/list operations: {report['container_ops']}, "
+          f"peak bytes: {report['peak_bytes']}")
+
+    with Probe(app, label="stack_demo") as probe:
+        stack = app.Stack()
+        for i in range(3):
+            stack.push(i)
+        stack.pop()
+    print(probe.to_prometheus())
+
+
+if __name__ == "__main__":
+    instrument_examples()
@@ -0,0 +1,474 @@
+"""
+MEMOIZATION
+===========
+
+A reusable caching decorator with configurable eviction.
+
+app.fibonacci_memoized threads a dictionary through every call by hand; the
+dictionary is never bounded and is thrown away when the call returns. The
+memoize decorator here keeps one cache per function and supports:
+
+1. Eviction policies: LRU (least recently used) or LFU (least frequently
+   used), plus an optional time-to-live on every entry
+2. Limits on the number of entries and on the approximate bytes held
+3. Keys for unhashable arguments such as lists, dicts and NumPy arrays
+4. Hit / miss / eviction counters
+5. Optional persistence to a pickle file, and thread safety
+
+Usage:
+
+    @memoize(maxsize=1024, policy="lfu", ttl=60)
+    def expensive(x):
+        ...
+
+    expensive.cache_info()   # CacheInfo(hits=..., misses=..., evictions=..., ...)
+"""
+
+import atexit
+import functools
+import hashlib
+import os
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "expired",
+                                     "currsize", "maxsize", "bytes", "max_bytes"])
+
+_MISSING = object()
+
+
+class _Tag:
+    """
+    Private marker inside keys, so a frozen list can never equal a real
+    argument that happens to look like one. Pickles as a reference to the
+    module-level singleton, so keys survive persistence.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __reduce__(self):
+        return self.name
+
+    def __repr__(self):
+        return self.name
+
+
+# Separates positional from keyword arguments; tags frozen containers
+_KWARGS_MARK = _Tag("_KWARGS_MARK")
+_LIST = _Tag("_LIST")
+_TUPLE = _Tag("_TUPLE")
+_DICT = _Tag("_DICT")
+_SET = _Tag("_SET")
+_NDARRAY = _Tag("_NDARRAY")
+
+
+# =============================================================================
+# 1. KEYS AND SIZES
+# =============================================================================
+
+def make_key(args, kwargs, typed=False):
+    """
+    Build a hashable cache key from call arguments.
+    Time Complexity: O(total size of the arguments) for unhashable arguments
+
+    Hashable arguments are used as they are. Lists, tuples, sets and dicts
+    are converted recursively; NumPy arrays (or anything exposing dtype,
+    shape and tobytes) are reduced to their dtype, shape and a digest of
+    their contents.
+
+    Args:
+        args: Positional arguments tuple
+        kwargs: Keyword arguments dict
+        typed: Treat arguments of different types as distinct (1 vs 1.0)
+
+    Returns:
+        A hashable key
+    """
+    key = tuple(_freeze(a, typed) for a in args)
+    if kwargs:
+        key += (_KWARGS_MARK,) + tuple(sorted((k, _freeze(v, typed)) for k, v in kwargs.items()))
+    return key
+
+
+def _freeze(value, typed):
+    """Convert a value into a hashable equivalent"""
+    if isinstance(value, list):
+        return (_LIST, tuple(_freeze(v, typed) for v in value))
+    if isinstance(value, tuple):
+        frozen = tuple(_freeze(v, typed) for v in value)
+        return (_TUPLE, type(value).__name__, frozen) if typed else frozen
+    if isinstance(value, dict):
+        # A frozenset of items: no ordering, so mixed-type keys are fine
+        return (_DICT, frozenset((k, _freeze(v, typed)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return (_SET, frozenset(_freeze(v, typed) for v in value))
+    if hasattr(value, "tobytes") and hasattr(value, "dtype") and hasattr(value, "shape"):
+        digest = hashlib.blake2b(value.tobytes(), digest_size=16).digest()
+        return (_NDARRAY, str(value.dtype), tuple(value.shape), digest)
+    if typed:
+        return (type(value), value)
+    return value
+
+
+def sizeof(value):
+    """
+    Approximate memory held by a cached value, in bytes.
+
+    Uses the buffer size for arrays and big integers / strings from
+    sys.getsizeof; containers are measured one level deep.
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(sys.getsizeof(v) for v in value)
+    elif isinstance(value, dict):
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+    return size
+
+
+# =============================================================================
+# 2. CACHE STORE
+# =============================================================================
+
+class Cache:
+    """
+    Bounded key/value store with LRU or LFU eviction and optional TTL.
+
+    LRU order lives in an OrderedDict. LFU keeps one OrderedDict of keys per
+    access count plus the current minimum count, so lookups, inserts and
+    evictions are all O(1); ties within a count are broken by recency.
+    """
+
+    def __init__(self, maxsize=128, policy="lru", ttl=None, max_bytes=None,
+                 sizeof=sizeof, thread_safe=True):
+        """
+        Args:
+            maxsize: Maximum number of entries (None for unbounded)
+            policy: 'lru' or 'lfu'
+            ttl: Seconds an entry stays valid (None for no expiry)
+            max_bytes: Maximum approximate bytes of cached values (None for no limit)
+            sizeof: Function estimating the bytes of a value
+            thread_safe: Guard every operation with a lock
+
+        Raises:
+            ValueError: For an unknown policy
+        """
+        if policy not in ("lru", "lfu"):
+            raise ValueError(f"Unknown eviction policy: {policy!r}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._lock = threading.RLock() if thread_safe else _NullLock()
+
+        # key -> [value, size, expires_at, frequency]
+        self._entries = {}
+        self._order = OrderedDict()   # LRU recency order
+        self._freq = {}               # LFU: frequency -> OrderedDict of keys
+        self._min_freq = 0
+
+        self.hits = self.misses = self.evictions = self.expired = 0
+        self.bytes = 0
+
+    # --- bookkeeping ---------------------------------------------------------
+
+    def _touch(self, key, entry):
+        if self.policy == "lru":
+            self._order.move_to_end(key)
+            return
+        freq = entry[3]
+        bucket = self._freq[freq]
+        del bucket[key]
+        if not bucket:
+            del self._freq[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+        entry[3] = freq + 1
+        self._freq.setdefault(freq + 1, OrderedDict())[key] = None
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self.bytes -= entry[1]
+        if self.policy == "lru":
+            del self._order[key]
+        else:
+            bucket = self._freq[entry[3]]
+            del bucket[key]
+            if not bucket:
+                del self._freq[entry[3]]
+        return entry
+
+    def _victim(self):
+        if self.policy == "lru":
+            return next(iter(self._order))
+        if self._min_freq not in self._freq:
+            self._min_freq = min(self._freq)
+        return next(iter(self._freq[self._min_freq]))
+
+    def _needs_room(self, size):
+        if self.maxsize is not None and len(self._entries) >= self.maxsize:
+            return True
+        return self.max_bytes is not None and self.bytes + size > self.max_bytes
+
+    # --- public interface ----------------------------------------------------
+
+    def get(self, key, default=None):
+        """Return the cached value for key, counting a hit or a miss - O(1)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] <= time.monotonic():
+                self._remove(key)
+                self.expired += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._touch(key, entry)
+            return entry[0]
+
+    def put(self, key, value):
+        """Insert or replace a value, evicting entries as needed - O(1) amortized"""
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return  # Larger than the whole cache: never worth storing
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            # Evict before inserting, so under LFU the new entry (count 1)
+            # is not itself the first candidate for eviction
+            while self._entries and self._needs_room(size):
+                self._remove(self._victim())
+                self.evictions += 1
+            if self.maxsize == 0:
+                return
+            self._entries[key] = [value, size, expires, 1]
+            self.bytes += size
+            if self.policy == "lru":
+                self._order[key] = None
+            else:
+                self._freq.setdefault(1, OrderedDict())[key] = None
+                self._min_freq = 1
+
+    def clear(self):
+        """Remove every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._order.clear()
+            self._freq.clear()
+            self._min_freq = 0
+            self.hits = self.misses = self.evictions = self.expired = 0
+            self.bytes = 0
+
+    def info(self):
+        """Snapshot of the cache counters"""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.expired,
+                             len(self._entries), self.maxsize, self.bytes, self.max_bytes)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    # --- persistence ---------------------------------------------------------
+
+    def save(self, path):
+        """
+        Write the live entries to a pickle file (atomically via rename).
+
+        Remaining TTL is stored so expiry survives a restart; eviction order
+        is preserved for LRU.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self.policy == "lru":
+                keys = list(self._order)
+            else:
+                keys = [k for f in sorted(self._freq) for k in self._freq[f]]
+            items = []
+            for key in keys:
+                value, _, expires, freq = self._entries[key]
+                remaining = None if expires is None else expires - now
+                if remaining is None or remaining > 0:
+                    items.append((key, value, remaining, freq))
+
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(items, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def load(self, path):
+        """Load entries written by save(); a missing or corrupt file is ignored"""
+        try:
+            with open(path, "rb") as f:
+                items = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            for key, value, remaining, freq in items:
+                self.put(key, value)
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                entry[2] = None if remaining is None else now + remaining
+                if self.policy == "lfu":
+                    for _ in range(freq - 1):
+                        self._touch(key, entry)
+
+
+class _NullLock:
+    """No-op stand-in for a lock when thread safety is disabled"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+# =============================================================================
+# 3. DECORATOR
+# =============================================================================
+
+def memoize(maxsize=128, policy="lru", ttl=None, max_bytes=None, key=None,
+            typed=False, persist=None, thread_safe=True, sizeof=sizeof):
+    """
+    Cache a function's results.
+    Time Complexity: O(1) per cached call plus the cost of building the key
+    Space Complexity: O(maxsize) entries, bounded by max_bytes if given
+
+    The wrapped function gains cache_info(), cache_clear() and cache_save()
+    methods and a `cache` attribute holding the Cache instance.
+
+    The function runs outside the lock, so a slow call never blocks other
+    threads; two threads missing on the same key may both compute it.
+
+    Args:
+        maxsize: Maximum number of entries (None for unbounded)
+        policy: 'lru' or 'lfu'
+        ttl: Seconds an entry stays valid (None for no expiry)
+        max_bytes: Maximum approximate bytes of cached values
+        key: Custom key function called with the same arguments as the
+             function; the default handles lists, dicts and ndarrays
+        typed: With the default key, cache 1 and 1.0 separately
+        persist: Optional pickle file; loaded at decoration time and
+                 written back by cache_save() and at interpreter exit
+        thread_safe: Guard the cache with a lock
+        sizeof: Function estimating the bytes of a value (for max_bytes)
+
+    Returns:
+        Decorator
+    """
+    def decorator(fn):
+        cache = Cache(maxsize, policy, ttl, max_bytes, sizeof, thread_safe)
+        if persist is not None:
+            cache.load(persist)
+            atexit.register(cache.save, persist)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            k = key(*args, **kwargs) if key is not None else make_key(args, kwargs, typed)
+            result = cache.get(k, _MISSING)
+            if result is _MISSING:
+                result = fn(*args, **kwargs)
+                cache.put(k, result)
+            return result
+
+        def cache_save(path=persist):
+            """Write the cache to `path` (default: the persist file)"""
+            if path is None:
+                raise ValueError("No persistence file configured")
+            cache.save(path)
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        wrapper.cache_save = cache_save
+        return wrapper
+
+    # Allow bare @memoize as well as @memoize(...)
+    if callable(maxsize):
+        fn, maxsize = maxsize, 128
+        return decorator(fn)
+    return decorator
+
+
+@contextmanager
+def memoized(module, name, **options):
+    """
+    Temporarily replace module.name with a memoized version.
+
+    Recursive functions look themselves up through the module's globals, so
+    patching the module attribute makes every recursive call go through the
+    cache, not just the outermost one:
+
+        with memoized(app, "fibonacci_recursive") as fib:
+            fib(200)
+
+    Args:
+        module: Module object holding the function
+        name: Attribute name of the function
+        **options: Forwarded to memoize()
+
+    Yields:
+        The memoized function
+    """
+    original = getattr(module, name)
+    wrapped = memoize(**options)(original)
+    setattr(module, name, wrapped)
+    try:
+        yield wrapped
+    finally:
+        setattr(module, name, original)
+
+
+# Example usage: memoizing the recursive and DP functions from app.py
+def memoize_examples():
+    import app
+
+    def timed(label, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        print(f"{label}: {time.perf_counter() - start:.4f}s")
+        return result
+
+    # Exponential recursion becomes linear once every subcall hits the cache
+    timed("app.fibonacci_recursive(27), uncached", app.fibonacci_recursive, 27)
+    with memoized(app, "fibonacci_recursive", maxsize=None) as fib:
+        timed("app.fibonacci_recursive(27), memoized", fib, 27)
+        timed("app.fibonacci_recursive(500), memoized", fib, 500)
+        print(f"Cache stats: {fib.cache_info()}")
+
+    # DP functions with repeated queries: list arguments are keyed by content
+    weights = list(range(1, 200))
+    values = [w * 3 % 17 + 1 for w in weights]
+    knapsack = memoize(maxsize=64, policy="lfu")(app.knapsack_01)
+    timed("knapsack_01, first call", knapsack, weights, values, 20_000)
+    timed("knapsack_01, repeated call", knapsack, list(weights), list(values), 20_000)
+
+    distance = memoize(maxsize=1024, ttl=30)(app.edit_distance)
+    words = ["kitten", "sitting", "mitten", "fitting"] * 250
+    timed("edit_distance over 1000 pairs with repeats",
+          lambda: [distance(a, b) for a in words[:40] for b in words[:25]])
+    print(f"edit_distance cache: {distance.cache_info()}")
+
+
+if __name__ == "__main__":
+    memoize_examples()
@@ -0,0 +1,396 @@
+"""
+NUMBER THEORY TOOLKIT
+=====================
+
+GCD/LCM over whole arrays and modular-arithmetic helpers.
+
+app.gcd and app.lcm take two Python ints each, so reducing the LCM of
+millions of values means millions of interpreted calls (and app.gcd
+recurses). This module provides:
+
+1. Element-wise gcd/lcm over NumPy arrays
+2. Tree reductions gcd_reduce / lcm_reduce over a whole array that stay in
+   int64 while the values fit and switch to Python ints before they overflow
+3. Binary (Stein) GCD and the extended Euclidean algorithm
+4. Modular inverses, one at a time or batched with a single exponentiation
+5. Chinese Remainder Theorem combination, including non-coprime moduli
+"""
+
+from math import gcd as _gcd
+
+import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+from primes import is_prime
+
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+# =============================================================================
+# 1. SCALAR ALGORITHMS
+# =============================================================================
+
+def binary_gcd(a, b):
+    """
+    Greatest common divisor by Stein's binary algorithm.
+    Time Complexity: O(log(a) + log(b)) shift/subtract steps
+    Space Complexity: O(1)
+
+    Replaces division with shifts and subtraction; the common power of two
+    is factored out once using the lowest set bit.
+
+    Args:
+        a, b: Integers
+
+    Returns:
+        Greatest common divisor of a and b (non-negative)
+    """
+    a, b = abs(a), abs(b)
+    if a == 0:
+        return b
+    if b == 0:
+        return a
+
+    shift = ((a | b) & -(a | b)).bit_length() - 1
+    a >>= (a & -a).bit_length() - 1
+    while b:
+        b >>= (b & -b).bit_length() - 1
+        if a > b:
+            a, b = b, a
+        b -= a
+    return a << shift
+
+
+def extended_gcd(a, b):
+    """
+    Extended Euclidean algorithm (iterative).
+    Time Complexity: O(log(min(a, b)))
+    Space Complexity: O(1)
+
+    Args:
+        a, b: Integers
+
+    Returns:
+        Tuple (g, x, y) with g = gcd(a, b) >= 0 and a * x + b * y = g
+    """
+    old_r, r = a, b
+    old_x, x = 1, 0
+    old_y, y = 0, 1
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_x, x = x, old_x - q * x
+        old_y, y = y, old_y - q * y
+    if old_r < 0:
+        old_r, old_x, old_y = -old_r, -old_x, -old_y
+    return old_r, old_x, old_y
+
+
+def mod_inverse(a, m):
+    """
+    Modular inverse of a modulo m.
+    Time Complexity: O(log m)
+    Space Complexity: O(1)
+
+    Args:
+        a: Integer coprime to m
+        m: Modulus >= 1
+
+    Returns:
+        x in [0, m) with a * x = 1 (mod m)
+
+    Raises:
+        ValueError: If a has no inverse modulo m
+    """
+    g, x, _ = extended_gcd(a % m, m)
+    if g != 1:
+        raise ValueError(f"{a} has no inverse modulo {m}")
+    return x % m
+
+
+# =============================================================================
+# 2. ARRAY GCD / LCM
+# =============================================================================
+
+def gcd_array(a, b):
+    """Element-wise gcd of two integer arrays (broadcasting) - O(n log max)"""
+    return np.gcd(np.asarray(a), np.asarray(b))
+
+
+def lcm_array(a, b):
+    """
+    Element-wise lcm of two integer arrays (broadcasting).
+    Time Complexity: O(n log max)
+
+    Raises:
+        OverflowError: If any result does not fit in int64
+    """
+    a = np.abs(np.asarray(a, dtype=np.int64))
+    b = np.abs(np.asarray(b, dtype=np.int64))
+    step = _lcm_step(a, b)
+    if step is None:
+        raise OverflowError("lcm exceeds int64; use lcm_reduce or object arrays")
+    return step
+
+
+def _lcm_step(x, y):
+    """Pairwise int64 lcm, or None if any result would overflow"""
+    g = np.gcd(x, y)
+    g[g == 0] = 1  # lcm(0, y) = 0 either way
+    q = x // g
+    limit = np.where(y > 0, _INT64_MAX // np.maximum(y, 1), _INT64_MAX)
+    if np.any(q > limit):
+        return None
+    return q * y
+
+
+def gcd_reduce(values):
+    """
+    GCD of every value in an array.
+    Time Complexity: O(n log max)
+    Space Complexity: O(1) extra
+
+    Works in blocks and stops as soon as the running gcd reaches 1.
+
+    Args:
+        values: Integer array-like (int64 or Python ints)
+
+    Returns:
+        Greatest common divisor of all values (0 for an empty input)
+    """
+    values = np.asarray(values)
+    if values.dtype == object:
+        result = 0
+        for v in values.ravel():
+            result = _gcd(result, int(v))
+            if result == 1:
+                break
+        return result
+
+    values = np.abs(values.ravel().astype(np.int64))
+    result = 0
+    block = 1 << 16
+    for start in range(0, len(values), block):
+        result = int(np.gcd.reduce(np.append(values[start:start + block], result)))
+        if result == 1:
+            break
+    return result
+
+
+def lcm_reduce(values):
+    """
+    LCM of every value in an array by pairwise tree reduction.
+    Time Complexity: O(u log max) for u distinct values
+    Space Complexity: O(u)
+
+    Duplicates are removed first (repeated periods are the common case).
+    Each round combines neighbours with vectorized int64 lcm, halving the
+    array. If a round would overflow int64, the rest of the reduction
+    continues on Python ints, so the result is always exact.
+
+    Args:
+        values: Integer array-like
+
+    Returns:
+        Least common multiple of all values (1 for an empty input, 0 if any value is 0)
+    """
+    values = np.asarray(values)
+    if values.dtype != object:
+        values = np.unique(np.abs(values.ravel().astype(np.int64)))
+        if len(values) and values[0] == 0:
+            return 0
+
+        while len(values) > 1:
+            if len(values) % 2:
+                values = np.append(values, 1)
+            step = _lcm_step(values[0::2], values[1::2])
+            if step is None:
+                values = values.astype(object)
+                break
+            values = step
+
+        if values.dtype != object:
+            return int(values[0]) if len(values) else 1
+
+    # Exact fallback: the same tree reduction on Python ints
+    items = [abs(int(v)) for v in values.ravel()]
+    if 0 in items:
+        return 0
+    items = list(set(items)) or [1]
+    while len(items) > 1:
+        paired = []
+        for i in range(0, len(items) - 1, 2):
+            x, y = items[i], items[i + 1]
+            paired.append(x // _gcd(x, y) * y)
+        if len(items) % 2:
+            paired.append(items[-1])
+        items = paired
+    return items[0]
+
+
+# =============================================================================
+# 3. BATCHED MODULAR INVERSES AND CRT
+# =============================================================================
+
+def _pow_mod_vectorized(base, exponent, m):
+    """base ** exponent mod m element-wise, for m < 2**32 (uint64 products)"""
+    m = np.uint64(m)
+    result = np.ones(len(base), dtype=np.uint64)
+    base = base % m
+    while exponent:
+        if exponent & 1:
+            result = result * base % m
+        base = base * base % m
+        exponent >>= 1
+    return result
+
+
+def batch_mod_inverse(values, m):
+    """
+    Modular inverses of many values at once.
+    Time Complexity: O(n log m) vectorized for prime m < 2**32,
+                     otherwise O(n + log m) with Montgomery's trick
+    Space Complexity: O(n)
+
+    Montgomery's trick: with prefix products P_i = a_0 * ... * a_i, a single
+    inverse of P_{n-1} yields every 1/a_i by walking backwards, replacing n
+    extended-Euclid runs by 3n multiplications.
+
+    Args:
+        values: Integers coprime to m
+        m: Modulus
+
+    Returns:
+        uint64 array (prime m < 2**32) or list of Python ints
+
+    Raises:
+        ValueError: If some value has no inverse modulo m
+    """
+    if m < 2**32 and is_prime(m):
+        arr = np.asarray(values, dtype=np.int64) % m
+        if np.any(arr == 0):
+            raise ValueError(f"0 has no inverse modulo {m}")
+        return _pow_mod_vectorized(arr.astype(np.uint64), m - 2, m)
+
+    values = [int(v) % m for v in values]
+    if not values:
+        return []
+    prefix = [0] * len(values)
+    running = 1
+    for i, v in enumerate(values):
+        running = running * v % m
+        prefix[i] = running
+
+    inv = mod_inverse(running, m)  # Raises if any value shares a factor with m
+    result = [0] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        result[i] = inv * prefix[i - 1] % m
+        inv = inv * values[i] % m
+    result[0] = inv
+    return result
+
+
+def crt_pair(r1, m1, r2, m2):
+    """
+    Combine x = r1 (mod m1) and x = r2 (mod m2).
+    Time Complexity: O(log(min(m1, m2)))
+
+    Moduli need not be coprime.
+
+    Returns:
+        Tuple (r, lcm(m1, m2)), or None if the congruences are inconsistent
+    """
+    g, p, _ = extended_gcd(m1, m2)
+    if (r2 - r1) % g:
+        return None
+    lcm = m1 // g * m2
+    r = (r1 + (r2 - r1) // g * p % (m2 // g) * m1) % lcm
+    return r, lcm
+
+
+def crt(residues, moduli):
+    """
+    Chinese Remainder Theorem for a whole system of congruences.
+    Time Complexity: O(n log M) with balanced (tree) combination
+    Space Complexity: O(n)
+
+    Pairs are merged in a balanced tree so the intermediate moduli grow
+    evenly instead of one huge modulus being combined with small ones.
+
+    Args:
+        residues: Sequence of remainders
+        moduli: Sequence of positive moduli
+
+    Returns:
+        Tuple (x, M) with 0 <= x < M = lcm(moduli), or None if inconsistent
+    """
+    pairs = [(int(r) % int(m), int(m)) for r, m in zip(residues, moduli)]
+    if not pairs:
+        return 0, 1
+    while len(pairs) > 1:
+        merged = []
+        for i in range(0, len(pairs) - 1, 2):
+            combined = crt_pair(*pairs[i], *pairs[i + 1])
+            if combined is None:
+                return None
+            merged.append(combined)
+        if len(pairs) % 2:
+            merged.append(pairs[-1])
+        pairs = merged
+    return pairs[0]
+
+
+# Example usage of the number theory toolkit
+def number_theory_examples():
+    print(f"binary_gcd(48, 18) = {binary_gcd(48, 18)}")
+    print(f"extended_gcd(240, 46) = {extended_gcd(240, 46)}")
+    print(f"mod_inverse(3, 11) = {mod_inverse(3, 11)}")
+
+    periods = np.array([12, 18, 30, 45, 60, 12, 18])
+    print(f"gcd of {periods.tolist()} = {gcd_reduce(periods)}")
+    print(f"lcm of {periods.tolist()} = {lcm_reduce(periods)}")
+    print(f"lcm of 1..100 (past int64) = {lcm_reduce(np.arange(1, 101))}")
+
+    print(f"Inverses of 1..6 mod 7: {batch_mod_inverse(range(1, 7), 7).tolist()}")
+    print(f"Inverses of [3, 7, 11] mod 100: {batch_mod_inverse([3, 7, 11], 100)}")
+
+    print(f"x = 2 (mod 3), 3 (mod 5), 2 (mod 7): {crt([2, 3, 2], [3, 5, 7])}")
+    print(f"x = 1 (mod 4), 3 (mod 6): {crt([1, 3], [4, 6])}")
+
+
+def benchmark_number_theory(n=1_000_000):
+    """Compare looping app.gcd/app.lcm with the array reductions"""
+    import time
+    from functools import reduce
+    import app
+
+    rng = np.random.default_rng(0)
+    periods = rng.choice([5, 10, 15, 20, 30, 60, 120, 300, 600, 900, 3600], n)
+
+    start = time.perf_counter()
+    expected = reduce(app.lcm, periods.tolist())
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    got = lcm_reduce(periods)
+    vectorized = time.perf_counter() - start
+    assert got == expected
+    print(f"lcm of {n:,} periods: app.lcm loop {loop:.3f}s, lcm_reduce {vectorized:.4f}s")
+
+    a = rng.integers(1, 10**12, n)
+    b = rng.integers(1, 10**12, n)
+    start = time.perf_counter()
+    [app.gcd(x, y) for x, y in zip(a[:n // 10].tolist(), b[:n // 10].tolist())]
+    loop = (time.perf_counter() - start) * 10
+    start = time.perf_counter()
+    gcd_array(a, b)
+    print(f"{n:,} element-wise gcds: app.gcd ~{loop:.2f}s, gcd_array {time.perf_counter() - start:.3f}s")
+
+    values = rng.integers(1, 10**9 + 7, n)
+    start = time.perf_counter()
+    batch_mod_inverse(values, 10**9 + 7)
+    print(f"{n:,} modular inverses mod 10**9+7: {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    number_theory_examples()
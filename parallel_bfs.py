@@ -0,0 +1,319 @@
+"""
+PARALLEL MULTI-SOURCE BFS
+=========================
+
+Hop distances from many sources at once, spread over a process pool.
+
+Calling app.bfs in a loop keeps a single core busy and rebuilds Python
+objects for every source. This module instead:
+
+1. Copies the CSR arrays (see csr_graph.py) into `multiprocessing.shared_memory`
+   blocks once. Workers attach to those blocks by name, so the graph is never
+   pickled per task - only small arrays of source ids travel to the workers.
+2. Splits the sources into chunks and runs the vectorized BFS kernel from
+   csr_graph.py in each worker process.
+3. Streams results back with a bounded number of chunks in flight, so memory
+   stays flat no matter how many sources are requested.
+
+Because every source is independent and the graph is shared read-only,
+throughput scales close to linearly with the number of cores.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from multiprocessing import shared_memory
+
+import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+from csr_graph import CSRGraph, bfs_distances, distance_stats
+
+
+# =============================================================================
+# 1. SHARED-MEMORY GRAPH
+# =============================================================================
+
+class SharedCSRGraph:
+    """
+    CSR arrays placed in named shared-memory blocks.
+
+    The creating process owns the blocks and must call close() (or use the
+    object as a context manager) to release them. Worker processes only ever
+    see the lightweight descriptor returned by descriptor().
+    """
+
+    def __init__(self, graph):
+        """
+        Args:
+            graph: CSRGraph to publish
+        """
+        self.graph = graph
+        self._blocks = []
+        self._arrays = {}
+        for name in ("offsets", "targets"):
+            self._arrays[name] = self._publish(getattr(graph, name))
+
+    def _publish(self, array):
+        array = np.ascontiguousarray(array)
+        # SharedMemory refuses zero-sized blocks; keep at least one byte
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._blocks.append(block)
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+        view[...] = array
+        return block.name, array.shape, array.dtype.str
+
+    def descriptor(self):
+        """Picklable description of the shared blocks, passed to workers"""
+        return dict(self._arrays)
+
+    def close(self):
+        """Release and unlink all shared-memory blocks"""
+        for block in self._blocks:
+            block.close()
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# State attached once per worker process by _init_worker
+_worker_blocks = []
+_worker_arrays = {}
+
+
+def _attach(descriptor):
+    """Map the shared blocks described by `descriptor` into this process"""
+    arrays = {}
+    for key, (name, shape, dtype) in descriptor.items():
+        block = shared_memory.SharedMemory(name=name)
+        _worker_blocks.append(block)
+        arrays[key] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    return arrays
+
+
+def _init_worker(descriptor):
+    """Process-pool initializer: attach to the shared graph once per worker"""
+    _worker_arrays.clear()
+    _worker_arrays.update(_attach(descriptor))
+
+
+def _distances_task(sources):
+    """Worker task: full distance arrays for a chunk of source ids"""
+    offsets = _worker_arrays["offsets"]
+    targets = _worker_arrays["targets"]
+    return [(int(s), bfs_distances(offsets, targets, s)) for s in sources]
+
+
+def _stats_task(sources):
+    """Worker task: (source, eccentricity, closeness, reachable) for a chunk"""
+    offsets = _worker_arrays["offsets"]
+    targets = _worker_arrays["targets"]
+    buffer = np.empty(len(offsets) - 1, dtype=np.int32)
+    results = []
+    for s in sources:
+        dist = bfs_distances(offsets, targets, s, out=buffer)
+        results.append((int(s),) + distance_stats(dist))
+    return results
+
+
+# =============================================================================
+# 2. PARALLEL DRIVER
+# =============================================================================
+
+def _resolve_sources(graph, sources):
+    """Map source labels (or None for all vertices) to an id array"""
+    if sources is None:
+        return np.arange(graph.num_vertices, dtype=np.int64)
+    return np.fromiter((graph.index_of(s) for s in sources), dtype=np.int64)
+
+
+def _run(graph, sources, task, workers, chunk_size):
+    """
+    Run `task` over chunks of source ids, yielding each chunk's result list.
+
+    At most 2 * workers chunks are in flight, so results are streamed rather
+    than accumulated. Chunks are yielded in completion order.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_adjacency(graph)
+
+    ids = _resolve_sources(graph, sources)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        # Several chunks per worker keeps the pool balanced on skewed graphs
+        chunk_size = max(1, min(256, len(ids) // (workers * 8) or 1))
+
+    chunks = [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+
+    if workers <= 1:
+        _init_worker_local(graph)
+        for chunk in chunks:
+            yield graph, task(chunk)
+        return
+
+    with SharedCSRGraph(graph) as shared:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_worker,
+                                 initargs=(shared.descriptor(),)) as pool:
+            pending = set()
+            chunk_iter = iter(chunks)
+
+            for chunk in chunk_iter:
+                pending.add(pool.submit(task, chunk))
+                if len(pending) >= 2 * workers:
+                    break
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield graph, future.result()
+                for chunk in chunk_iter:
+                    pending.add(pool.submit(task, chunk))
+                    if len(pending) >= 2 * workers:
+                        break
+
+
+def _init_worker_local(graph):
+    """Serial fallback: point the task functions at the in-process arrays"""
+    _worker_arrays.clear()
+    _worker_arrays["offsets"] = graph.offsets
+    _worker_arrays["targets"] = graph.targets
+
+
+def multi_source_distances(graph, sources=None, workers=None, chunk_size=None):
+    """
+    Stream hop-distance arrays from many sources, computed in parallel.
+    Time Complexity: O(S * (V + E)) total work, divided across workers
+    Space Complexity: O(V + E) shared, plus O(chunk_size * V) per chunk in flight
+
+    Args:
+        graph: CSRGraph or adjacency dictionary
+        sources: Iterable of source vertex labels (None means every vertex)
+        workers: Number of worker processes (default: all cores, 1 = serial)
+        chunk_size: Sources per task (default: chosen from len(sources) and workers)
+
+    Yields:
+        (source_label, distances) pairs in completion order, where distances
+        is an int32 array indexed by vertex id with -1 for unreachable vertices
+    """
+    for csr, results in _run(graph, sources, _distances_task, workers, chunk_size):
+        for s, dist in results:
+            yield csr.label_of(s), dist
+
+
+def hop_distance_stats(graph, sources=None, workers=None, chunk_size=None):
+    """
+    Eccentricity and closeness centrality for many sources, in parallel.
+    Time Complexity: O(S * (V + E)) total work, divided across workers
+    Space Complexity: O(V + E) shared, O(V) per worker
+
+    Only the per-source statistics cross the process boundary, so this is
+    the cheapest way to summarize very large source sets.
+
+    Args:
+        graph: CSRGraph or adjacency dictionary
+        sources: Iterable of source vertex labels (None means every vertex)
+        workers: Number of worker processes (default: all cores, 1 = serial)
+        chunk_size: Sources per task
+
+    Returns:
+        Dictionary mapping source label to a dict with keys
+        'eccentricity', 'closeness' and 'reachable'
+    """
+    stats = {}
+    for csr, results in _run(graph, sources, _stats_task, workers, chunk_size):
+        for s, eccentricity, closeness, reachable in results:
+            stats[csr.label_of(s)] = {
+                'eccentricity': eccentricity,
+                'closeness': closeness,
+                'reachable': reachable,
+            }
+    return stats
+
+
+def all_pairs_hop_distances(graph, workers=None, chunk_size=None):
+    """
+    Dense all-pairs hop-distance matrix.
+    Time Complexity: O(V * (V + E))
+    Space Complexity: O(V^2) - only suitable for graphs with up to ~50k vertices
+
+    Args:
+        graph: CSRGraph or adjacency dictionary
+        workers: Number of worker processes (default: all cores, 1 = serial)
+        chunk_size: Sources per task
+
+    Returns:
+        Tuple (matrix, labels) where matrix[i, j] is the hop distance from
+        labels[i] to labels[j], or -1 if unreachable
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_adjacency(graph)
+
+    n = graph.num_vertices
+    matrix = np.empty((n, n), dtype=np.int32)
+    for _, results in _run(graph, None, _distances_task, workers, chunk_size):
+        for s, dist in results:
+            matrix[s] = dist
+
+    labels = graph.labels if graph.labels is not None else list(range(n))
+    return matrix, labels
+
+
+# Example usage of the parallel driver
+def parallel_bfs_examples():
+    graph = {
+        'A': ['B', 'C'],
+        'B': ['A', 'D', 'E'],
+        'C': ['A', 'F'],
+        'D': ['B'],
+        'E': ['B', 'F'],
+        'F': ['C', 'E']
+    }
+
+    for source, dist in sorted(multi_source_distances(graph, ['A', 'D'], workers=2)):
+        print(f"Distances from '{source}': {dist.tolist()}")
+
+    stats = hop_distance_stats(graph, workers=2)
+    for vertex in sorted(stats):
+        s = stats[vertex]
+        print(f"{vertex}: eccentricity={s['eccentricity']}, closeness={s['closeness']:.3f}")
+
+    matrix, labels = all_pairs_hop_distances(graph, workers=1)
+    print(f"All-pairs hop distances ({labels}):\n{matrix}")
+
+
+def benchmark_parallel_bfs(num_vertices=200_000, avg_degree=8, num_sources=256):
+    """Compare serial and parallel throughput on a random graph"""
+    import time
+
+    rng = np.random.default_rng(0)
+    num_edges = num_vertices * avg_degree
+    src = rng.integers(0, num_vertices, num_edges)
+    dst = rng.integers(0, num_vertices, num_edges).astype(np.int32)
+    order = np.argsort(src, kind="stable")
+    offsets = np.zeros(num_vertices + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=num_vertices), out=offsets[1:])
+    graph = CSRGraph(offsets, dst[order])
+    sources = range(num_sources)
+
+    baseline = None
+    for workers in (1, 2, 4, 8):
+        if workers > (os.cpu_count() or 1):
+            break
+        start = time.perf_counter()
+        hop_distance_stats(graph, sources, workers=workers)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"workers={workers}: {elapsed:.2f}s "
+              f"({num_sources / elapsed:.1f} sources/s, speedup {baseline / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    parallel_bfs_examples()
@@ -0,0 +1,404 @@
+"""
+PRIME NUMBER ENGINE
+===================
+
+Fast primality testing and prime enumeration, replacing per-number trial
+division (app.is_prime, O(sqrt(n)) per call) for bulk workloads.
+
+This module provides:
+1. A segmented Sieve of Eratosthenes over odd numbers that enumerates or
+   counts primes in any range (up to 10**10 and beyond) in bounded memory
+2. A cached, bit-packed prime table for instant lookups of small numbers
+3. Deterministic Miller-Rabin for every 64-bit integer
+4. Vectorized is_prime_many for NumPy arrays
+"""
+
+from math import isqrt
+
+import numpy as np  # If NumPy is not installed, run: pip install numpy
+
+
+# Miller-Rabin with these bases is exact for every n < 3.3 * 10**24,
+# which covers the whole unsigned 64-bit range
+MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# Default number of odd candidates per sieve segment (8 MB of flags)
+SEGMENT_SIZE = 1 << 23
+
+# Values up to this bound are answered from the cached bit-packed table
+TABLE_LIMIT = 1 << 24
+
+# Number of set bits in every byte value
+_POPCOUNT = np.array([bin(b).count("1") for b in range(256)], dtype=np.uint8)
+
+
+# =============================================================================
+# 1. SIEVES
+# =============================================================================
+
+def simple_sieve(n):
+    """
+    Sieve of Eratosthenes over odd numbers only.
+    Time Complexity: O(n log log n)
+    Space Complexity: O(n) bytes / 2
+
+    Args:
+        n: Upper bound (inclusive)
+
+    Returns:
+        int64 array of all primes <= n
+    """
+    if n < 2:
+        return np.empty(0, dtype=np.int64)
+
+    # flags[i] represents the odd number 2i + 1
+    flags = np.ones((n + 1) // 2, dtype=bool)
+    flags[0] = False
+    for i in range(1, (isqrt(n) - 1) // 2 + 1):
+        if flags[i]:
+            p = 2 * i + 1
+            flags[p * p // 2::p] = False
+
+    return np.concatenate(([2], 2 * np.flatnonzero(flags) + 1)).astype(np.int64)
+
+
+def _sieve_segment(lo_odd, length, base_primes):
+    """
+    Flags for the odd numbers lo_odd, lo_odd + 2, ..., lo_odd + 2 * (length - 1).
+
+    base_primes must contain every odd prime up to the square root of the
+    segment's last value.
+    """
+    flags = np.ones(length, dtype=bool)
+    hi = lo_odd + 2 * length
+
+    for p in base_primes:
+        p = int(p)
+        if p * p >= hi:
+            break
+        # First odd multiple of p that is >= max(p * p, lo_odd)
+        m = max(p * p, -(-lo_odd // p) * p)
+        if m % 2 == 0:
+            m += p
+        flags[(m - lo_odd) // 2::p] = False
+
+    if lo_odd == 1:
+        flags[0] = False  # 1 is not prime
+    return flags
+
+
+def iter_prime_segments(lo, hi, segment_size=SEGMENT_SIZE):
+    """
+    Enumerate the primes in [lo, hi) one segment at a time.
+    Time Complexity: O((hi - lo) log log hi + sqrt(hi))
+    Space Complexity: O(segment_size + sqrt(hi))
+
+    Memory stays bounded by the segment size no matter how large the range,
+    so the primes below 10**10 can be streamed on an ordinary machine.
+
+    Args:
+        lo: Lower bound (inclusive)
+        hi: Upper bound (exclusive)
+        segment_size: Number of odd candidates sieved per step
+
+    Yields:
+        Sorted int64 arrays of primes, covering [lo, hi) in order
+    """
+    lo = max(lo, 0)
+    if hi <= lo:
+        return
+
+    if lo <= 2 < hi:
+        yield np.array([2], dtype=np.int64)
+
+    base_primes = small_primes(isqrt(hi) + 1)[1:]  # Odd primes only
+    start = lo | 1
+
+    while start < hi:
+        length = min(segment_size, (hi - start + 1) // 2)
+        flags = _sieve_segment(start, length, base_primes)
+        yield start + 2 * np.flatnonzero(flags).astype(np.int64)
+        start += 2 * length
+
+
+def primes_in_range(lo, hi, segment_size=SEGMENT_SIZE):
+    """
+    All primes in [lo, hi) as a single array.
+    Time Complexity: O((hi - lo) log log hi)
+    Space Complexity: O(number of primes in the range)
+
+    Returns:
+        Sorted int64 array of primes
+    """
+    chunks = list(iter_prime_segments(lo, hi, segment_size))
+    if not chunks:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(chunks)
+
+
+def count_primes(lo, hi, segment_size=SEGMENT_SIZE):
+    """
+    Count the primes in [lo, hi) without materializing them.
+    Time Complexity: O((hi - lo) log log hi)
+    Space Complexity: O(segment_size + sqrt(hi))
+
+    Args:
+        lo: Lower bound (inclusive)
+        hi: Upper bound (exclusive)
+
+    Returns:
+        Number of primes p with lo <= p < hi
+    """
+    lo = max(lo, 0)
+    if hi <= TABLE_LIMIT:
+        return _table().count(lo, hi)
+
+    total = 1 if lo <= 2 < hi else 0
+    base_primes = small_primes(isqrt(hi) + 1)[1:]
+    start = lo | 1
+    while start < hi:
+        length = min(segment_size, (hi - start + 1) // 2)
+        total += int(np.count_nonzero(_sieve_segment(start, length, base_primes)))
+        start += 2 * length
+    return total
+
+
+# =============================================================================
+# 2. CACHED PRIME TABLE
+# =============================================================================
+
+class PrimeBitmap:
+    """
+    Bit-packed primality table for 0..limit.
+
+    Only odd numbers are stored, one bit each, so the table costs limit / 16
+    bytes: 1 MB covers every number below 16 million.
+    """
+
+    def __init__(self, limit):
+        """
+        Args:
+            limit: Largest number covered by the table (inclusive)
+        """
+        self.limit = max(int(limit), 2)
+        length = (self.limit + 1) // 2
+        flags = _sieve_segment(1, length, simple_sieve(isqrt(self.limit) + 1)[1:])
+        self.bits = np.packbits(flags, bitorder="little")
+        # Prefix counts per byte make range counting O(1) per query
+        self._byte_counts = np.concatenate(([0], np.cumsum(_POPCOUNT[self.bits], dtype=np.int64)))
+
+    def __contains__(self, n):
+        return bool(self.lookup(np.asarray([n]))[0])
+
+    def lookup(self, values):
+        """
+        Vectorized primality lookup.
+        Time Complexity: O(len(values))
+
+        Args:
+            values: Integer array with every entry <= limit
+
+        Returns:
+            Boolean array, True where the value is prime
+        """
+        values = np.asarray(values, dtype=np.int64)
+        odd = (values & 1) == 1
+        idx = np.where(odd & (values > 0), values >> 1, 0)
+        bits = (self.bits[idx >> 3] >> (idx & 7).astype(np.uint8)) & 1
+        return (odd & (bits == 1)) | (values == 2)
+
+    def _count_odd_below(self, n):
+        """Number of odd primes < n (n <= limit + 1)"""
+        k = n // 2  # The odd numbers below n have bit indices 0..k-1
+        full, rest = divmod(k, 8)
+        count = int(self._byte_counts[full])
+        if rest:
+            count += int(_POPCOUNT[self.bits[full] & ((1 << rest) - 1)])
+        return count
+
+    def count(self, lo, hi):
+        """Number of primes in [lo, hi), both within the table"""
+        hi = min(hi, self.limit + 1)
+        if hi <= lo:
+            return 0
+        total = self._count_odd_below(hi) - self._count_odd_below(lo)
+        return total + (1 if lo <= 2 < hi else 0)
+
+    def primes(self):
+        """All primes covered by the table"""
+        flags = np.unpackbits(self.bits, bitorder="little")[:(self.limit + 1) // 2]
+        return np.concatenate(([2], 2 * np.flatnonzero(flags) + 1)).astype(np.int64)
+
+
+_prime_table = None
+_small_primes = np.empty(0, dtype=np.int64)
+
+
+def _table():
+    """Shared PrimeBitmap up to TABLE_LIMIT, built on first use"""
+    global _prime_table
+    if _prime_table is None:
+        _prime_table = PrimeBitmap(TABLE_LIMIT)
+    return _prime_table
+
+
+def small_primes(limit):
+    """
+    Cached array of all primes <= limit.
+    Time Complexity: O(1) when already cached, O(limit log log limit) otherwise
+
+    The cache grows by doubling, so repeated calls with slowly increasing
+    limits never re-sieve more than a constant factor of work.
+    """
+    global _small_primes
+    covered = int(_small_primes[-1]) if len(_small_primes) else 1
+    if limit > covered:
+        _small_primes = simple_sieve(max(limit, 2 * covered, 1024))
+    return _small_primes[:np.searchsorted(_small_primes, limit, side="right")]
+
+
+# =============================================================================
+# 3. PRIMALITY TESTS
+# =============================================================================
+
+def miller_rabin(n, bases=MR_BASES):
+    """
+    Miller-Rabin primality test.
+    Time Complexity: O(k log^3 n) for k bases
+    Space Complexity: O(1)
+
+    With the default bases the answer is exact for all n < 3.3 * 10**24,
+    which includes every 64-bit integer.
+
+    Args:
+        n: Integer to test
+        bases: Witnesses to try
+
+    Returns:
+        True if n is (certainly, for n < 3.3e24) prime
+    """
+    if n < 2:
+        return False
+    for p in bases:
+        if n % p == 0:
+            return n == p
+
+    # Write n - 1 as d * 2^s with d odd
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def is_prime(n):
+    """
+    Check if a number is prime - drop-in replacement for app.is_prime.
+    Time Complexity: O(1) for n <= TABLE_LIMIT, O(log^3 n) otherwise
+    Space Complexity: O(1)
+
+    Args:
+        n: Integer to check
+
+    Returns:
+        True if n is prime, False otherwise
+    """
+    n = int(n)
+    if n <= TABLE_LIMIT:
+        return n >= 2 and n in _table()
+    return miller_rabin(n)
+
+
+def is_prime_many(values):
+    """
+    Vectorized primality test for an array of integers.
+    Time Complexity: O(n) for values <= TABLE_LIMIT, O(n + c log^3 m) otherwise,
+                     where c is the number of candidates that survive trial division
+    Space Complexity: O(n)
+
+    Small values are answered from the cached bit table in one gather.
+    Large values are first filtered by vectorized trial division by the
+    primes below 1000 (which removes ~92% of composites), and only the
+    survivors go through Miller-Rabin.
+
+    Args:
+        values: Array-like of integers (int64 or uint64)
+
+    Returns:
+        Boolean array of the same shape
+    """
+    values = np.asarray(values)
+    if values.dtype.kind not in "iu":
+        values = values.astype(np.int64)
+    flat = values.ravel()
+    result = np.zeros(flat.shape, dtype=bool)
+
+    small = flat <= TABLE_LIMIT
+    if values.dtype.kind == "i":
+        small &= flat >= 0
+    if small.any():
+        result[small] = _table().lookup(flat[small].astype(np.int64))
+
+    large_idx = np.flatnonzero(flat > TABLE_LIMIT)
+    if len(large_idx):
+        large = flat[large_idx]
+        candidate = np.ones(len(large), dtype=bool)
+        for p in small_primes(1000):
+            candidate &= (large % large.dtype.type(p)) != 0
+        for i in np.flatnonzero(candidate):
+            result[large_idx[i]] = miller_rabin(int(large[i]))
+
+    return result.reshape(values.shape)
+
+
+# Example usage of the prime engine
+def primes_examples():
+    print(f"Primes below 50: {primes_in_range(0, 50).tolist()}")
+    print(f"Number of primes below 10**7: {count_primes(0, 10**7)}")
+    print(f"Primes in [10**12, 10**12 + 100): {primes_in_range(10**12, 10**12 + 100).tolist()}")
+
+    for n in (97, 2**61 - 1, 2**64 - 59, 3215031751):
+        print(f"Is {n} prime? {is_prime(n)}")
+
+    values = np.array([1, 2, 15, 17, 7919, 10**9 + 7, 10**12 + 39], dtype=np.int64)
+    print(f"is_prime_many({values.tolist()}): {is_prime_many(values).tolist()}")
+
+
+def benchmark_primes(n=1_000_000):
+    """Compare app.is_prime called in a loop with the vectorized engine"""
+    import time
+    import app
+
+    rng = np.random.default_rng(0)
+    for label, high in (("small", 10**7), ("large", 10**15)):
+        values = rng.integers(2, high, n)
+
+        start = time.perf_counter()
+        expected = [app.is_prime(int(v)) for v in values[:n // 100]]
+        per_call = (time.perf_counter() - start) / (n // 100)
+
+        start = time.perf_counter()
+        got = is_prime_many(values)
+        elapsed = time.perf_counter() - start
+
+        assert got[:n // 100].tolist() == expected
+        print(f"{label} values: app.is_prime ~{per_call * n:.2f}s for {n:,}, "
+              f"is_prime_many {elapsed:.3f}s ({per_call * n / elapsed:.0f}x)")
+
+    start = time.perf_counter()
+    total = count_primes(0, 10**9)
+    print(f"pi(10**9) = {total:,} in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    primes_examples()